@@ -0,0 +1,64 @@
+"""Add partial indexes for the saved / hidden / applied filter paths.
+
+Revision ID: 20261016_0001
+Revises: 20260424_0001
+Create Date: 2026-10-16
+
+``GET /job-listings/saved`` and ``/applied`` (and the ``is_saved`` /
+``is_hidden`` / ``applied`` list filters) join ``user_job_interactions`` on
+``(user_id, job_listing_id)`` and keep only flagged rows. The existing
+``(user_id, is_saved)`` / ``(user_id, is_hidden)`` btrees index every
+interaction row, including the far more common unflagged views. Partial
+indexes restricted to the flagged minority stay small and let the planner
+index-scan straight to the rows these filters return:
+
+- ``idx_uji_saved``: ``(user_id, job_listing_id) WHERE is_saved = TRUE``
+- ``idx_uji_hidden``: ``(user_id, job_listing_id) WHERE is_hidden = TRUE``
+- ``idx_uji_applied``: ``(user_id, applied_at DESC) WHERE applied_at IS NOT NULL``
+  (also serves ``get_applied_jobs``' ``ORDER BY applied_at DESC``)
+
+``CREATE INDEX CONCURRENTLY`` cannot run inside a transaction block, so
+we commit the open alembic transaction before issuing the statements.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "20261016_0001"
+down_revision: str | None = "20260424_0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY must run outside of a transaction.
+    op.execute("COMMIT")
+    op.execute(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_uji_saved
+        ON user_job_interactions (user_id, job_listing_id)
+        WHERE is_saved = TRUE
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_uji_hidden
+        ON user_job_interactions (user_id, job_listing_id)
+        WHERE is_hidden = TRUE
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_uji_applied
+        ON user_job_interactions (user_id, applied_at DESC)
+        WHERE applied_at IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("COMMIT")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_uji_applied")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_uji_hidden")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_uji_saved")
@@ -0,0 +1,61 @@
+"""Add generated tsvector column + GIN index for job listing search.
+
+Revision ID: 20261016_0002
+Revises: 20261016_0001
+Create Date: 2026-10-16
+
+``GET /job-listings/search`` and the ``search`` list filter previously
+OR-ed three ``ILIKE '%q%'`` predicates across job_title, company_name and
+job_description. Even with trigram indexes, the description predicate has
+to recheck large TOAST values for every candidate row.
+
+This adds a stored generated ``search_vector`` column over the same three
+fields and a GIN index on it. The repository now filters with
+``search_vector @@ plainto_tsquery('english', :q)``, which is answered
+straight from the index.
+
+The ADD COLUMN rewrites the table once to populate the generated values.
+``CREATE INDEX CONCURRENTLY`` cannot run inside a transaction block, so
+we commit the open alembic transaction before building the index.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "20261016_0002"
+down_revision: str | None = "20261016_0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE job_listings
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'english',
+                coalesce(job_title, '') || ' ' ||
+                coalesce(company_name, '') || ' ' ||
+                coalesce(job_description, '')
+            )
+        ) STORED
+        """
+    )
+
+    # CREATE INDEX CONCURRENTLY must run outside of a transaction.
+    op.execute("COMMIT")
+    op.execute(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_job_listings_search_vector
+        ON job_listings USING gin(search_vector)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("COMMIT")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_job_listings_search_vector")
+    op.execute("ALTER TABLE job_listings DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,41 @@
+"""Add (user_id, updated_at DESC, created_at DESC, public_id DESC) index for resume build paging.
+
+Revision ID: 20261016_0003
+Revises: 20261016_0002
+Create Date: 2026-10-16
+
+``GET /resume-builds`` lists builds ordered ``updated_at DESC NULLS FIRST,
+created_at DESC, public_id DESC`` and can page with a keyset cursor on that
+position. This composite index (Postgres' ``DESC`` puts NULLs first, matching
+the query) lets each page be an index scan that stops after ``limit + 1``
+rows, instead of sorting every build the user owns and discarding the
+skipped rows.
+
+``CREATE INDEX CONCURRENTLY`` cannot run inside a transaction block, so
+we commit the open alembic transaction before issuing the statement.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "20261016_0003"
+down_revision: str | None = "20261016_0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY must run outside of a transaction.
+    op.execute("COMMIT")
+    op.execute(
+        """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_resume_builds_user_updated
+        ON resume_builds (user_id, updated_at DESC, created_at DESC, public_id DESC)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("COMMIT")
+    op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_resume_builds_user_updated")
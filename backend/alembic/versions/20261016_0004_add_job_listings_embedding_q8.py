@@ -0,0 +1,42 @@
+"""Add int8-quantized description embedding columns to job_listings.
+
+Revision ID: 20261016_0004
+Revises: 20261016_0003
+Create Date: 2026-10-16
+
+The fit scorer loads every active job's ``description_embedding`` for each
+user it scores. As JSONB text a 768-dim float vector is ~15 KB on the wire
+and must be JSON-decoded into Python floats every time.
+
+``description_embedding_q8`` stores the same vector quantized to int8 with
+a per-vector scale (``scale = max(|v|) / 127``): 768 bytes per job. Cosine
+similarity is scale-invariant, so the scorer reads the int8 bytes directly
+and only falls back to the JSONB vector for rows written before this
+revision.
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "20261016_0004"
+down_revision: str | None = "20261016_0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_listings",
+        sa.Column("description_embedding_q8", sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        "job_listings",
+        sa.Column("description_embedding_scale", sa.Float(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_listings", "description_embedding_scale")
+    op.drop_column("job_listings", "description_embedding_q8")
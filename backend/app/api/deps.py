@@ -6,9 +6,11 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.ai_models import get_default_model, is_valid_model
 from app.core.security import decode_token
 from app.db import get_db
 from app.db.mongodb import get_mongodb
+from app.db.redis import get_redis
 from app.db.session import AsyncSessionLocal
 from app.models import User
 
@@ -107,8 +109,6 @@ async def get_current_user_id_sse(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    from app.db.redis import get_redis
-
     redis = get_redis()
     user_id_str = await redis.getdel(f"sse-ticket:{ticket}")
 
@@ -225,8 +225,6 @@ async def resolve_ai_model(
 
     Priority: user preference > endpoint category default.
     """
-    from app.core.ai_models import get_default_model, is_valid_model
-
     result = await db.execute(
         select(User.preferred_ai_model).where(User.id == user_id)
     )
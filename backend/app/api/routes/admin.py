@@ -27,6 +27,7 @@ from app.crud.scraper_request import scraper_request_repository
 from app.crud.scraper_run import scraper_run_repository
 from app.models.job_listing import JobListing
 from app.models.scraper_request import RequestStatus
+from app.models.scraper_run import ScraperRun
 from app.models.user import User
 from app.schemas.scraper import (
     AdHocScrapeRequest,
@@ -314,11 +315,7 @@ async def get_scraper_history(
     runs = await scraper_run_repository.list_recent(db, limit=limit, offset=offset)
 
     # Get total count for pagination
-    from sqlalchemy import func as sql_func
-
-    from app.models.scraper_run import ScraperRun
-
-    total_result = await db.execute(select(sql_func.count(ScraperRun.id)))
+    total_result = await db.execute(select(func.count(ScraperRun.id)))
     total = total_result.scalar() or 0
 
     history_items = [
@@ -40,6 +40,7 @@ from app.schemas.ats import (
     # New schemas for keyword review
     KeywordWithContext,
 )
+from app.services.ai import get_usage_tracker
 from app.services.ai.client import get_ai_client_for_model
 from app.services.job.ats import create_ats_analyzer, get_ats_analyzer
 from app.services.job.ats.analyzers.keyword.extractor import KeywordExtractor
@@ -85,8 +86,6 @@ async def analyze_keywords(
 
     # Log AI usage
     if ai_metrics:
-        from app.services.ai import get_usage_tracker
-
         usage_tracker = get_usage_tracker()
         await usage_tracker.log_generation(
             db=db,
@@ -143,8 +142,6 @@ async def analyze_keywords_detailed(
 
     # Log AI usage
     if ai_metrics:
-        from app.services.ai import get_usage_tracker
-
         usage_tracker = get_usage_tracker()
         await usage_tracker.log_generation(
             db=db,
@@ -252,8 +249,6 @@ async def analyze_keywords_enhanced(
 
     # Log AI usage
     if ai_metrics:
-        from app.services.ai import get_usage_tracker
-
         usage_tracker = get_usage_tracker()
         await usage_tracker.log_generation(
             db=db,
@@ -382,8 +377,6 @@ async def extract_keywords_with_context(
 
     # Log AI usage
     if ai_metrics:
-        from app.services.ai import get_usage_tracker
-
         usage_tracker = get_usage_tracker()
         await usage_tracker.log_generation(
             db=db,
@@ -4,13 +4,13 @@ ATS Progressive Analysis with Server-Sent Events (SSE)
 Orchestrates all ATS stages with real-time progress streaming.
 """
 
-import json
 import logging
 import time
 from dataclasses import asdict, is_dataclass
 
 from fastapi import APIRouter, Depends, Query
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 from sse_starlette.sse import EventSourceResponse
 
@@ -36,6 +36,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _sse_data(payload: dict) -> str:
+    """Encode an SSE event payload as JSON with pydantic-core's serializer."""
+    return to_json(payload).decode()
+
+
 @router.get("/analyze-progressive")
 async def analyze_progressive_ats(
     resume_id: str | None = Query(None, description="Resume MongoDB ObjectId"),
@@ -93,6 +98,7 @@ async def analyze_progressive_ats(
         nonlocal resume_id, job_id, job_listing_id
         start_time = time.time()
         stage_results = {}
+        serialized_stage_results = {}
         failed_stages = []
         resume_content_hash: str | None = None
         effective_job_id: int | None = None
@@ -115,9 +121,11 @@ async def analyze_progressive_ats(
             if not resume_id or not (job_id or job_listing_id):
                 yield {
                     "event": "error",
-                    "data": json.dumps({
-                        "error": "Must provide resume_id and either job_id or job_listing_id"
-                    })
+                    "data": _sse_data(
+                        {
+                            "error": "Must provide resume_id and either job_id or job_listing_id"
+                        }
+                    ),
                 }
                 return
 
@@ -127,7 +135,7 @@ async def analyze_progressive_ats(
             if not mongo_resume or mongo_resume.user_id != user_id:
                 yield {
                     "event": "error",
-                    "data": json.dumps({"error": "Resume not found or not authorized"})
+                    "data": _sse_data({"error": "Resume not found or not authorized"}),
                 }
                 return
 
@@ -143,7 +151,7 @@ async def analyze_progressive_ats(
                 if not job_listing:
                     yield {
                         "event": "error",
-                        "data": json.dumps({"error": "Job listing not found"})
+                        "data": _sse_data({"error": "Job listing not found"}),
                     }
                     return
                 job_description = str(job_listing.job_description or "")
@@ -163,7 +171,7 @@ async def analyze_progressive_ats(
                 if not job or job.owner_id != user_id:
                     yield {
                         "event": "error",
-                        "data": json.dumps({"error": "Job not found or not authorized"})
+                        "data": _sse_data({"error": "Job not found or not authorized"}),
                     }
                     return
                 job_description = str(job.raw_content or "")
@@ -206,10 +214,12 @@ async def analyze_progressive_ats(
                 cached_at = cached_result.get("cached_at", "")
                 yield {
                     "event": "cache_hit",
-                    "data": json.dumps({
-                        "cached_at": cached_at,
-                        "resume_content_hash": resume_content_hash,
-                    })
+                    "data": _sse_data(
+                        {
+                            "cached_at": cached_at,
+                            "resume_content_hash": resume_content_hash,
+                        }
+                    ),
                 }
 
                 cached_stages = cached_result.get("stage_results", {})
@@ -219,15 +229,17 @@ async def analyze_progressive_ats(
                     if stage_key in cached_stages:
                         yield {
                             "event": "stage_complete",
-                            "data": json.dumps({
-                                "stage": stage_num,
-                                "stage_name": stage_name,
-                                "status": "completed",
-                                "progress_percent": progress_percent,
-                                "elapsed_ms": 0,
-                                "result": cached_stages[stage_key],
-                                "from_cache": True,
-                            })
+                            "data": _sse_data(
+                                {
+                                    "stage": stage_num,
+                                    "stage_name": stage_name,
+                                    "status": "completed",
+                                    "progress_percent": progress_percent,
+                                    "elapsed_ms": 0,
+                                    "result": cached_stages[stage_key],
+                                    "from_cache": True,
+                                }
+                            ),
                         }
                     else:
                         failed_stages.append(stage_name)
@@ -240,27 +252,31 @@ async def analyze_progressive_ats(
                 composite_score = cached_result.get("composite_score", {})
                 yield {
                     "event": "complete",
-                    "data": json.dumps({
-                        "stage": 5,
-                        "stage_name": "Complete",
-                        "status": "completed",
-                        "progress_percent": 100,
-                        "elapsed_ms": int((time.time() - start_time) * 1000),
-                        "composite_score": composite_score,
-                        "knockout_risks": cached_knockout_risks,
-                        "from_cache": True,
-                        "cached_at": cached_at,
-                        "ai_metrics": None,  # No AI calls on cache hit
-                    })
+                    "data": _sse_data(
+                        {
+                            "stage": 5,
+                            "stage_name": "Complete",
+                            "status": "completed",
+                            "progress_percent": 100,
+                            "elapsed_ms": int((time.time() - start_time) * 1000),
+                            "composite_score": composite_score,
+                            "knockout_risks": cached_knockout_risks,
+                            "from_cache": True,
+                            "cached_at": cached_at,
+                            "ai_metrics": None,  # No AI calls on cache hit
+                        }
+                    ),
                 }
                 return
 
             yield {
                 "event": "cache_miss",
-                "data": json.dumps({
-                    "resume_content_hash": resume_content_hash,
-                    "job_id": effective_job_id,
-                })
+                "data": _sse_data(
+                    {
+                        "resume_content_hash": resume_content_hash,
+                        "job_id": effective_job_id,
+                    }
+                ),
             }
 
             for idx, (stage_num, stage_key, stage_name) in enumerate(stages):
@@ -269,12 +285,14 @@ async def analyze_progressive_ats(
 
                 yield {
                     "event": "stage_start",
-                    "data": json.dumps({
-                        "stage": stage_num,
-                        "stage_name": stage_name,
-                        "status": "running",
-                        "progress_percent": progress_percent,
-                    })
+                    "data": _sse_data(
+                        {
+                            "stage": stage_num,
+                            "stage_name": stage_name,
+                            "status": "running",
+                            "progress_percent": progress_percent,
+                        }
+                    ),
                 }
 
                 try:
@@ -304,17 +322,21 @@ async def analyze_progressive_ats(
                         serialized_result = asdict(result)
                     else:
                         serialized_result = result
+                    # Reused for the cache write below instead of dumping again
+                    serialized_stage_results[stage_key] = serialized_result
 
                     yield {
                         "event": "stage_complete",
-                        "data": json.dumps({
-                            "stage": stage_num,
-                            "stage_name": stage_name,
-                            "status": "completed",
-                            "progress_percent": progress_percent,
-                            "elapsed_ms": stage_elapsed,
-                            "result": serialized_result,
-                        })
+                        "data": _sse_data(
+                            {
+                                "stage": stage_num,
+                                "stage_name": stage_name,
+                                "status": "completed",
+                                "progress_percent": progress_percent,
+                                "elapsed_ms": stage_elapsed,
+                                "result": serialized_result,
+                            }
+                        ),
                     }
 
                 except Exception as e:
@@ -323,47 +345,44 @@ async def analyze_progressive_ats(
 
                     yield {
                         "event": "stage_error",
-                        "data": json.dumps({
-                            "stage": stage_num,
-                            "stage_name": stage_name,
-                            "status": "failed",
-                            "progress_percent": progress_percent,
-                            "elapsed_ms": stage_elapsed,
-                            "error": str(e),
-                        })
+                        "data": _sse_data(
+                            {
+                                "stage": stage_num,
+                                "stage_name": stage_name,
+                                "status": "failed",
+                                "progress_percent": progress_percent,
+                                "elapsed_ms": stage_elapsed,
+                                "error": str(e),
+                            }
+                        ),
                     }
 
             yield {
                 "event": "score_calculation",
-                "data": json.dumps({
-                    "stage": 5,
-                    "stage_name": "Calculating Final Score",
-                    "status": "running",
-                    "progress_percent": 95,
-                })
+                "data": _sse_data(
+                    {
+                        "stage": 5,
+                        "stage_name": "Calculating Final Score",
+                        "status": "running",
+                        "progress_percent": 95,
+                    }
+                ),
             }
 
             composite_score = calculate_composite_score(stage_results, failed_stages)
             total_elapsed = int((time.time() - start_time) * 1000)
 
-            if resume_content_hash and effective_job_id and stage_results and not failed_stages:
-                cacheable_stage_results = {}
-                for key, result in stage_results.items():
-                    if hasattr(result, 'model_dump'):
-                        cacheable_stage_results[key] = result.model_dump()
-                    elif is_dataclass(result):
-                        cacheable_stage_results[key] = asdict(result)
-                    else:
-                        cacheable_stage_results[key] = result
+            composite_score_data = composite_score.model_dump()
 
+            if resume_content_hash and effective_job_id and stage_results and not failed_stages:
                 # A cache-write failure must not abort the stream — the client
                 # already has its results; we just forfeit the next cache hit.
                 try:
                     await cache.set_ats_result(
                         resume_content_hash=resume_content_hash,
                         job_id=effective_job_id,
-                        composite_score=composite_score.model_dump(),
-                        stage_results=cacheable_stage_results,
+                        composite_score=composite_score_data,
+                        stage_results=serialized_stage_results,
                     )
                 except Exception as cache_exc:
                     logger.warning(
@@ -374,12 +393,8 @@ async def analyze_progressive_ats(
                     )
 
             knockout_risks = []
-            knockout_result = stage_results.get("knockout-check")
-            if knockout_result:
-                if hasattr(knockout_result, 'model_dump'):
-                    knockout_data = knockout_result.model_dump()
-                else:
-                    knockout_data = knockout_result
+            knockout_data = serialized_stage_results.get("knockout-check")
+            if knockout_data:
                 knockout_risks = knockout_data.get("risks", [])
 
             # Build ai_metrics for the response
@@ -409,25 +424,27 @@ async def analyze_progressive_ats(
 
             yield {
                 "event": "complete",
-                "data": json.dumps({
-                    "stage": 5,
-                    "stage_name": "Complete",
-                    "status": "completed",
-                    "progress_percent": 100,
-                    "elapsed_ms": total_elapsed,
-                    "composite_score": composite_score.model_dump(),
-                    "knockout_risks": knockout_risks,
-                    "from_cache": False,
-                    "ai_metrics": ai_metrics_data,
-                })
+                "data": _sse_data(
+                    {
+                        "stage": 5,
+                        "stage_name": "Complete",
+                        "status": "completed",
+                        "progress_percent": 100,
+                        "elapsed_ms": total_elapsed,
+                        "composite_score": composite_score_data,
+                        "knockout_risks": knockout_risks,
+                        "from_cache": False,
+                        "ai_metrics": ai_metrics_data,
+                    }
+                ),
             }
 
         except Exception as e:
             yield {
                 "event": "error",
-                "data": json.dumps({
-                    "error": f"Fatal error during ATS analysis: {str(e)}"
-                })
+                "data": _sse_data(
+                    {"error": f"Fatal error during ATS analysis: {str(e)}"}
+                ),
             }
 
     return EventSourceResponse(event_generator())
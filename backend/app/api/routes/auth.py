@@ -14,6 +14,7 @@ from app.core.security import (
     get_password_hash_async,
     verify_password_async,
 )
+from app.db.redis import get_redis
 from app.models import User
 from app.schemas import (
     GoogleAuthRequest,
@@ -293,8 +294,6 @@ async def create_sse_ticket(
     user_id: int = Depends(get_current_user_id),
 ) -> SSETicketResponse:
     """Create a short-lived, one-time-use ticket for SSE authentication."""
-    from app.db.redis import get_redis
-
     ticket_id = uuid.uuid4()
     redis = get_redis()
     await redis.setex(
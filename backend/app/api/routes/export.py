@@ -50,21 +50,17 @@ async def export_tailored_resume(
             detail="Tailored resume not found",
         )
 
-    # Get the tailored resume
-    tailored = await tailored_resume_crud.get(mongo, id=tailored_id)
+    # Get the tailored resume (user_id is stored directly on the document,
+    # so ownership is part of the query)
+    tailored = await tailored_resume_crud.get(
+        mongo, id=tailored_id, user_id=current_user_id
+    )
     if not tailored:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tailored resume not found",
         )
 
-    # Verify ownership (user_id is stored directly on TailoredResumeDocument)
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this tailored resume",
-        )
-
     # Use finalized_data if available, otherwise fall back to tailored_data
     # MongoDB stores these as dicts directly (no JSON parsing needed)
     tailored_content = tailored.finalized_data or tailored.tailored_data
@@ -85,7 +81,7 @@ async def export_tailored_resume(
     )
 
     if format == ExportFormat.PDF:
-        result = export_service.generate_pdf(tailored_content, options=options)
+        result = await export_service.export_pdf(tailored_content, options=options)
         return Response(
             content=result.content,
             media_type="application/pdf",
@@ -96,7 +92,7 @@ async def export_tailored_resume(
             },
         )
     elif format == ExportFormat.DOCX:
-        content = export_service.generate_docx(tailored_content, options=options)
+        content = await export_service.export_docx(tailored_content, options=options)
         return Response(
             content=content,
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
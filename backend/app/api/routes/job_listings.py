@@ -7,6 +7,7 @@ with job listings populated from external sources (Apify/n8n).
 
 import hashlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
@@ -56,12 +57,14 @@ from app.schemas.job_listing_analysis import (
 )
 from app.services.ai import get_usage_tracker
 from app.services.ai.client import get_ai_client_for_model
+from app.services.ai.response import AccumulatedMetrics
 from app.services.core.cache import get_cache_service
 from app.services.job_listings import (
     DeepAnalysisCriticalError,
     DeepAnalysisService,
 )
 from app.services.scraping.schedule_utils import get_cache_ttl_seconds
+from app.utils.validators import validate_optional_url
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +74,15 @@ DEEP_ANALYSIS_QUOTA_LIMIT = 5
 DEEP_ANALYSIS_QUOTA_WINDOW = timedelta(days=1)
 DEEP_ANALYSIS_ENDPOINT = "/job-listings/analyze"
 
+# Negative cache for listing lookups: listing ID -> monotonic expiry. Kept
+# in-process so a successful lookup costs no extra round trip. Listings are
+# upserted by the scraper in other processes, so nothing evicts an entry
+# when its ID is created; the short TTL bounds how long an ID polled just
+# before its listing lands can keep returning 404.
+_MISSING_LISTING_TTL_SECONDS = 5
+_MISSING_LISTING_MAX_SIZE = 10_000
+_missing_listings: dict[int, float] = {}
+
 router = APIRouter()
 
 
@@ -179,7 +191,8 @@ async def _fetch_public_listings(
     listings, total = await job_listing_repository.list(
         db, filters=filters, user_id=None, known_total=cached_total
     )
-    items = [_build_list_item_response(listing) for listing in listings]
+    build = _build_list_item_response
+    items = [build(listing) for listing in listings]
     payload = (items, total)
 
     ttl = get_cache_ttl_seconds()
@@ -315,6 +328,17 @@ def _merge_interaction_into_item(
     )
 
 
+# OptionalHttpUrl fields: model_construct skips their validator, so they are
+# normalized by hand (empty string -> None, canonical URL form).
+_LISTING_URL_FIELDS = (
+    "company_logo",
+    "company_website",
+    "company_linkedin_url",
+    "job_url_direct",
+    "apply_url",
+)
+
+
 def _build_listing_response(
     listing,
     interaction=None,
@@ -391,7 +415,109 @@ def _build_listing_response(
             )
         response_data["fit_score_is_capped"] = bool(interaction.fit_score_is_capped)
 
-    return JobListingResponse(**response_data)
+    for field in _LISTING_URL_FIELDS:
+        response_data[field] = validate_optional_url(response_data[field])
+
+    # Every value above is read straight off ORM rows (or validated just
+    # above), so skip Pydantic's field-by-field re-validation.
+    return JobListingResponse.model_construct(**response_data)
+
+
+def _build_interaction_response(interaction) -> UserJobInteractionResponse:
+    """Build a UserJobInteractionResponse from a freshly flushed ORM row.
+
+    Uses ``model_construct`` — the row was just refreshed from the database,
+    so ``model_validate``'s per-field coercion is pure overhead on every
+    save/hide/applied/status mutation.
+    """
+    return UserJobInteractionResponse.model_construct(
+        id=interaction.id,
+        user_id=interaction.user_id,
+        job_listing_id=interaction.job_listing_id,
+        is_saved=interaction.is_saved,
+        is_hidden=interaction.is_hidden,
+        applied_at=interaction.applied_at,
+        last_viewed_at=interaction.last_viewed_at,
+        application_status=interaction.application_status,
+        status_changed_at=interaction.status_changed_at,
+        column_position=interaction.column_position or 0,
+        created_at=interaction.created_at,
+        updated_at=interaction.updated_at,
+    )
+
+
+async def _list_with_interactions(
+    db: AsyncSession,
+    filters: JobListingFilters,
+    user_id: int,
+) -> JobListingListItemResponse:
+    """Run a per-user list query and merge in interaction state.
+
+    Shared by every list endpoint that bypasses the public cache (user
+    interaction filters, ``/search``, ``/saved``, ``/applied``) so they run
+    one code path and differ only in the filters they pass.
+    """
+    listings, total = await job_listing_repository.list(
+        db, filters=filters, user_id=user_id
+    )
+
+    # Batch fetch all interactions in a single query (fixes N+1)
+    listing_ids = [listing.id for listing in listings]
+    interactions_map = await user_job_interaction_repository.get_batch(
+        db, user_id=user_id, job_listing_ids=listing_ids
+    )
+    current_resume_hash = await _get_current_master_resume_hash(user_id)
+
+    # Bind the builder and dict lookup locally so the comprehension does
+    # fast local loads instead of a global + attribute lookup per row.
+    build = _build_list_item_response
+    get_interaction = interactions_map.get
+    response_listings = [
+        build(
+            listing,
+            get_interaction(listing.id),
+            current_resume_hash=current_resume_hash,
+        )
+        for listing in listings
+    ]
+
+    return JobListingListItemResponse(
+        listings=response_listings,
+        total=total,
+        limit=filters.limit,
+        offset=filters.offset,
+    )
+
+
+async def _get_listing_or_404(db: AsyncSession, listing_id: int):
+    """Fetch a job listing or raise 404, consulting a short negative cache.
+
+    Clients that poll a deleted or bogus listing ID would otherwise hit
+    Postgres on every request just to 404 again. Misses are remembered
+    in-process for ``_MISSING_LISTING_TTL_SECONDS``; expired entries are
+    dropped and the database is asked again.
+    """
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Job listing not found",
+    )
+    now = time.monotonic()
+
+    expires_at = _missing_listings.get(listing_id)
+    if expires_at is not None:
+        if expires_at > now:
+            raise not_found
+        del _missing_listings[listing_id]
+
+    listing = await job_listing_repository.get(db, id=listing_id)
+    if listing:
+        return listing
+
+    if len(_missing_listings) >= _MISSING_LISTING_MAX_SIZE:
+        # Dicts keep insertion order, so this drops the oldest entry
+        del _missing_listings[next(iter(_missing_listings))]
+    _missing_listings[listing_id] = now + _MISSING_LISTING_TTL_SECONDS
+    raise not_found
 
 
 def _build_kanban_item(listing, interaction) -> KanbanJobItem:
@@ -637,40 +763,27 @@ async def list_job_listings(
         or hide_capped
     )
 
-    current_resume_hash = await _get_current_master_resume_hash(current_user_id)
-
     if has_user_filter:
         # User-interaction filters change the WHERE clause via a UserJobInteraction
         # join — bypass the public cache and fall through to the per-user query.
-        listings, total = await job_listing_repository.list(
-            db, filters=filters, user_id=current_user_id
-        )
-        listing_ids = [listing.id for listing in listings]
-        interactions_map = await user_job_interaction_repository.get_batch(
-            db, user_id=current_user_id, job_listing_ids=listing_ids
-        )
-        response_listings = [
-            _build_list_item_response(
-                listing,
-                interactions_map.get(listing.id),
-                current_resume_hash=current_resume_hash,
-            )
-            for listing in listings
-        ]
-    else:
-        public_items, total = await _fetch_public_listings(db, filters)
-        listing_ids = [item.id for item in public_items]
-        interactions_map = await user_job_interaction_repository.get_batch(
-            db, user_id=current_user_id, job_listing_ids=listing_ids
+        return await _list_with_interactions(db, filters, current_user_id)
+
+    public_items, total = await _fetch_public_listings(db, filters)
+    listing_ids = [item.id for item in public_items]
+    interactions_map = await user_job_interaction_repository.get_batch(
+        db, user_id=current_user_id, job_listing_ids=listing_ids
+    )
+    current_resume_hash = await _get_current_master_resume_hash(current_user_id)
+    merge = _merge_interaction_into_item
+    get_interaction = interactions_map.get
+    response_listings = [
+        merge(
+            item,
+            get_interaction(item.id),
+            current_resume_hash=current_resume_hash,
         )
-        response_listings = [
-            _merge_interaction_into_item(
-                item,
-                interactions_map.get(item.id),
-                current_resume_hash=current_resume_hash,
-            )
-            for item in public_items
-        ]
+        for item in public_items
+    ]
 
     return JobListingListItemResponse(
         listings=response_listings,
@@ -707,32 +820,7 @@ async def search_job_listings(
         salary_max=None,
     )
 
-    listings, total = await job_listing_repository.list(
-        db, filters=filters, user_id=current_user_id
-    )
-
-    # Batch fetch all interactions in a single query (fixes N+1)
-    listing_ids = [listing.id for listing in listings]
-    interactions_map = await user_job_interaction_repository.get_batch(
-        db, user_id=current_user_id, job_listing_ids=listing_ids
-    )
-    current_resume_hash = await _get_current_master_resume_hash(current_user_id)
-
-    response_listings = [
-        _build_list_item_response(
-            listing,
-            interactions_map.get(listing.id),
-            current_resume_hash=current_resume_hash,
-        )
-        for listing in listings
-    ]
-
-    return JobListingListItemResponse(
-        listings=response_listings,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+    return await _list_with_interactions(db, filters, current_user_id)
 
 
 @router.get("/saved", response_model=JobListingListItemResponse)
@@ -755,32 +843,7 @@ async def list_saved_jobs(
         salary_max=None,
     )
 
-    listings, total = await job_listing_repository.list(
-        db, filters=filters, user_id=current_user_id
-    )
-
-    # Batch fetch all interactions in a single query (fixes N+1)
-    listing_ids = [listing.id for listing in listings]
-    interactions_map = await user_job_interaction_repository.get_batch(
-        db, user_id=current_user_id, job_listing_ids=listing_ids
-    )
-    current_resume_hash = await _get_current_master_resume_hash(current_user_id)
-
-    response_listings = [
-        _build_list_item_response(
-            listing,
-            interactions_map.get(listing.id),
-            current_resume_hash=current_resume_hash,
-        )
-        for listing in listings
-    ]
-
-    return JobListingListItemResponse(
-        listings=response_listings,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+    return await _list_with_interactions(db, filters, current_user_id)
 
 
 @router.get("/applied", response_model=JobListingListItemResponse)
@@ -803,32 +866,7 @@ async def list_applied_jobs(
         salary_max=None,
     )
 
-    listings, total = await job_listing_repository.list(
-        db, filters=filters, user_id=current_user_id
-    )
-
-    # Batch fetch all interactions in a single query (fixes N+1)
-    listing_ids = [listing.id for listing in listings]
-    interactions_map = await user_job_interaction_repository.get_batch(
-        db, user_id=current_user_id, job_listing_ids=listing_ids
-    )
-    current_resume_hash = await _get_current_master_resume_hash(current_user_id)
-
-    response_listings = [
-        _build_list_item_response(
-            listing,
-            interactions_map.get(listing.id),
-            current_resume_hash=current_resume_hash,
-        )
-        for listing in listings
-    ]
-
-    return JobListingListItemResponse(
-        listings=response_listings,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+    return await _list_with_interactions(db, filters, current_user_id)
 
 
 # ============================================================================
@@ -907,12 +945,7 @@ async def get_job_listing(
         "private, max-age=60, stale-while-revalidate=30"
     )
 
-    listing = await job_listing_repository.get(db, id=listing_id)
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job listing not found",
-        )
+    listing = await _get_listing_or_404(db, listing_id)
 
     # Record view
     interaction = await user_job_interaction_repository.record_view(
@@ -934,12 +967,7 @@ async def save_job_listing(
 ) -> JobInteractionActionResponse:
     """Save or unsave a job listing."""
     # Verify listing exists
-    listing = await job_listing_repository.get(db, id=listing_id)
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job listing not found",
-        )
+    await _get_listing_or_404(db, listing_id)
 
     interaction = await user_job_interaction_repository.set_saved(
         db, user_id=current_user_id, job_listing_id=listing_id, is_saved=request.save
@@ -949,7 +977,7 @@ async def save_job_listing(
     return JobInteractionActionResponse(
         success=True,
         message=f"Job listing {action} successfully",
-        interaction=UserJobInteractionResponse.model_validate(interaction),
+        interaction=_build_interaction_response(interaction),
     )
 
 
@@ -962,12 +990,7 @@ async def hide_job_listing(
 ) -> JobInteractionActionResponse:
     """Hide or unhide a job listing."""
     # Verify listing exists
-    listing = await job_listing_repository.get(db, id=listing_id)
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job listing not found",
-        )
+    await _get_listing_or_404(db, listing_id)
 
     interaction = await user_job_interaction_repository.set_hidden(
         db, user_id=current_user_id, job_listing_id=listing_id, is_hidden=request.hide
@@ -977,7 +1000,7 @@ async def hide_job_listing(
     return JobInteractionActionResponse(
         success=True,
         message=f"Job listing {action} successfully",
-        interaction=UserJobInteractionResponse.model_validate(interaction),
+        interaction=_build_interaction_response(interaction),
     )
 
 
@@ -990,12 +1013,7 @@ async def mark_job_applied(
 ) -> JobInteractionActionResponse:
     """Mark a job listing as applied or unapplied."""
     # Verify listing exists
-    listing = await job_listing_repository.get(db, id=listing_id)
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job listing not found",
-        )
+    await _get_listing_or_404(db, listing_id)
 
     interaction = await user_job_interaction_repository.set_applied(
         db, user_id=current_user_id, job_listing_id=listing_id, applied=request.applied
@@ -1005,7 +1023,7 @@ async def mark_job_applied(
     return JobInteractionActionResponse(
         success=True,
         message=f"Job listing {action} successfully",
-        interaction=UserJobInteractionResponse.model_validate(interaction),
+        interaction=_build_interaction_response(interaction),
     )
 
 
@@ -1023,12 +1041,7 @@ async def update_application_status(
     This also updates status_changed_at and reorders within the new column.
     """
     # Verify listing exists
-    listing = await job_listing_repository.get(db, id=listing_id)
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job listing not found",
-        )
+    await _get_listing_or_404(db, listing_id)
 
     interaction = await user_job_interaction_repository.update_application_status(
         db,
@@ -1040,7 +1053,7 @@ async def update_application_status(
     return JobInteractionActionResponse(
         success=True,
         message=f"Application status updated to '{request.status.value}'",
-        interaction=UserJobInteractionResponse.model_validate(interaction),
+        interaction=_build_interaction_response(interaction),
     )
 
 
@@ -1207,8 +1220,6 @@ def _aggregate_ai_responses(responses):
     ``AIUsageTracker.log_generation``. Picks the last stage's provider/model
     so pricing lookup hits a real row.
     """
-    from app.services.ai.response import AccumulatedMetrics
-
     acc = AccumulatedMetrics()
     for r in responses:
         acc.add(r)
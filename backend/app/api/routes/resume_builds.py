@@ -13,9 +13,17 @@ Supports dual-lookup for resource IDs during migration:
 
 Security: Uses RLS-aware database sessions. PostgreSQL Row Level Security
 policies ensure users can only access their own resume builds at the database level.
+
+Transactions: routes only flush. The ``DBSessionWithRLS`` dependency commits
+once when the route returns and rolls back if it raises, so each request is a
+single transaction that keeps the ``SET LOCAL`` RLS context throughout.
 """
 
+from datetime import datetime
+from typing import Any, Literal
+
 from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUserId, DBSessionWithRLS
@@ -25,6 +33,8 @@ from app.api.utils.id_resolution import (
     is_uuid_format,
     resolve_resume_build_id,
 )
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.api.utils.responses import json_response
 from app.core.protocols import ResumeBuildStatus
 from app.crud.resume_build import resume_build_repository
 from app.schemas.resume_build import (
@@ -32,9 +42,11 @@ from app.schemas.resume_build import (
     BulletSuggestionResponse,
     DiffActionRequest,
     DiffActionResponse,
+    DiffSuggestion,
     ExportRequest,
     ResumeBuildCreate,
     ResumeBuildListResponse,
+    ResumeBuildMinimalResponse,
     ResumeBuildResponse,
     ResumeBuildUpdate,
     SuggestRequest,
@@ -44,9 +56,78 @@ from app.schemas.resume_build import (
 )
 from app.services.ai import get_usage_tracker
 from app.services.ai.client import AIServiceError
+from app.services.export.service import PDFResult, get_export_service
+from app.services.job.diff import get_diff_engine
 
 router = APIRouter()
 
+_STATUS_BY_VALUE = {s.value: s for s in ResumeBuildStatus}
+_INVALID_STATUS_DETAIL = f"Invalid status. Must be one of: {list(_STATUS_BY_VALUE)}"
+
+# ?include= for mutations whose callers may not need the full build back
+IncludeQuery = Query(
+    "full",
+    description="Return the full resume build, or only its id, status and updated_at",
+)
+
+# Validates a build's pending_diffs in one call instead of one model_validate per diff
+_DIFF_LIST_ADAPTER = TypeAdapter(list[DiffSuggestion])
+
+# Export format -> (content type, ExportService method name)
+_EXPORT_FORMATS: dict[str, tuple[str, str]] = {
+    "pdf": ("application/pdf", "export_pdf"),
+    "docx": (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "export_docx",
+    ),
+    "txt": ("text/plain", "export_txt"),
+    "json": ("application/json", "export_json"),
+}
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp from repository data back into a datetime."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _build_response(resume_build: dict[str, Any]) -> ResumeBuildResponse:
+    """
+    Build a ResumeBuildResponse from repository data without re-validating it.
+
+    Columns come straight from the database, so ``model_construct`` skips
+    validation for them. Only ``pending_diffs`` (AI-generated JSON) is
+    validated, which also coerces its enum fields for serialization.
+    """
+    return ResumeBuildResponse.model_construct(
+        id=resume_build["public_id"],
+        job_title=resume_build["job_title"],
+        job_company=resume_build["job_company"],
+        job_description=resume_build["job_description"],
+        status=resume_build["status"],
+        sections=resume_build["sections"],
+        pending_diffs=_DIFF_LIST_ADAPTER.validate_python(resume_build["pending_diffs"]),
+        created_at=_parse_timestamp(resume_build["created_at"]),
+        updated_at=_parse_timestamp(resume_build["updated_at"]),
+    )
+
+
+def _mutation_response(
+    resume_build: dict[str, Any],
+    include: str,
+    response: Response,
+) -> Response:
+    """Render a mutation result as the full build or the minimal summary."""
+    if include == "minimal":
+        return json_response(
+            ResumeBuildMinimalResponse.model_construct(
+                id=resume_build["public_id"],
+                status=resume_build["status"],
+                updated_at=_parse_timestamp(resume_build["updated_at"]),
+            ),
+            response,
+        )
+    return json_response(_build_response(resume_build), response)
+
 
 async def _resolve_build(
     db: AsyncSession,
@@ -85,7 +166,7 @@ async def create_resume_build(
     resume_build_in: ResumeBuildCreate,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+) -> Response:
     """
     Create a new resume build for tailoring a resume to a job.
 
@@ -99,8 +180,9 @@ async def create_resume_build(
         job_description=resume_build_in.job_description or "",
         job_company=resume_build_in.job_company,
     )
-    await db.commit()
-    return ResumeBuildResponse.model_validate(resume_build_data)
+    return json_response(
+        _build_response(resume_build_data), status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.get("", response_model=ResumeBuildListResponse)
@@ -109,42 +191,78 @@ async def list_resume_builds(
     current_user_id: CurrentUserId,
     status_filter: str | None = Query(None, alias="status", description="Filter by status"),
     limit: int = Query(50, ge=1, le=200, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
-) -> ResumeBuildListResponse:
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's next_cursor"
+    ),
+    offset: int = Query(
+        0, ge=0, description="Pagination offset (deprecated, use cursor)"
+    ),
+) -> Response:
     """
-    List all resume builds for the current user.
+    List all resume builds for the current user, most recently updated first.
 
-    Supports filtering by status and pagination.
+    Supports filtering by status and keyset pagination: pass the previous
+    page's ``next_cursor`` as ``cursor``. Offset pages (including the first
+    page) carry ``total``; cursor pages skip the count and return it as null.
+    ``offset`` still works but degrades with depth.
     """
-    resume_build_status = None
-    if status_filter:
+    before = None
+    if cursor:
         try:
-            resume_build_status = ResumeBuildStatus(status_filter)
-        except ValueError:
+            before = decode_cursor(cursor)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status. Must be one of: {[s.value for s in ResumeBuildStatus]}",
+                detail=str(e),
             )
+        offset = 0
 
-    resume_builds = await resume_build_repository.list_builds(
-        db,
-        user_id=current_user_id,
-        status=resume_build_status,
-        limit=limit,
-        offset=offset,
-    )
+    resume_build_status = None
+    if status_filter:
+        resume_build_status = _STATUS_BY_VALUE.get(status_filter)
+        if resume_build_status is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=_INVALID_STATUS_DETAIL,
+            )
 
-    total = await resume_build_repository.count(
-        db,
-        user_id=current_user_id,
-        status=resume_build_status,
+    # One extra row tells us whether another page exists
+    total = None
+    if before is None:
+        resume_builds, total = await resume_build_repository.list_builds_with_count(
+            db,
+            user_id=current_user_id,
+            status=resume_build_status,
+            limit=limit + 1,
+            offset=offset,
+        )
+    else:
+        resume_builds = await resume_build_repository.list_builds(
+            db,
+            user_id=current_user_id,
+            status=resume_build_status,
+            limit=limit + 1,
+            before=before,
+        )
+    has_more = len(resume_builds) > limit
+    resume_builds = resume_builds[:limit]
+
+    items = [_build_response(rb) for rb in resume_builds]
+    next_cursor = (
+        encode_cursor(items[-1].updated_at, items[-1].created_at, items[-1].id)
+        if has_more
+        else None
     )
 
-    return ResumeBuildListResponse(
-        resume_builds=[ResumeBuildResponse.model_validate(rb) for rb in resume_builds],
-        total=total,
-        limit=limit,
-        offset=offset,
+    return json_response(
+        ResumeBuildListResponse.model_construct(
+            resume_builds=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
     )
 
 
@@ -154,7 +272,7 @@ async def get_resume_build(
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+) -> Response:
     """
     Get a single resume build by ID.
 
@@ -168,7 +286,7 @@ async def get_resume_build(
     resume_build_data = await resume_build_repository.get(
         db, resume_build_id=resume_build.id, user_id=current_user_id
     )
-    return ResumeBuildResponse.model_validate(resume_build_data)
+    return json_response(_build_response(resume_build_data), response)
 
 
 @router.patch("/{resume_build_id}", response_model=ResumeBuildResponse)
@@ -178,7 +296,7 @@ async def update_resume_build(
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+) -> Response:
     """
     Update resume build basic information (job title, company, description).
 
@@ -186,21 +304,18 @@ async def update_resume_build(
     """
     resume_build = await _resolve_build(db, resume_build_id, current_user_id, response)
 
-    if resume_build_in.job_title is not None:
-        resume_build.job_title = resume_build_in.job_title
-    if resume_build_in.job_company is not None:
-        resume_build.job_company = resume_build_in.job_company
-    if resume_build_in.job_description is not None:
-        resume_build.job_description = resume_build_in.job_description
-
-    await db.commit()
-    await db.refresh(resume_build)
-
-    # Convert to data dict manually for response
-    resume_build_data = await resume_build_repository.get(
-        db, resume_build_id=resume_build.id, user_id=current_user_id
+    resume_build_data = await resume_build_repository.update_details(
+        db,
+        resume_build_id=resume_build.id,
+        user_id=current_user_id,
+        fields=resume_build_in.model_dump(exclude_none=True),
     )
-    return ResumeBuildResponse.model_validate(resume_build_data)
+    if not resume_build_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume build not found",
+        )
+    return json_response(_build_response(resume_build_data), response)
 
 
 @router.delete("/{resume_build_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -223,7 +338,6 @@ async def delete_resume_build(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume build not found",
         )
-    await db.commit()
 
 
 @router.post("/{resume_build_id}/suggest", response_model=SuggestResponse)
@@ -233,15 +347,13 @@ async def generate_suggestions(
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> SuggestResponse:
+) -> Response:
     """
     Generate AI suggestions for the resume build.
 
     The AI analyzes the job description and resume content to suggest
     improvements to optimize for the target role.
     """
-    from app.services.job.diff import get_diff_engine
-
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
     # Get data dict for processing
@@ -273,14 +385,14 @@ async def generate_suggestions(
         )
 
     # Add suggestions to resume build
+    updated_resume_build = resume_build
     if result["suggestions"]:
-        await resume_build_repository.add_pending_diffs(
+        updated_resume_build = await resume_build_repository.add_pending_diffs(
             db,
             resume_build_id=resume_build_model.id,
             user_id=current_user_id,
             diffs=result["suggestions"],
         )
-        await db.commit()
 
     if ai_response:
         await usage_tracker.log_generation(
@@ -289,17 +401,14 @@ async def generate_suggestions(
             endpoint=f"/resume-builds/{resume_build_id}/suggest",
             response=ai_response,
         )
-        await db.commit()
 
-    # Get updated resume build
-    updated_resume_build = await resume_build_repository.get(
-        db, resume_build_id=resume_build_model.id, user_id=current_user_id
-    )
-
-    return SuggestResponse(
-        resume_build=ResumeBuildResponse.model_validate(updated_resume_build),
-        new_suggestions_count=len(result["suggestions"]),
-        gaps_identified=result.get("gaps", []),
+    return json_response(
+        SuggestResponse(
+            resume_build=_build_response(updated_resume_build),
+            new_suggestions_count=len(result["suggestions"]),
+            gaps_identified=result.get("gaps", []),
+        ),
+        response,
     )
 
 
@@ -319,8 +428,6 @@ async def suggest_bullet(
     this doesn't store suggestions as pending diffs - it returns immediately
     for the user to accept or dismiss.
     """
-    from app.services.job.diff import get_diff_engine
-
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
     # Get data dict for processing
@@ -368,7 +475,6 @@ async def suggest_bullet(
             endpoint=f"/resume-builds/{resume_build_id}/suggest-bullet",
             response=ai_response,
         )
-        await db.commit()
 
     return BulletSuggestionResponse(
         original=result["original"],
@@ -385,7 +491,7 @@ async def accept_diff(
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> DiffActionResponse:
+) -> Response:
     """
     Accept a pending diff suggestion.
 
@@ -393,17 +499,8 @@ async def accept_diff(
     """
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
-    # Get current resume build to capture the diff before it's removed
-    resume_build = await resume_build_repository.get(
-        db, resume_build_id=resume_build_model.id, user_id=current_user_id
-    )
-    if not resume_build:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume build not found",
-        )
-
-    pending = resume_build.get("pending_diffs", [])
+    # Bounds-check and capture the diff from the resolved row before it's removed
+    pending = resume_build_model.pending_diffs or []
     if action_in.diff_index >= len(pending):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -418,12 +515,15 @@ async def accept_diff(
         user_id=current_user_id,
         diff_index=action_in.diff_index,
     )
-    await db.commit()
 
-    return DiffActionResponse(
-        resume_build=ResumeBuildResponse.model_validate(updated_resume_build),
-        action="accept",
-        applied_diff=applied_diff,
+    # The wrapped build is already constructed; only the applied diff needs validating
+    return json_response(
+        DiffActionResponse.model_construct(
+            resume_build=_build_response(updated_resume_build),
+            action="accept",
+            applied_diff=DiffSuggestion.model_validate(applied_diff),
+        ),
+        response,
     )
 
 
@@ -434,7 +534,7 @@ async def reject_diff(
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> DiffActionResponse:
+) -> Response:
     """
     Reject a pending diff suggestion.
 
@@ -442,16 +542,7 @@ async def reject_diff(
     """
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
-    resume_build = await resume_build_repository.get(
-        db, resume_build_id=resume_build_model.id, user_id=current_user_id
-    )
-    if not resume_build:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume build not found",
-        )
-
-    pending = resume_build.get("pending_diffs", [])
+    pending = resume_build_model.pending_diffs or []
     if action_in.diff_index >= len(pending):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -464,22 +555,28 @@ async def reject_diff(
         user_id=current_user_id,
         diff_index=action_in.diff_index,
     )
-    await db.commit()
 
-    return DiffActionResponse(
-        resume_build=ResumeBuildResponse.model_validate(updated_resume_build),
-        action="reject",
-        applied_diff=None,
+    return json_response(
+        DiffActionResponse.model_construct(
+            resume_build=_build_response(updated_resume_build),
+            action="reject",
+            applied_diff=None,
+        ),
+        response,
     )
 
 
-@router.post("/{resume_build_id}/diffs/clear", response_model=ResumeBuildResponse)
+@router.post(
+    "/{resume_build_id}/diffs/clear",
+    response_model=ResumeBuildResponse | ResumeBuildMinimalResponse,
+)
 async def clear_diffs(
     resume_build_id: str,
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+    include: Literal["full", "minimal"] = IncludeQuery,
+) -> Response:
     """Clear all pending diff suggestions."""
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
@@ -493,18 +590,21 @@ async def clear_diffs(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume build not found",
         )
-    await db.commit()
-    return ResumeBuildResponse.model_validate(resume_build)
+    return _mutation_response(resume_build, include, response)
 
 
-@router.patch("/{resume_build_id}/sections", response_model=ResumeBuildResponse)
+@router.patch(
+    "/{resume_build_id}/sections",
+    response_model=ResumeBuildResponse | ResumeBuildMinimalResponse,
+)
 async def update_sections(
     resume_build_id: str,
     sections_in: UpdateSectionsRequest,
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+    include: Literal["full", "minimal"] = IncludeQuery,
+) -> Response:
     """
     Update resume build sections.
 
@@ -524,18 +624,21 @@ async def update_sections(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume build not found",
         )
-    await db.commit()
-    return ResumeBuildResponse.model_validate(resume_build)
+    return _mutation_response(resume_build, include, response)
 
 
-@router.patch("/{resume_build_id}/status", response_model=ResumeBuildResponse)
+@router.patch(
+    "/{resume_build_id}/status",
+    response_model=ResumeBuildResponse | ResumeBuildMinimalResponse,
+)
 async def update_status(
     resume_build_id: str,
     status_in: UpdateStatusRequest,
     response: Response,
     db: DBSessionWithRLS,
     current_user_id: CurrentUserId,
-) -> ResumeBuildResponse:
+    include: Literal["full", "minimal"] = IncludeQuery,
+) -> Response:
     """Update resume build status."""
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
@@ -550,8 +653,7 @@ async def update_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume build not found",
         )
-    await db.commit()
-    return ResumeBuildResponse.model_validate(resume_build)
+    return _mutation_response(resume_build, include, response)
 
 
 @router.post("/{resume_build_id}/export")
@@ -567,10 +669,6 @@ async def export_resume_build(
 
     Returns the file as a download.
     """
-    from fastapi.responses import Response as FileResponse
-
-    from app.services.export.service import get_export_service
-
     resume_build_model = await _resolve_build(db, resume_build_id, current_user_id, response)
 
     resume_build = await resume_build_repository.get(
@@ -582,27 +680,16 @@ async def export_resume_build(
             detail="Resume build not found",
         )
 
-    export_service = get_export_service()
     sections = resume_build.get("sections", {})
 
-    # Map format to content type and export function
-    format_map = {
-        "pdf": ("application/pdf", export_service.export_pdf),
-        "docx": (
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            export_service.export_docx,
-        ),
-        "txt": ("text/plain", export_service.export_txt),
-        "json": ("application/json", export_service.export_json),
-    }
-
-    if export_in.format not in format_map:
+    if export_in.format not in _EXPORT_FORMATS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unsupported format: {export_in.format}",
         )
 
-    content_type, export_func = format_map[export_in.format]
+    content_type, method_name = _EXPORT_FORMATS[export_in.format]
+    export_func = getattr(get_export_service(), method_name)
     result = await export_func(sections, template=export_in.template)
 
     # Update status to exported
@@ -612,7 +699,6 @@ async def export_resume_build(
         user_id=current_user_id,
         status=ResumeBuildStatus.EXPORTED,
     )
-    await db.commit()
 
     # Determine filename
     job_title = resume_build.get("job_title", "resume").replace(" ", "_")
@@ -620,10 +706,8 @@ async def export_resume_build(
 
     # Handle PDF result with metadata
     if export_in.format == "pdf":
-        from app.services.export.service import PDFResult
-
         if isinstance(result, PDFResult):
-            return FileResponse(
+            return Response(
                 content=result.content,
                 media_type=content_type,
                 headers={
@@ -635,7 +719,7 @@ async def export_resume_build(
 
     # Other formats return bytes or string directly
     content = result if isinstance(result, bytes) else result.encode()
-    return FileResponse(
+    return Response(
         content=content,
         media_type=content_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
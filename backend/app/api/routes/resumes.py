@@ -15,9 +15,11 @@ from fastapi.responses import Response
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.api.deps import get_current_user_id, get_mongo_db
+from app.api.utils.responses import json_response
 from app.crud.mongo import resume_crud
 from app.crud.mongo.exceptions import VersionConflictError
 from app.db.mongodb import get_mongodb
+from app.db.session import AsyncSessionLocal
 from app.models.mongo.resume import (
     OriginalFile,
     ParsedContent,
@@ -83,7 +85,7 @@ async def create_resume(
     resume_in: ResumeCreate,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> ResumeResponse:
+) -> Response:
     """Create a new resume."""
     create_data = MongoResumeCreate(
         user_id=current_user_id,
@@ -98,7 +100,7 @@ async def create_resume(
         ) if resume_in.original_file_key else None,
     )
     resume = await resume_crud.create(mongo_db, obj_in=create_data)
-    return _to_response(resume)
+    return json_response(_to_response(resume), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
@@ -106,20 +108,15 @@ async def get_resume(
     resume_id: str,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> ResumeResponse:
+) -> Response:
     """Get a resume by ID."""
-    resume = await resume_crud.get(mongo_db, id=resume_id)
+    resume = await resume_crud.get(mongo_db, id=resume_id, user_id=current_user_id)
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
-    return _to_response(resume)
+    return json_response(_to_response(resume))
 
 
 @router.get("", response_model=list[ResumeResponse])
@@ -128,12 +125,12 @@ async def list_resumes(
     limit: int = 100,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> list[ResumeResponse]:
+) -> Response:
     """List all resumes for the current user."""
     resumes = await resume_crud.get_by_user(
         mongo_db, user_id=current_user_id, skip=skip, limit=limit
     )
-    return [_to_response(r) for r in resumes]
+    return json_response([_to_response(r) for r in resumes])
 
 
 @router.put("/{resume_id}", response_model=ResumeResponse)
@@ -142,7 +139,7 @@ async def update_resume(
     resume_in: ResumeUpdate,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> ResumeResponse:
+) -> Response:
     """Update a resume with optimistic concurrency control.
 
     Returns:
@@ -152,13 +149,6 @@ async def update_resume(
         404: Resume not found or not authorized
         409: Version conflict - resume was modified by another session
     """
-    # Verify ownership
-    if not await resume_crud.exists(mongo_db, id=resume_id, user_id=current_user_id):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume not found or not authorized",
-        )
-
     try:
         # Build update object with version for OCC
         update_data = MongoResumeUpdate(
@@ -169,13 +159,16 @@ async def update_resume(
             parsed=ParsedContent(**resume_in.parsed_content) if resume_in.parsed_content else None,
             style=StyleSettings(**resume_in.style) if resume_in.style else None,
         )
-        updated_resume = await resume_crud.update(mongo_db, id=resume_id, obj_in=update_data)
+        # Ownership is part of the update filter
+        updated_resume = await resume_crud.update(
+            mongo_db, id=resume_id, obj_in=update_data, user_id=current_user_id
+        )
         if not updated_resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Resume not found",
+                detail="Resume not found or not authorized",
             )
-        return _to_response(updated_resume)
+        return json_response(_to_response(updated_resume))
 
     except VersionConflictError as e:
         # Handle version conflict with HTTP 409
@@ -196,13 +189,12 @@ async def delete_resume(
     current_user_id: int = Depends(get_current_user_id),
 ) -> None:
     """Delete a resume."""
-    # Verify ownership
-    if not await resume_crud.exists(mongo_db, id=resume_id, user_id=current_user_id):
+    # Ownership is part of the delete filter
+    if not await resume_crud.delete(mongo_db, id=resume_id, user_id=current_user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found or not authorized",
         )
-    await resume_crud.delete(mongo_db, id=resume_id)
 
 
 @router.patch("/{resume_id}/set-master", response_model=ResumeResponse)
@@ -210,7 +202,7 @@ async def set_master_resume(
     resume_id: str,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> ResumeResponse:
+) -> Response:
     """
     Set a resume as the master resume for the current user.
 
@@ -222,8 +214,8 @@ async def set_master_resume(
     - Resume must be verified (parsed_verified = true)
     """
     # First verify ownership and check verification status
-    existing = await resume_crud.get(mongo_db, id=resume_id)
-    if not existing or existing.user_id != current_user_id:
+    existing = await resume_crud.get(mongo_db, id=resume_id, user_id=current_user_id)
+    if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found or not authorized",
@@ -244,7 +236,7 @@ async def set_master_resume(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to set master resume",
         )
-    return _to_response(resume)
+    return json_response(_to_response(resume))
 
 
 @router.patch("/{resume_id}/verify-parsed", response_model=ResumeResponse)
@@ -252,7 +244,7 @@ async def verify_parsed_resume(
     resume_id: str,
     mongo_db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     current_user_id: int = Depends(get_current_user_id),
-) -> ResumeResponse:
+) -> Response:
     """Mark a resume's parsed content as verified by the user.
 
     Prerequisites:
@@ -262,21 +254,14 @@ async def verify_parsed_resume(
     Once verified, the resume can be used in tailoring flows.
     Tailoring will be blocked for unverified resumes.
     """
-    # Fetch resume
-    resume = await resume_crud.get(mongo_db, id=resume_id)
+    # Fetch resume (ownership is part of the query)
+    resume = await resume_crud.get(mongo_db, id=resume_id, user_id=current_user_id)
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
 
-    # Verify ownership
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
-
     # Ensure resume is parsed
     if not resume.parsed:
         raise HTTPException(
@@ -286,7 +271,7 @@ async def verify_parsed_resume(
 
     # Already verified - return current state
     if resume.parsed_verified:
-        return _to_response(resume)
+        return json_response(_to_response(resume))
 
     # Update verification status
     update_data = MongoResumeUpdate(parsed_verified=True)
@@ -300,7 +285,7 @@ async def verify_parsed_resume(
             detail="Failed to verify resume",
         )
 
-    return _to_response(updated)
+    return json_response(_to_response(updated))
 
 
 @router.get("/export/templates", response_model=ExportTemplatesResponse)
@@ -344,17 +329,12 @@ async def export_resume(
     - **modern**: Contemporary design with accent colors
     - **minimal**: Clean, ATS-friendly formatting
     """
-    resume = await resume_crud.get(mongo_db, id=resume_id)
+    resume = await resume_crud.get(mongo_db, id=resume_id, user_id=current_user_id)
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
 
     # Use HTML content if available, otherwise wrap raw content in basic HTML
     if resume.html_content:
@@ -517,17 +497,12 @@ async def parse_resume(
     - **force**: If True, bypasses the cache and re-parses the content.
     """
     # Validate resume exists and has raw_content
-    resume = await resume_crud.get(mongo_db, id=resume_id)
+    resume = await resume_crud.get(mongo_db, id=resume_id, user_id=current_user_id)
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
     if not resume.raw_content or not resume.raw_content.strip():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -537,7 +512,6 @@ async def parse_resume(
     # Log AI operation (still uses PostgreSQL for audit logs)
 
     # Get a fresh Postgres session for audit logging
-    from app.db.session import AsyncSessionLocal
     async with AsyncSessionLocal() as pg_db:
         await audit_service.log_ai_operation(
             db=pg_db,
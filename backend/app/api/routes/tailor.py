@@ -10,11 +10,13 @@ Supports dual-lookup for job IDs during migration:
 - Integer format (deprecated): 123
 """
 
+import hashlib
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.api.deps import CurrentUserId, DatabaseSessionsWithRLS, resolve_ai_model
 from app.api.utils.id_resolution import (
@@ -23,15 +25,19 @@ from app.api.utils.id_resolution import (
     is_uuid_format,
     resolve_job_id,
 )
+from app.api.utils.responses import json_response
 from app.crud import job_crud
 from app.crud.job_listing import job_listing_repository
 from app.crud.mongo import resume_crud, tailored_resume_crud
 
 # Import for type hints in list_tailored_resumes (line 607)
 from app.models.job import JobDescription
+from app.models.job_listing import JobListing
 from app.models.mongo.tailored_resume import (
     JobSource,
+    TailoredResumeDocument,
     TailoredResumeStatus,
+    TailoredResumeSummary,
 )
 from app.models.mongo.tailored_resume import (
     TailoredResumeCreate as MongoTailoredResumeCreate,
@@ -58,6 +64,8 @@ from app.schemas.tailor.suggestions import (
     BulletAnalysisRequest,
 )
 from app.services import (
+    AIClient,
+    CacheService,
     JobAnalyzer,
     ResumeParser,
     TailoringService,
@@ -65,23 +73,38 @@ from app.services import (
     get_cache_service,
 )
 from app.services.ai import get_usage_tracker
-from app.services.ai.client import AIServiceError, get_ai_client_for_model
+from app.services.ai.client import (
+    AIServiceError,
+    get_ai_client,
+    get_ai_client_for_model,
+)
 from app.services.job.diff import BulletAnalyzer
+from app.utils.concurrency import gather_or_cancel
 
 router = APIRouter()
 
 
-def get_tailoring_service(ai_client=None) -> TailoringService:
-    """Get the tailoring service with dependencies."""
-    from app.services.ai.client import get_ai_client
-
-    client = ai_client or get_ai_client()
-    cache = get_cache_service()
+@lru_cache
+def _wire_tailoring_service(client: AIClient, cache: CacheService) -> TailoringService:
+    """Build the parser/analyzer/service wiring for one AI client and cache."""
     resume_parser = ResumeParser(client, cache)
     job_analyzer = JobAnalyzer(client, cache)
     return TailoringService(client, cache, resume_parser, job_analyzer)
 
 
+def get_tailoring_service(ai_client=None) -> TailoringService:
+    """
+    Get the tailoring service with dependencies.
+
+    The AI client and cache service are resolved on every call; only the
+    wiring built on top of them is cached, once per (client, cache) pair.
+    A replaced cache service therefore gets fresh wiring instead of the
+    service holding on to the old one.
+    """
+    client = ai_client or get_ai_client()
+    return _wire_tailoring_service(client, get_cache_service())
+
+
 @router.post("", response_model=TailorResponse, status_code=status.HTTP_201_CREATED)
 async def tailor_resume(
     request: TailorRequest,
@@ -101,18 +124,20 @@ async def tailor_resume(
     pg = dbs["pg"]
     mongo = dbs["mongo"]
 
-    # Verify resume exists and belongs to user (MongoDB)
-    resume = await resume_crud.get(mongo, id=request.resume_id)
+    # Fetch the resume (MongoDB) concurrently with the job source and AI
+    # model preference (PostgreSQL); they live on different connections, so
+    # the round-trips overlap.
+    resume, (job_source, model) = await gather_or_cancel(
+        resume_crud.get(mongo, id=request.resume_id, user_id=current_user_id),
+        _load_job_source_and_model(
+            pg, request, current_user_id, response, "/api/tailor"
+        ),
+    )
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
 
     # Check if resume is parsed
     if not resume.parsed:
@@ -130,53 +155,24 @@ async def tailor_resume(
             headers={"X-Redirect": f"/library/resumes/{request.resume_id}/verify"},
         )
 
-    # Get job content based on which source is provided (PostgreSQL)
     job_source_type: Literal["user_created", "job_listing"]
-    job_title: str | None = None
-    company_name: str | None = None
     job_public_id: UUID | None = None  # For response
 
-    if request.job_id is not None:
-        # User-created job description - resolve UUID or integer ID
-        if not is_uuid_format(request.job_id):
-            add_deprecation_headers(response, "job")
-        try:
-            job = await resolve_job_id(
-                pg, request.job_id, current_user_id, crud=job_crud,
-                endpoint="/api/tailor"
-            )
-        except IDResolutionError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job description not found",
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=str(e),
-            )
-        raw_job = job.raw_content
-        job_source_type = "user_created"
-        job_source_id = job.id  # Store integer ID in MongoDB for backward compat
-        job_public_id = job.public_id  # type: ignore[assignment]
-        job_title = job.title  # type: ignore[assignment]
-        company_name = job.company  # type: ignore[assignment]
-    else:
-        # System-wide job listing from scraper
-        job_listing = await job_listing_repository.get(pg, id=request.job_listing_id)
-        if not job_listing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job listing not found",
-            )
-        raw_job = job_listing.job_description
+    if isinstance(job_source, JobListing):
+        raw_job = job_source.job_description
         job_source_type = "job_listing"
-        job_source_id = request.job_listing_id
-        job_title = job_listing.job_title  # type: ignore[assignment]
-        company_name = job_listing.company_name  # type: ignore[assignment]
+        job_source_id = job_source.id
+        job_title = job_source.job_title
+        company_name = job_source.company_name
+    else:
+        raw_job = job_source.raw_content
+        job_source_type = "user_created"
+        job_source_id = job_source.id  # Store integer ID in MongoDB for backward compat
+        job_public_id = job_source.public_id  # type: ignore[assignment]
+        job_title = job_source.title  # type: ignore[assignment]
+        company_name = job_source.company  # type: ignore[assignment]
 
     # Run tailoring - now returns complete tailored document
-    model = await resolve_ai_model(current_user_id, pg, "general")
     ai_client = get_ai_client_for_model(model)
     service = get_tailoring_service(ai_client=ai_client)
     try:
@@ -267,52 +263,26 @@ async def quick_match(
     pg = dbs["pg"]
     mongo = dbs["mongo"]
 
-    # Verify resume exists and belongs to user (MongoDB)
-    resume = await resume_crud.get(mongo, id=request.resume_id)
+    # Fetch the resume (MongoDB) concurrently with the job source and AI
+    # model preference (PostgreSQL)
+    resume, (job_source, model) = await gather_or_cancel(
+        resume_crud.get(mongo, id=request.resume_id, user_id=current_user_id),
+        _load_job_source_and_model(
+            pg, request, current_user_id, response, "/api/tailor/quick-match"
+        ),
+    )
     if not resume:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found",
         )
-    if resume.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume",
-        )
-
-    # Get job content based on which source is provided (PostgreSQL)
-    if request.job_id is not None:
-        # User-created job description - resolve UUID or integer ID
-        if not is_uuid_format(request.job_id):
-            add_deprecation_headers(response, "job")
-        try:
-            job = await resolve_job_id(
-                pg, request.job_id, current_user_id, crud=job_crud,
-                endpoint="/api/tailor/quick-match"
-            )
-        except IDResolutionError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job description not found",
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=str(e),
-            )
-        raw_job = job.raw_content
-    else:
-        # System-wide job listing from scraper
-        job_listing = await job_listing_repository.get(pg, id=request.job_listing_id)
-        if not job_listing:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job listing not found",
-            )
-        raw_job = job_listing.job_description
+    raw_job = (
+        job_source.job_description
+        if isinstance(job_source, JobListing)
+        else job_source.raw_content
+    )
 
     # Get quick match
-    model = await resolve_ai_model(current_user_id, pg, "general")
     ai_client = get_ai_client_for_model(model)
     service = get_tailoring_service(ai_client=ai_client)
     result = await service.get_quick_match_score(
@@ -339,87 +309,87 @@ async def quick_match(
 @router.get("/{tailored_id}", response_model=TailoredResumeFullResponse)
 async def get_tailored_resume(
     tailored_id: str,
+    request: Request,
     dbs: DatabaseSessionsWithRLS,
     current_user_id: CurrentUserId,
-) -> TailoredResumeFullResponse:
+) -> Response:
     """Get a tailored resume by ID.
 
     Includes ATS cache metadata (Phase 5):
     - ats_score: Cached ATS composite score (if available)
     - ats_cached_at: When ATS analysis was last cached
     - is_outdated: True if resume content changed since ATS analysis
+
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified
+    from the summary fields, the original resume's stored content hash and
+    the ATS cache entry, without loading tailored or original resume content.
+    A stale If-None-Match costs one extra projected summary read before the
+    full document is loaded.
     """
     pg = dbs["pg"]
     mongo = dbs["mongo"]
+    if_none_match = request.headers.get("if-none-match")
 
-    tailored = await tailored_resume_crud.get(mongo, id=tailored_id)
-    if not tailored:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tailored resume not found",
+    # Ownership (denormalized user_id) is part of the query. When the client
+    # is revalidating, start from the summary fields so a 304 never loads
+    # tailored_data / finalized_data.
+    if if_none_match:
+        summary = await tailored_resume_crud.get_summary(
+            mongo, id=tailored_id, user_id=current_user_id
         )
+        if not summary:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tailored resume not found",
+            )
+        ats_metadata = await _get_ats_cache_metadata(mongo, summary)
+        etag = _tailored_etag(summary, ats_metadata)
+        if _etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+            )
 
-    # Verify ownership through user_id (denormalized)
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this tailored resume",
+        tailored, job_public_id = await gather_or_cancel(
+            tailored_resume_crud.get(mongo, id=tailored_id, user_id=current_user_id),
+            _get_job_public_id(pg, summary.job_source, current_user_id),
         )
+        if not tailored:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tailored resume not found",
+            )
+    else:
+        tailored = await tailored_resume_crud.get(
+            mongo, id=tailored_id, user_id=current_user_id
+        )
+        if not tailored:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tailored resume not found",
+            )
 
-    # Get ATS cache metadata (Phase 5)
-    ats_score: float | None = None
-    ats_cached_at = None
-    is_outdated = False
-
-    cache = get_cache_service()
+        # ATS cache metadata (Mongo + Redis) and the job public_id (Postgres)
+        # are independent, so look them up concurrently
+        ats_metadata, job_public_id = await gather_or_cancel(
+            _get_ats_cache_metadata(mongo, tailored),
+            _get_job_public_id(pg, tailored.job_source, current_user_id),
+        )
+        etag = _tailored_etag(tailored, ats_metadata)
 
-    # Get the original resume to compute content hash for cache lookup
-    original_resume = await resume_crud.get(mongo, id=str(tailored.resume_id))
-    if original_resume and original_resume.raw_content:
-        resume_content_hash = cache.hash_content(original_resume.raw_content)
-        job_int_id = tailored.job_source.id
-
-        # Look up ATS cache
-        ats_metadata = await cache.get_ats_metadata(resume_content_hash, job_int_id)
-        if ats_metadata:
-            ats_score = ats_metadata.get("final_score")
-            cached_at_str = ats_metadata.get("cached_at")
-            if cached_at_str:
-                ats_cached_at = datetime.fromisoformat(cached_at_str.replace("Z", "+00:00"))
-
-            # Check staleness: compare cached hash with current content hash
-            cached_hash = ats_metadata.get("resume_content_hash")
-            if cached_hash and cached_hash != resume_content_hash:
-                is_outdated = True
-
-    # Look up job public_id for user-created jobs
-    job_public_id: UUID | None = None
-    if tailored.job_source.type == "user_created":
-        job = await job_crud.get(pg, id=tailored.job_source.id)
-        if job:
-            job_public_id = job.public_id  # type: ignore[assignment]
-
-    return TailoredResumeFullResponse(
-        id=str(tailored.id),
-        resume_id=str(tailored.resume_id),
-        job_id=job_public_id,
-        job_listing_id=tailored.job_source.id if tailored.job_source.type == "job_listing" else None,
-        tailored_data=tailored.tailored_data,
-        finalized_data=tailored.finalized_data,
-        status=tailored.status,
-        match_score=tailored.match_score,
-        job_title=tailored.job_title,
-        company_name=tailored.company_name,
-        style_settings=tailored.style_settings or {},
-        section_order=tailored.section_order,
-        created_at=tailored.created_at,
-        updated_at=tailored.updated_at,
-        finalized_at=tailored.finalized_at,
-        # ATS cache metadata (Phase 5)
-        ats_score=ats_score,
-        ats_cached_at=ats_cached_at,
-        is_outdated=is_outdated,
+    ats_score, ats_cached_at, is_outdated = ats_metadata
+    rendered = json_response(
+        _to_full_response(
+            tailored,
+            job_public_id,
+            ats_score=ats_score,
+            ats_cached_at=ats_cached_at,
+            is_outdated=is_outdated,
+        )
     )
+    rendered.headers["ETag"] = etag
+    rendered.headers["Cache-Control"] = "private, no-cache"
+    return rendered
 
 
 @router.get("/{tailored_id}/compare", response_model=TailoredResumeCompareResponse)
@@ -436,7 +406,9 @@ async def get_compare_data(
     """
     mongo = dbs["mongo"]
 
-    compare_data = await tailored_resume_crud.get_compare_data(mongo, id=tailored_id)
+    compare_data = await tailored_resume_crud.get_compare_data(
+        mongo, id=tailored_id, user_id=current_user_id
+    )
     if not compare_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -445,13 +417,6 @@ async def get_compare_data(
 
     tailored = compare_data.tailored_resume
 
-    # Verify ownership
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this tailored resume",
-        )
-
     return TailoredResumeCompareResponse(
         id=str(tailored.id),
         resume_id=str(tailored.resume_id),
@@ -470,7 +435,7 @@ async def finalize_tailored_resume(
     request: TailoredResumeFinalizeRequest,
     dbs: DatabaseSessionsWithRLS,
     current_user_id: CurrentUserId,
-) -> TailoredResumeFullResponse:
+) -> Response:
     """Finalize a tailored resume with user's approved changes.
 
     Two Copies Architecture: The frontend sends the merged document
@@ -480,65 +445,34 @@ async def finalize_tailored_resume(
     pg = dbs["pg"]
     mongo = dbs["mongo"]
 
-    # Verify ownership
-    tailored = await tailored_resume_crud.get(mongo, id=tailored_id)
-    if not tailored:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tailored resume not found",
-        )
-
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to finalize this tailored resume",
-        )
-
-    # Check if already finalized
-    if tailored.status == TailoredResumeStatus.FINALIZED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This tailored resume has already been finalized",
-        )
-
-    # Finalize with the user's merged document
+    # Finalize with the user's merged document. Ownership and the
+    # not-already-finalized check are part of the update filter.
     finalize_data = MongoTailoredResumeFinalize(finalized_data=request.finalized_data)
     try:
-        updated = await tailored_resume_crud.finalize(mongo, id=tailored_id, obj_in=finalize_data)
+        updated = await tailored_resume_crud.finalize(
+            mongo, id=tailored_id, obj_in=finalize_data, user_id=current_user_id
+        )
     except Exception:
         await pg.rollback()
         raise
 
     if not updated:
+        # No match: tell "already finalized" apart from "not found"
+        if await tailored_resume_crud.exists(
+            mongo, id=tailored_id, user_id=current_user_id
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="This tailored resume has already been finalized",
+            )
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to finalize tailored resume",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tailored resume not found",
         )
 
-    # Look up job public_id for user-created jobs
-    job_public_id: UUID | None = None
-    if updated.job_source.type == "user_created":
-        job = await job_crud.get(pg, id=updated.job_source.id)
-        if job:
-            job_public_id = job.public_id  # type: ignore[assignment]
+    job_public_id = await _get_job_public_id(pg, updated.job_source, current_user_id)
 
-    return TailoredResumeFullResponse(
-        id=str(updated.id),
-        resume_id=str(updated.resume_id),
-        job_id=job_public_id,
-        job_listing_id=updated.job_source.id if updated.job_source.type == "job_listing" else None,
-        tailored_data=updated.tailored_data,
-        finalized_data=updated.finalized_data,
-        status=updated.status,
-        match_score=updated.match_score,
-        job_title=updated.job_title,
-        company_name=updated.company_name,
-        style_settings=updated.style_settings or {},
-        section_order=updated.section_order,
-        created_at=updated.created_at,
-        updated_at=updated.updated_at,
-        finalized_at=updated.finalized_at,
-    )
+    return json_response(_to_full_response(updated, job_public_id))
 
 
 @router.patch("/{tailored_id}", response_model=TailoredResumeFullResponse)
@@ -547,63 +481,31 @@ async def update_tailored_resume(
     request: TailoredResumeUpdateRequest,
     dbs: DatabaseSessionsWithRLS,
     current_user_id: CurrentUserId,
-) -> TailoredResumeFullResponse:
+) -> Response:
     """Update a tailored resume's content, style settings, or section order."""
     pg = dbs["pg"]
     mongo = dbs["mongo"]
 
-    tailored = await tailored_resume_crud.get(mongo, id=tailored_id)
-    if not tailored:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tailored resume not found",
-        )
-
-    # Verify ownership
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this tailored resume",
-        )
-
-    # Build update
-    update_data = MongoTailoredResumeUpdate(
+    # Build update; ownership is part of the update filter. The request
+    # body was already validated, so pass its dicts through as-is.
+    update_data = MongoTailoredResumeUpdate.model_construct(
         tailored_data=request.tailored_data,
         section_order=request.section_order,
         style_settings=request.style_settings,
     )
-    updated = await tailored_resume_crud.update(mongo, id=tailored_id, obj_in=update_data)
+    updated = await tailored_resume_crud.update(
+        mongo, id=tailored_id, obj_in=update_data, user_id=current_user_id
+    )
 
     if not updated:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update tailored resume",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tailored resume not found",
         )
 
-    # Look up job public_id for user-created jobs
-    job_public_id: UUID | None = None
-    if updated.job_source.type == "user_created":
-        job = await job_crud.get(pg, id=updated.job_source.id)
-        if job:
-            job_public_id = job.public_id  # type: ignore[assignment]
+    job_public_id = await _get_job_public_id(pg, updated.job_source, current_user_id)
 
-    return TailoredResumeFullResponse(
-        id=str(updated.id),
-        resume_id=str(updated.resume_id),
-        job_id=job_public_id,
-        job_listing_id=updated.job_source.id if updated.job_source.type == "job_listing" else None,
-        tailored_data=updated.tailored_data,
-        finalized_data=updated.finalized_data,
-        status=updated.status,
-        match_score=updated.match_score,
-        job_title=updated.job_title,
-        company_name=updated.company_name,
-        style_settings=updated.style_settings or {},
-        section_order=updated.section_order,
-        created_at=updated.created_at,
-        updated_at=updated.updated_at,
-        finalized_at=updated.finalized_at,
-    )
+    return json_response(_to_full_response(updated, job_public_id))
 
 
 @router.get("", response_model=list[TailoredResumeListResponse])
@@ -617,7 +519,7 @@ async def list_tailored_resumes(
     status_filter: TailoredResumeStatus | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> list[TailoredResumeListResponse]:
+) -> Response:
     """List tailored resumes, optionally filtered by resume, job, job listing, or status."""
     pg = dbs["pg"]
     mongo = dbs["mongo"]
@@ -654,7 +556,13 @@ async def list_tailored_resumes(
                 detail=str(e),
             )
         tailored_list = await tailored_resume_crud.get_by_job_source(
-            mongo, job_source_type="user_created", job_source_id=resolved_job.id, status=status_filter
+            mongo,
+            job_source_type="user_created",
+            job_source_id=resolved_job.id,
+            user_id=current_user_id,
+            status=status_filter,
+            skip=skip,
+            limit=limit,
         )
     elif job_listing_id:
         # Job listings are system-wide, verify it exists
@@ -665,7 +573,13 @@ async def list_tailored_resumes(
                 detail="Job listing not found",
             )
         tailored_list = await tailored_resume_crud.get_by_job_source(
-            mongo, job_source_type="job_listing", job_source_id=job_listing_id, status=status_filter
+            mongo,
+            job_source_type="job_listing",
+            job_source_id=job_listing_id,
+            user_id=current_user_id,
+            status=status_filter,
+            skip=skip,
+            limit=limit,
         )
     else:
         # List all tailored resumes for the current user
@@ -678,13 +592,14 @@ async def list_tailored_resumes(
         t.job_source.id for t in tailored_list
         if t.job_source.type == "user_created"
     }
-    job_id_to_public_id: dict[int, UUID] = {}
-    if user_job_ids:
-        jobs = await job_crud.get_by_ids(pg, ids=list(user_job_ids))
-        job_id_to_public_id = {j.id: j.public_id for j in jobs}  # type: ignore[misc]
+    job_id_to_public_id = await job_crud.get_public_ids(
+        pg, ids=list(user_job_ids), owner_id=current_user_id
+    )
 
-    return [
-        TailoredResumeListResponse(
+    # Summaries come straight from our own documents, so skip re-validation
+    # both when building the rows and when FastAPI serializes the response
+    items = [
+        TailoredResumeListResponse.model_construct(
             id=str(t.id),
             resume_id=str(t.resume_id),
             job_id=job_id_to_public_id.get(t.job_source.id) if t.job_source.type == "user_created" else None,
@@ -697,6 +612,7 @@ async def list_tailored_resumes(
         )
         for t in tailored_list
     ]
+    return json_response(items, response)
 
 
 @router.delete("/{tailored_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -708,15 +624,15 @@ async def delete_tailored_resume(
     """Delete a tailored resume."""
     mongo = dbs["mongo"]
 
-    # Verify ownership
-    if not await tailored_resume_crud.exists(mongo, id=tailored_id, user_id=current_user_id):
+    # Ownership is part of the delete filter
+    if not await tailored_resume_crud.delete(
+        mongo, id=tailored_id, user_id=current_user_id
+    ):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tailored resume not found or not authorized",
         )
 
-    await tailored_resume_crud.delete(mongo, id=tailored_id)
-
 
 @router.post(
     "/{tailored_id}/analyze-bullets",
@@ -738,17 +654,14 @@ async def analyze_bullets(
     mongo = dbs["mongo"]
 
     # 1. Validate user owns the tailored resume
-    tailored = await tailored_resume_crud.get(mongo, id=tailored_id)
+    tailored = await tailored_resume_crud.get(
+        mongo, id=tailored_id, user_id=current_user_id
+    )
     if not tailored:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tailored resume not found",
         )
-    if tailored.user_id != current_user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized",
-        )
 
     # 2. Fetch job description based on job source
     job_description = await _fetch_job_description(
@@ -805,6 +718,175 @@ async def analyze_bullets(
     )
 
 
+def _to_full_response(
+    tailored: TailoredResumeDocument,
+    job_public_id: UUID | None,
+    **ats_metadata,
+) -> TailoredResumeFullResponse:
+    """Build the full response from a stored document.
+
+    The document was validated when loaded, so the response (which can carry
+    two complete resume copies) is built without validating it again.
+    """
+    return TailoredResumeFullResponse.model_construct(
+        id=str(tailored.id),
+        resume_id=str(tailored.resume_id),
+        job_id=job_public_id,
+        job_listing_id=tailored.job_source.id
+        if tailored.job_source.type == "job_listing"
+        else None,
+        tailored_data=tailored.tailored_data,
+        finalized_data=tailored.finalized_data,
+        status=tailored.status,
+        match_score=tailored.match_score,
+        job_title=tailored.job_title,
+        company_name=tailored.company_name,
+        style_settings=tailored.style_settings or {},
+        section_order=tailored.section_order,
+        created_at=tailored.created_at,
+        updated_at=tailored.updated_at,
+        finalized_at=tailored.finalized_at,
+        **ats_metadata,
+    )
+
+
+def _tailored_etag(
+    tailored: TailoredResumeDocument | TailoredResumeSummary,
+    ats_metadata: tuple[float | None, datetime | None, bool],
+) -> str:
+    """
+    Entity tag for the full tailored resume response.
+
+    Every write bumps updated_at; the ATS fields are included because they
+    change with the ATS cache and the original resume, not the document.
+    """
+    ats_score, ats_cached_at, is_outdated = ats_metadata
+    updated_at = tailored.updated_at or tailored.created_at
+    source = f"{tailored.id}|{updated_at.isoformat()}|{ats_score}|{ats_cached_at}|{is_outdated}"
+    return f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (a list of tags, or *) against an ETag."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def _get_ats_cache_metadata(
+    mongo,
+    tailored: TailoredResumeDocument | TailoredResumeSummary,
+) -> tuple[float | None, datetime | None, bool]:
+    """
+    Look up cached ATS metadata for a tailored resume (Phase 5).
+
+    Returns ``(ats_score, ats_cached_at, is_outdated)``.
+    """
+    ats_score: float | None = None
+    ats_cached_at: datetime | None = None
+    is_outdated = False
+
+    # The cache key only needs the original resume's stored content hash
+    resume_content_hash = await resume_crud.get_content_hash(
+        mongo, str(tailored.resume_id)
+    )
+    if not resume_content_hash:
+        return ats_score, ats_cached_at, is_outdated
+
+    cache = get_cache_service()
+    ats_metadata = await cache.get_ats_metadata(
+        resume_content_hash, tailored.job_source.id
+    )
+    if ats_metadata:
+        ats_score = ats_metadata.get("final_score")
+        cached_at_str = ats_metadata.get("cached_at")
+        if cached_at_str:
+            ats_cached_at = datetime.fromisoformat(cached_at_str.replace("Z", "+00:00"))
+
+        # Check staleness: compare cached hash with current content hash
+        cached_hash = ats_metadata.get("resume_content_hash")
+        if cached_hash and cached_hash != resume_content_hash:
+            is_outdated = True
+
+    return ats_score, ats_cached_at, is_outdated
+
+
+async def _get_job_public_id(
+    pg,
+    job_source: JobSource,
+    owner_id: int,
+) -> UUID | None:
+    """Look up the public_id of a user-created job source (None for listings)."""
+    if job_source.type != "user_created":
+        return None
+    public_ids = await job_crud.get_public_ids(
+        pg, ids=[job_source.id], owner_id=owner_id
+    )
+    return public_ids.get(job_source.id)
+
+
+async def _resolve_job_source(
+    pg,
+    request: TailorRequest | QuickMatchRequest,
+    current_user_id: int,
+    response: Response,
+    endpoint: str,
+) -> JobDescription | JobListing:
+    """
+    Load the job a tailor/quick-match request points at.
+
+    Resolves a user-created job (UUID or deprecated integer ID) or a
+    system-wide scraped job listing, raising 404/400 HTTP errors.
+    """
+    if request.job_id is not None:
+        # User-created job description - resolve UUID or integer ID
+        if not is_uuid_format(request.job_id):
+            add_deprecation_headers(response, "job")
+        try:
+            return await resolve_job_id(
+                pg, request.job_id, current_user_id, crud=job_crud, endpoint=endpoint
+            )
+        except IDResolutionError:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job description not found",
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+    # System-wide job listing from scraper
+    job_listing = await job_listing_repository.get(pg, id=request.job_listing_id)
+    if not job_listing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job listing not found",
+        )
+    return job_listing
+
+
+async def _load_job_source_and_model(
+    pg,
+    request: TailorRequest | QuickMatchRequest,
+    current_user_id: int,
+    response: Response,
+    endpoint: str,
+) -> tuple[JobDescription | JobListing, str]:
+    """
+    Run every PostgreSQL lookup that precedes the AI call, in sequence.
+
+    The queries share one session and cannot run concurrently with each
+    other, so they are chained here and the whole chain is overlapped with
+    the MongoDB resume fetch.
+    """
+    job_source = await _resolve_job_source(
+        pg, request, current_user_id, response, endpoint
+    )
+    model = await resolve_ai_model(current_user_id, pg, "general")
+    return job_source, model
+
+
 async def _fetch_job_description(
     pg,
     job_source: JobSource,
@@ -1,5 +1,7 @@
 """Upload routes for document extraction and HTML conversion."""
 
+import asyncio
+import html
 import logging
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
@@ -25,12 +27,39 @@ router = APIRouter()
 settings = get_settings()
 
 
-ALLOWED_CONTENT_TYPES = [
-    "application/pdf",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-]
+# Allowed content types mapped to the magic bytes their files must start with
+# (DOCX is a ZIP container)
+ALLOWED_CONTENT_TYPES = {
+    "application/pdf": b"%PDF-",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": b"PK\x03\x04",
+}
+MAGIC_HEADER_BYTES = 8
 
 MAX_UPLOAD_SIZE_BYTES = settings.max_upload_size_mb * 1024 * 1024
+UPLOAD_READ_CHUNK_BYTES = 64 * 1024
+
+
+async def _read_upload_capped(file: UploadFile) -> bytes | None:
+    """Read an upload in chunks, giving up once it exceeds the size limit.
+
+    Starlette spools the request body to a temporary file, so reading it in
+    chunks means an oversize upload is rejected without ever being held in
+    memory.
+
+    Returns:
+        The file contents, or None if the file exceeds MAX_UPLOAD_SIZE_BYTES
+    """
+    if file.size is not None and file.size > MAX_UPLOAD_SIZE_BYTES:
+        return None
+
+    chunks: list[bytes] = []
+    total = 0
+    while chunk := await file.read(UPLOAD_READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > MAX_UPLOAD_SIZE_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
 
 
 @router.post("/extract", response_model=DocumentExtractionResponse)
@@ -70,13 +99,24 @@ async def extract_document(
             detail=error.model_dump(),
         )
 
-    file_bytes = await file.read()
-    file_size = len(file_bytes)
+    # Sniff the header before reading the body, so empty or mislabelled
+    # uploads are rejected after a few bytes
+    header = await file.read(MAGIC_HEADER_BYTES)
+    if not header:
+        error = UploadErrorDetail(
+            error_code=UploadErrorCode.EMPTY_FILE,
+            message="Uploaded file is empty.",
+            recoverable=False,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error.model_dump(),
+        )
 
-    if file_size > MAX_UPLOAD_SIZE_BYTES:
+    if not header.startswith(ALLOWED_CONTENT_TYPES[file.content_type]):
         error = UploadErrorDetail(
-            error_code=UploadErrorCode.FILE_TOO_LARGE,
-            message=f"File exceeds {settings.max_upload_size_mb}MB limit. Please select a smaller file.",
+            error_code=UploadErrorCode.INVALID_FILE_TYPE,
+            message="File contents do not match its type. Only PDF and DOCX files are supported.",
             recoverable=False,
         )
         raise HTTPException(
@@ -84,10 +124,13 @@ async def extract_document(
             detail=error.model_dump(),
         )
 
-    if file_size == 0:
+    await file.seek(0)
+    file_bytes = await _read_upload_capped(file)
+
+    if file_bytes is None:
         error = UploadErrorDetail(
-            error_code=UploadErrorCode.EMPTY_FILE,
-            message="Uploaded file is empty.",
+            error_code=UploadErrorCode.FILE_TOO_LARGE,
+            message=f"File exceeds {settings.max_upload_size_mb}MB limit. Please select a smaller file.",
             recoverable=False,
         )
         raise HTTPException(
@@ -95,12 +138,17 @@ async def extract_document(
             detail=error.model_dump(),
         )
 
+    file_size = len(file_bytes)
     warnings: list[str] = []
     filename = file.filename or "unknown"
 
+    # Steps 1-2 parse the document (CPU-bound), so they run in worker threads
+    # to keep the event loop free for other requests
+
     # Step 1: Extract plain text
     try:
-        extraction_result = extract_text(
+        extraction_result = await asyncio.to_thread(
+            extract_text,
             file_bytes=file_bytes,
             filename=filename,
             content_type=file.content_type,
@@ -119,16 +167,15 @@ async def extract_document(
 
     # Step 2: Convert to HTML
     try:
-        html_content = convert_to_html(
+        html_content = await asyncio.to_thread(
+            convert_to_html,
             file_bytes=file_bytes,
             content_type=file.content_type,
         )
     except DocumentConversionError as e:
         logger.warning(f"HTML conversion failed, using fallback: {e}")
         # Fallback: wrap plain text in basic HTML
-        import html as html_escape
-
-        html_content = f"<p>{html_escape.escape(extraction_result.raw_content)}</p>"
+        html_content = f"<p>{html.escape(extraction_result.raw_content)}</p>"
         warnings.append(f"HTML conversion used fallback: {str(e)}")
 
     # Step 3: Store original file in MinIO/S3 (optional, requires STORAGE_ENABLED=true)
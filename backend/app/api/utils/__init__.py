@@ -8,11 +8,16 @@ from app.api.utils.id_resolution import (
     resolve_job_id,
     resolve_resume_build_id,
 )
+from app.api.utils.pagination import decode_cursor, encode_cursor
+from app.api.utils.responses import json_response
 
 __all__ = [
     "IDResolutionError",
     "add_deprecation_headers",
+    "decode_cursor",
+    "encode_cursor",
     "is_uuid_format",
+    "json_response",
     "parse_resource_id",
     "resolve_job_id",
     "resolve_resume_build_id",
@@ -0,0 +1,47 @@
+"""
+Keyset Pagination Cursors.
+
+List endpoints hand the client an opaque cursor pointing at the last row of
+the page. The next request filters on rows sorting after that position
+instead of skipping ``offset`` rows, so every page costs the same regardless
+of depth.
+
+A cursor records the row's position in the list order: ``updated_at`` (which
+may be null for never-edited rows), ``created_at`` and the public UUID as the
+final tiebreaker. It carries the public UUID rather than the internal integer
+ID, so it never exposes internal identifiers.
+"""
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+CursorPosition = tuple[datetime | None, datetime, UUID]
+
+
+def encode_cursor(
+    updated_at: datetime | None, created_at: datetime, public_id: UUID
+) -> str:
+    """Encode a keyset position as an opaque URL-safe cursor."""
+    updated = updated_at.isoformat() if updated_at is not None else ""
+    raw = f"{updated}|{created_at.isoformat()}|{public_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode()
+        updated_at, created_at, public_id = raw.split("|", 2)
+        return (
+            datetime.fromisoformat(updated_at) if updated_at else None,
+            datetime.fromisoformat(created_at),
+            UUID(public_id),
+        )
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,42 @@
+"""
+Pre-rendered JSON Responses.
+
+FastAPI's default path for a returned Pydantic model is ``serialize_response``:
+dump the model to a dict, validate that dict against ``response_model`` a
+second time, run ``jsonable_encoder`` over it, and finally ``json.dumps``.
+For models that were just built from trusted data, all of that is overhead.
+
+``json_response`` serializes with pydantic-core's Rust JSON encoder
+(``model_dump_json``) and returns a ready ``Response``, which FastAPI passes
+through untouched. Keep ``response_model`` on the route decorator so the
+OpenAPI schema is unchanged.
+"""
+
+from collections.abc import Sequence
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def json_response(
+    content: BaseModel | Sequence[BaseModel],
+    response: Response | None = None,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Serialize an already-built response model (or list of models) to JSON.
+
+    Headers set on the injected ``response`` (e.g. deprecation headers) are
+    carried over, since FastAPI only merges them into responses it builds.
+    """
+    if isinstance(content, BaseModel):
+        body = content.model_dump_json()
+    else:
+        body = "[" + ",".join(item.model_dump_json() for item in content) + "]"
+
+    rendered = Response(
+        content=body, media_type="application/json", status_code=status_code
+    )
+    if response is not None:
+        rendered.headers.raw.extend(response.headers.raw)
+    return rendered
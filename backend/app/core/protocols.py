@@ -278,7 +278,9 @@ class IEmbeddingService(Protocol):
         Batch embed multiple documents.
 
         More efficient than individual calls for bulk operations
-        like initial resume parsing or data migration.
+        like initial resume parsing or data migration. Implementations
+        should use the provider's batch endpoint with bounded concurrency
+        and must return embeddings in input order.
 
         Args:
             contents: List of text contents to embed
@@ -289,11 +291,32 @@ class IEmbeddingService(Protocol):
         """
         ...
 
+    async def embed_many(
+        self,
+        texts: List[str],
+        task_type: str = "RETRIEVAL_DOCUMENT",
+    ) -> List[List[float]]:
+        """
+        Embed many texts of one task type with packed batch requests.
+
+        Texts are sent in as few provider requests as the provider's batch
+        limit allows, not one request per text.
+
+        Args:
+            texts: Texts to embed
+            task_type: "RETRIEVAL_DOCUMENT" or "RETRIEVAL_QUERY"
+
+        Returns:
+            Embedding vectors aligned with ``texts``
+        """
+        ...
+
     def compute_content_hash(self, content: str) -> str:
         """
-        Compute SHA-256 hash for content change detection.
+        Compute an opaque content digest for change detection.
 
         Use to check if content needs re-embedding before burning API credits.
+        Not a security primitive.
 
         Args:
             content: Text content to hash
@@ -308,6 +331,7 @@ class IEmbeddingService(Protocol):
         new_content: str,
         current_hash: str | None,
         current_embedding: List[float] | None,
+        current_sim_signature: int | None = None,
     ) -> bool:
         """
         Check if content needs (re-)embedding.
@@ -315,18 +339,32 @@ class IEmbeddingService(Protocol):
         Returns True if:
         - No existing embedding
         - No existing hash
-        - Content has changed (hash mismatch)
+        - Content has changed (hash mismatch), and is not a near-duplicate
+          of the embedded content when ``current_sim_signature`` is given
 
         Args:
             new_content: The current/new content
             current_hash: Stored content hash (or None)
             current_embedding: Stored embedding (or None)
+            current_sim_signature: Stored SimHash signature (or None)
 
         Returns:
             True if embedding is needed
         """
         ...
 
+    def compute_sim_signature(self, content: str) -> int:
+        """
+        Compute a 64-bit SimHash signature for near-duplicate detection.
+
+        Args:
+            content: Text content to sign
+
+        Returns:
+            Signed 64-bit integer signature
+        """
+        ...
+
 
 @runtime_checkable
 class IAIClient(Protocol):
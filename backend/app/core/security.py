@@ -1,34 +1,58 @@
 import asyncio
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import bcrypt
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt only reads the first 72 bytes of a password. Truncate explicitly
+# so hashes created through passlib (which truncated silently) still verify.
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+# Decoded-token cache: the same bearer token is presented on every request
+# of a session, so verified payloads are reused for a short window instead
+# of re-running the HMAC check. Keyed by a digest so raw tokens aren't kept
+# in memory; entries never outlive the token's own ``exp``.
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+
+def _password_bytes(password: str) -> bytes:
+    return password.encode("utf-8")[:_BCRYPT_MAX_PASSWORD_BYTES]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash (synchronous)."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            _password_bytes(plain_password), hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
 async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash without blocking the event loop."""
-    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password (synchronous)."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt()).decode("utf-8")
 
 
 async def get_password_hash_async(password: str) -> str:
     """Hash a password without blocking the event loop."""
-    return await asyncio.to_thread(pwd_context.hash, password)
+    return await asyncio.to_thread(get_password_hash, password)
 
 
 def create_access_token(subject: int | str, expires_delta: timedelta | None = None) -> str:
@@ -58,11 +82,34 @@ def create_refresh_token(subject: int | str) -> str:
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
-    """Decode and validate a JWT token."""
+    """Decode and validate a JWT token.
+
+    Valid payloads are cached for up to ``_TOKEN_CACHE_TTL_SECONDS`` (never
+    past ``exp``); invalid tokens are not cached.
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, payload = cached
+        if expires_at > now:
+            return dict(payload)
+        del _token_cache[key]
+
     try:
         payload = jwt.decode(
             token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
         )
-        return payload
     except JWTError:
         return None
+
+    expires_at = now + _TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so this drops the oldest entry
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[key] = (expires_at, payload)
+    return dict(payload)
@@ -70,6 +70,25 @@ class JobCRUD:
         )
         return list(result.scalars().all())
 
+    async def get_public_ids(
+        self, db: AsyncSession, *, ids: list[int], owner_id: int
+    ) -> dict[int, UUID]:
+        """
+        Map integer job IDs to public UUIDs in one owner-scoped IN query.
+
+        Selects only the two ID columns, so response mapping never pulls
+        ``raw_content`` / ``parsed_content`` for jobs it only needs to label.
+        """
+        if not ids:
+            return {}
+        result = await db.execute(
+            select(JobDescription.id, JobDescription.public_id).where(
+                JobDescription.id.in_(ids),
+                JobDescription.owner_id == owner_id,
+            )
+        )
+        return {row.id: row.public_id for row in result}
+
     async def update(
         self, db: AsyncSession, *, db_obj: JobDescription, obj_in: JobUpdate
     ) -> JobDescription:
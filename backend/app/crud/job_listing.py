@@ -7,10 +7,12 @@ full-text search, and user interaction tracking.
 
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import Integer, and_, cast, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only, selectinload
 
@@ -38,6 +40,10 @@ from app.utils.apify_helpers import (
 
 logger = logging.getLogger(__name__)
 
+# Fresh rows per batch at which inserts switch from a multi-row INSERT to
+# COPY (asyncpg only). Below this, COPY's setup outweighs the savings.
+COPY_MIN_ROWS = 100
+
 
 class JobListingRepository:
     """Repository for JobListing operations."""
@@ -160,10 +166,15 @@ class JobListingRepository:
         response payload small. Callers must not access deferred columns on
         the returned ORM instances when ``slim`` is True.
 
-        When ``known_total`` is supplied the ``SELECT COUNT(*)`` query is
-        skipped entirely and the supplied value is returned as the total.
-        Phase 4 of the job-listings caching plan uses this path to reuse a
-        count that was cached under the filter-key when paginating.
+        The total is computed in the same round trip as the page via a
+        ``COUNT(*) OVER ()`` window column, so Postgres scans the filtered
+        set once. A separate ``SELECT COUNT(*)`` only runs when the page
+        comes back empty at a non-zero offset (no row to read the total from).
+
+        When ``known_total`` is supplied the window column is omitted entirely
+        and the supplied value is returned as the total. Phase 4 of the
+        job-listings caching plan uses this path to reuse a count that was
+        cached under the filter-key when paginating.
 
         Returns tuple of (listings, total_count).
         """
@@ -304,14 +315,14 @@ class JobListingRepository:
         if filters.date_posted_after:
             conditions.append(JobListing.date_posted >= filters.date_posted_after)
 
-        # Full-text search using pg_trgm
+        # Full-text search against the generated tsvector column (GIN-indexed).
+        # plainto_tsquery ANDs the stemmed words, so "python engineers"
+        # matches a listing containing both "Python" and "engineer".
         if filters.search:
             search_term = filters.search.strip()
             conditions.append(
-                or_(
-                    JobListing.job_title.ilike(f"%{search_term}%"),
-                    JobListing.job_description.ilike(f"%{search_term}%"),
-                    JobListing.company_name.ilike(f"%{search_term}%"),
+                JobListing.search_vector.op("@@")(
+                    func.plainto_tsquery("english", search_term)
                 )
             )
 
@@ -386,14 +397,6 @@ class JobListingRepository:
             query = query.where(and_(*conditions))
             count_query = count_query.where(and_(*conditions))
 
-        # Get total count — skipped when the caller already has a cached value
-        # for the same filter key (Phase 4 count-cache path).
-        if known_total is not None:
-            total = known_total
-        else:
-            total_result = await db.execute(count_query)
-            total = total_result.scalar() or 0
-
         # Apply sorting. Fit score lives on UserJobInteraction (joined only
         # when user_id is passed) and may be NULL for unscored jobs — push
         # those to the end regardless of direction.
@@ -413,24 +416,41 @@ class JobListingRepository:
         # Apply pagination
         query = query.offset(filters.offset).limit(filters.limit)
 
-        # Execute query
-        result = await db.execute(query)
-        listings = list(result.scalars().all())
+        # Total count — skipped when the caller already has a cached value
+        # for the same filter key (Phase 4 count-cache path). Otherwise the
+        # window column rides along with the page: the window is evaluated
+        # before LIMIT/OFFSET, so every row carries the full filtered total.
+        if known_total is not None:
+            result = await db.execute(query)
+            return list(result.scalars().all()), known_total
+
+        query = query.add_columns(func.count().over().label("total"))
+        rows = (await db.execute(query)).all()
+        listings = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif filters.offset > 0:
+            # Paged past the end — no row to read the window total from.
+            total_result = await db.execute(count_query)
+            total = total_result.scalar() or 0
+        else:
+            total = 0
 
         return listings, total
 
+    _SORT_COLUMNS = {
+        SortBy.DATE_POSTED: JobListing.date_posted,
+        SortBy.SALARY_MIN: JobListing.salary_min,
+        SortBy.SALARY_MAX: JobListing.salary_max,
+        SortBy.COMPANY_NAME: JobListing.company_name,
+        SortBy.JOB_TITLE: JobListing.job_title,
+        SortBy.CREATED_AT: JobListing.created_at,
+        SortBy.FIT_SCORE: JobListing.date_posted,  # fallback when user_id unavailable
+    }
+
     def _get_sort_column(self, sort_by: SortBy):
         """Get the SQLAlchemy column for sorting."""
-        mapping = {
-            SortBy.DATE_POSTED: JobListing.date_posted,
-            SortBy.SALARY_MIN: JobListing.salary_min,
-            SortBy.SALARY_MAX: JobListing.salary_max,
-            SortBy.COMPANY_NAME: JobListing.company_name,
-            SortBy.JOB_TITLE: JobListing.job_title,
-            SortBy.CREATED_AT: JobListing.created_at,
-            SortBy.FIT_SCORE: JobListing.date_posted,  # fallback when user_id unavailable
-        }
-        return mapping.get(sort_by, JobListing.date_posted)
+        return self._SORT_COLUMNS.get(sort_by, JobListing.date_posted)
 
     async def update(
         self,
@@ -602,6 +622,124 @@ class JobListingRepository:
         result = await db.execute(query)
         return result.scalar() or 0
 
+    async def _write_upsert_batch(
+        self,
+        db: AsyncSession,
+        values_list: list[dict],
+    ) -> tuple[int, int]:
+        """
+        Insert or update one batch of prepared job listing rows.
+
+        Issues one pre-query, one multi-row INSERT (COPY for large sets of
+        new rows on asyncpg) and one executemany UPDATE-by-pk, regardless
+        of batch size.
+
+        Returns:
+            Tuple of (inserted_count, updated_count)
+        """
+        from sqlalchemy.dialects.postgresql import insert
+
+        # Intra-batch dedup under BOTH unique keys. A single scrape can
+        # repeat the same external_job_id with slightly different
+        # normalized fields (→ different dedup_hash), or repost a job
+        # under a new external_job_id with the same title/company/city.
+        by_ext: dict[str, dict] = {}
+        for v in values_list:
+            by_ext[v["external_job_id"]] = v
+        by_hash: dict[str, dict] = {}
+        for v in by_ext.values():
+            by_hash[v["dedup_hash"]] = v
+        duplicates = len(values_list) - len(by_hash)
+        if duplicates:
+            logger.info(f"Dropped {duplicates} duplicate jobs within upsert batch")
+        values_list = list(by_hash.values())
+
+        # Pre-query rows already matching either key so we can partition
+        # into INSERT vs UPDATE-by-pk. Postgres ON CONFLICT can only
+        # target one constraint, and both external_job_id and dedup_hash
+        # are unique + load-bearing (see
+        # docs/features/infrastructure/260421_external-id-upsert-fix.md).
+        ext_ids = [v["external_job_id"] for v in values_list]
+        hashes = [v["dedup_hash"] for v in values_list]
+        existing_result = await db.execute(
+            select(
+                JobListing.id,
+                JobListing.external_job_id,
+                JobListing.dedup_hash,
+            ).where(
+                or_(
+                    JobListing.external_job_id.in_(ext_ids),
+                    JobListing.dedup_hash.in_(hashes),
+                )
+            )
+        )
+        existing_by_ext: dict[str, int] = {}
+        existing_by_hash: dict[str, int] = {}
+        for row_id, ext_id, h in existing_result.all():
+            existing_by_ext[ext_id] = row_id
+            existing_by_hash[h] = row_id
+
+        to_insert: list[dict] = []
+        to_update: list[dict] = []
+        for v in values_list:
+            pk = existing_by_ext.get(v["external_job_id"]) or existing_by_hash.get(
+                v["dedup_hash"]
+            )
+            if pk is not None:
+                to_update.append({**v, "id": pk})
+            else:
+                to_insert.append(v)
+
+        if to_insert:
+            if (
+                len(to_insert) >= COPY_MIN_ROWS
+                and db.get_bind().dialect.driver == "asyncpg"
+            ):
+                await self._copy_insert(db, to_insert)
+            else:
+                await db.execute(insert(JobListing).values(to_insert))
+        if to_update:
+            # ORM bulk UPDATE by primary key: "id" selects the row and the
+            # remaining keys are SET (created_at is never among them)
+            await db.execute(update(JobListing), to_update)
+        return len(to_insert), len(to_update)
+
+    @staticmethod
+    def _to_copy_records(rows: list[dict], columns: list[str]) -> list[tuple]:
+        """Shape prepared rows as COPY records, JSON-encoding JSONB values."""
+        json_columns = {
+            name
+            for name in columns
+            if isinstance(JobListing.__table__.c[name].type, JSONB)
+        }
+        return [
+            tuple(
+                json.dumps(row[name])
+                if name in json_columns and row[name] is not None
+                else row[name]
+                for name in columns
+            )
+            for row in rows
+        ]
+
+    async def _copy_insert(self, db: AsyncSession, rows: list[dict]) -> None:
+        """
+        Insert new rows with COPY on the session's asyncpg connection.
+
+        Rows were already partitioned as new by ``_write_upsert_batch``, so
+        no conflict handling is needed. COPY runs inside the session's
+        current transaction (and savepoint), so rollback semantics match
+        the INSERT path.
+        """
+        columns = list(rows[0])
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            JobListing.__tablename__,
+            records=self._to_copy_records(rows, columns),
+            columns=columns,
+        )
+
     async def batch_upsert_from_apify(
         self,
         db: AsyncSession,
@@ -613,8 +751,10 @@ class JobListingRepository:
         """
         Batch upsert job listings from APIFY scraper data.
 
-        Uses PostgreSQL ON CONFLICT for efficient upserts with a single
-        round-trip per batch instead of one per job.
+        Each batch costs a fixed three statements (pre-query, multi-row
+        INSERT, executemany UPDATE-by-pk) instead of a round-trip per job.
+        ON CONFLICT is not used because it can only target one of the two
+        unique keys (external_job_id, dedup_hash).
 
         Args:
             db: Database session
@@ -625,13 +765,20 @@ class JobListingRepository:
         Returns:
             Tuple of (created_count, updated_count, errors)
         """
-        from sqlalchemy.dialects.postgresql import insert
-
         created_count = 0
         updated_count = 0
         errors: list[dict] = []
         now = datetime.now(timezone.utc)
 
+        # Collapse repeated job IDs across the whole scrape (last one wins) so a
+        # repeat in a later batch isn't inserted and then rewritten
+        unique_jobs = list({job.id: job for job in jobs_data}.values())
+        if len(unique_jobs) < len(jobs_data):
+            logger.info(
+                f"Dropped {len(jobs_data) - len(unique_jobs)} duplicate job IDs from scrape"
+            )
+        jobs_data = unique_jobs
+
         logger.info(f"Starting batch upsert of {len(jobs_data)} jobs from {source_platform}")
 
         # Process in batches
@@ -705,10 +852,13 @@ class JobListingRepository:
                         }
                     )
                 except Exception as e:
-                    logger.error(f"Parse error for job {getattr(job_data, 'id', 'unknown')}: {e}")
+                    # Per-job and already reported in errors: no traceback, and
+                    # lazy formatting so suppressed levels cost nothing
+                    job_id = getattr(job_data, "id", "unknown")
+                    logger.warning("Parse error for job %s: %s", job_id, e)
                     errors.append(
                         {
-                            "job_id": getattr(job_data, "id", "unknown"),
+                            "job_id": job_id,
                             "error": "parse_error",
                             "message": str(e),
                         }
@@ -718,72 +868,13 @@ class JobListingRepository:
                 logger.warning(f"Batch {i // batch_size + 1}: all jobs failed parsing, skipping")
                 continue
 
-            # Intra-batch dedup under BOTH unique keys. A single scrape can
-            # repeat the same external_job_id with slightly different
-            # normalized fields (→ different dedup_hash), or repost a job
-            # under a new external_job_id with the same title/company/city.
-            by_ext: dict[str, dict] = {}
-            for v in values_list:
-                by_ext[v["external_job_id"]] = v
-            by_hash: dict[str, dict] = {}
-            for v in by_ext.values():
-                by_hash[v["dedup_hash"]] = v
-            values_list = list(by_hash.values())
-
-            logger.info(f"Batch {i // batch_size + 1}: prepared {len(values_list)} jobs for upsert")
-
-            # Pre-query rows already matching either key so we can partition
-            # into INSERT vs UPDATE-by-pk. Postgres ON CONFLICT can only
-            # target one constraint, and both external_job_id and dedup_hash
-            # are unique + load-bearing (see
-            # docs/features/infrastructure/260421_external-id-upsert-fix.md).
-            ext_ids = [v["external_job_id"] for v in values_list]
-            hashes = [v["dedup_hash"] for v in values_list]
-            existing_result = await db.execute(
-                select(
-                    JobListing.id,
-                    JobListing.external_job_id,
-                    JobListing.dedup_hash,
-                ).where(
-                    or_(
-                        JobListing.external_job_id.in_(ext_ids),
-                        JobListing.dedup_hash.in_(hashes),
-                    )
-                )
-            )
-            existing_by_ext: dict[str, int] = {}
-            existing_by_hash: dict[str, int] = {}
-            for row_id, ext_id, h in existing_result.all():
-                existing_by_ext[ext_id] = row_id
-                existing_by_hash[h] = row_id
-
-            to_insert: list[dict] = []
-            to_update: list[tuple[int, dict]] = []
-            for v in values_list:
-                pk = existing_by_ext.get(v["external_job_id"]) or existing_by_hash.get(v["dedup_hash"])
-                if pk is not None:
-                    to_update.append((pk, v))
-                else:
-                    to_insert.append(v)
-
-            excluded_from_update = {"id", "created_at"}
-
             try:
                 async with db.begin_nested():
-                    if to_insert:
-                        await db.execute(insert(JobListing).values(to_insert))
-                    for pk, v in to_update:
-                        update_values = {
-                            k: val for k, val in v.items() if k not in excluded_from_update
-                        }
-                        await db.execute(
-                            update(JobListing).where(JobListing.id == pk).values(**update_values)
-                        )
-                    created_count += len(to_insert)
-                    updated_count += len(to_update)
+                    inserted, updated = await self._write_upsert_batch(db, values_list)
+                    created_count += inserted
+                    updated_count += updated
                     logger.info(
-                        f"Batch {i // batch_size + 1}: {len(to_insert)} inserted, "
-                        f"{len(to_update)} updated"
+                        f"Batch {i // batch_size + 1}: {inserted} inserted, {updated} updated"
                     )
             except Exception as e:
                 logger.error(f"Batch upsert error at index {i}: {e}", exc_info=True)
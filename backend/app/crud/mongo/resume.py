@@ -13,6 +13,7 @@ from app.models.mongo.resume import (
     ResumeDocument,
     ResumeUpdate,
 )
+from app.services.core.cache import CacheService
 from app.services.fit_scoring.resume_keywords import (
     compute_resume_keywords_hash,
     extract_resume_keywords,
@@ -27,6 +28,11 @@ def _fit_scoring_fields(parsed: ParsedContent) -> dict[str, Any]:
     }
 
 
+def _raw_content_hash(raw_content: str) -> str | None:
+    """Hash raw_content the way the ATS cache keys it."""
+    return CacheService.hash_content(raw_content) if raw_content else None
+
+
 class ResumeCRUD:
     """CRUD operations for MongoDB Resume collection."""
 
@@ -51,6 +57,7 @@ class ResumeCRUD:
             "user_id": obj_in.user_id,
             "title": obj_in.title,
             "raw_content": obj_in.raw_content,
+            "raw_content_hash": _raw_content_hash(obj_in.raw_content),
             "html_content": obj_in.html_content,
             "parsed": obj_in.parsed.model_dump() if obj_in.parsed else None,
             "style": obj_in.style.model_dump() if obj_in.style else None,
@@ -71,8 +78,9 @@ class ResumeCRUD:
         db: AsyncIOMotorDatabase,
         id: str,
         projection: dict[str, Any] | None = None,
+        user_id: int | None = None,
     ) -> ResumeDocument | None:
-        """Get a resume by its ObjectId.
+        """Get a resume by its ObjectId, optionally scoped to an owner.
 
         Args:
             db: MongoDB database instance
@@ -81,10 +89,15 @@ class ResumeCRUD:
                        If provided, only specified fields are returned.
                        Note: When using projection, the returned ResumeDocument may have
                        None values for non-projected fields.
+            user_id: If provided, only a resume owned by this user matches, so
+                     "not found" and "not yours" are indistinguishable.
         """
         if not ObjectId.is_valid(id):
             return None
-        doc = await db[self.collection_name].find_one({"_id": ObjectId(id)}, projection)
+        query: dict[str, Any] = {"_id": ObjectId(id)}
+        if user_id is not None:
+            query["user_id"] = user_id
+        doc = await db[self.collection_name].find_one(query, projection)
         if not doc:
             return None
 
@@ -94,6 +107,31 @@ class ResumeCRUD:
 
         return ResumeDocument(**doc)
 
+    async def get_content_hash(
+        self,
+        db: AsyncIOMotorDatabase,
+        id: str,
+    ) -> str | None:
+        """Get the hash of a resume's raw_content without loading it.
+
+        Resumes written before raw_content_hash was stored fall back to
+        loading raw_content and hashing it.
+
+        Returns:
+            The content hash, or None if the resume is missing or empty
+        """
+        if not ObjectId.is_valid(id):
+            return None
+        query = {"_id": ObjectId(id)}
+        doc = await db[self.collection_name].find_one(query, {"raw_content_hash": 1})
+        if not doc:
+            return None
+        if doc.get("raw_content_hash"):
+            return doc["raw_content_hash"]
+
+        doc = await db[self.collection_name].find_one(query, {"raw_content": 1})
+        return _raw_content_hash(doc.get("raw_content", "")) if doc else None
+
     async def get_by_user(
         self,
         db: AsyncIOMotorDatabase,
@@ -132,6 +170,7 @@ class ResumeCRUD:
         db: AsyncIOMotorDatabase,
         id: str,
         obj_in: ResumeUpdate,
+        user_id: int | None = None,
     ) -> ResumeDocument | None:
         """Update an existing resume with optimistic concurrency control.
 
@@ -139,6 +178,7 @@ class ResumeCRUD:
             db: MongoDB database instance
             id: Resume ObjectId as string
             obj_in: Update data, optionally including version field for OCC
+            user_id: If provided, only a resume owned by this user is updated
 
         Returns:
             Updated ResumeDocument if successful
@@ -155,6 +195,7 @@ class ResumeCRUD:
             update_data["title"] = obj_in.title
         if obj_in.raw_content is not None:
             update_data["raw_content"] = obj_in.raw_content
+            update_data["raw_content_hash"] = _raw_content_hash(obj_in.raw_content)
         if obj_in.html_content is not None:
             update_data["html_content"] = obj_in.html_content
         if obj_in.parsed is not None:
@@ -172,12 +213,14 @@ class ResumeCRUD:
 
         if not update_data:
             # No fields to update, just return current document
-            return await self.get(db, id)
+            return await self.get(db, id, user_id=user_id)
 
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         # Build filter - include version check if version provided (OCC)
         filter_query: dict[str, Any] = {"_id": ObjectId(id)}
+        if user_id is not None:
+            filter_query["user_id"] = user_id
         if obj_in.version is not None:
             filter_query["version"] = obj_in.version
 
@@ -196,8 +239,7 @@ class ResumeCRUD:
         if result is None:
             # If version was provided and no match, check if document exists
             if obj_in.version is not None:
-                existing = await self.get(db, id)
-                if existing is not None:
+                if await self.exists(db, id, user_id=user_id):
                     # Document exists but version didn't match - conflict!
                     raise VersionConflictError(
                         document_id=id,
@@ -216,11 +258,15 @@ class ResumeCRUD:
         self,
         db: AsyncIOMotorDatabase,
         id: str,
+        user_id: int | None = None,
     ) -> bool:
-        """Delete a resume by its ObjectId."""
+        """Delete a resume by its ObjectId, optionally scoped to an owner."""
         if not ObjectId.is_valid(id):
             return False
-        result = await db[self.collection_name].delete_one({"_id": ObjectId(id)})
+        query: dict[str, Any] = {"_id": ObjectId(id)}
+        if user_id is not None:
+            query["user_id"] = user_id
+        result = await db[self.collection_name].delete_one(query)
         return result.deleted_count > 0
 
     async def delete_by_user(
@@ -18,6 +18,7 @@ from app.models.mongo.tailored_resume import (
     TailoredResumeDocument,
     TailoredResumeFinalize,
     TailoredResumeStatus,
+    TailoredResumeSummary,
     TailoredResumeUpdate,
 )
 
@@ -40,6 +41,26 @@ class TailoredResumeCRUD:
     collection_name = "tailored_resumes"
     resumes_collection = "resumes"
 
+    # Fields backing TailoredResumeSummary (list views)
+    SUMMARY_PROJECTION = {
+        "resume_id": 1,
+        "job_source": 1,
+        "status": 1,
+        "match_score": 1,
+        "job_title": 1,
+        "company_name": 1,
+        "created_at": 1,
+        "updated_at": 1,
+    }
+
+    @staticmethod
+    def _id_query(id: str, user_id: int | None) -> dict[str, Any]:
+        """Filter for one document, scoped to its owner when user_id is given."""
+        query: dict[str, Any] = {"_id": ObjectId(id)}
+        if user_id is not None:
+            query["user_id"] = user_id
+        return query
+
     async def create(
         self,
         db: AsyncIOMotorDatabase,
@@ -74,24 +95,43 @@ class TailoredResumeCRUD:
         db: AsyncIOMotorDatabase,
         id: str,
         projection: dict[str, Any] | None = None,
+        user_id: int | None = None,
     ) -> TailoredResumeDocument | None:
-        """Get a tailored resume by its ObjectId.
+        """Get a tailored resume by its ObjectId, optionally scoped to an owner.
 
         Args:
             db: MongoDB database instance
             id: TailoredResume ObjectId as string
             projection: Optional MongoDB projection dict to limit returned fields.
                        When using projection, non-projected fields will be None.
+            user_id: If provided, only a document owned by this user matches
         """
         if not ObjectId.is_valid(id):
             return None
-        doc = await db[self.collection_name].find_one({"_id": ObjectId(id)}, projection)
+        doc = await db[self.collection_name].find_one(
+            self._id_query(id, user_id), projection
+        )
         return TailoredResumeDocument(**doc) if doc else None
 
+    async def get_summary(
+        self,
+        db: AsyncIOMotorDatabase,
+        id: str,
+        user_id: int | None = None,
+    ) -> TailoredResumeSummary | None:
+        """Get a tailored resume's summary fields only (no resume content)."""
+        if not ObjectId.is_valid(id):
+            return None
+        doc = await db[self.collection_name].find_one(
+            self._id_query(id, user_id), self.SUMMARY_PROJECTION
+        )
+        return TailoredResumeSummary(**doc) if doc else None
+
     async def get_compare_data(
         self,
         db: AsyncIOMotorDatabase,
         id: str,
+        user_id: int | None = None,
     ) -> CompareData | None:
         """Get both original resume's parsed content and tailored resume for frontend diffing.
 
@@ -105,7 +145,9 @@ class TailoredResumeCRUD:
             return None
 
         # Get the tailored resume
-        tailored_doc = await db[self.collection_name].find_one({"_id": ObjectId(id)})
+        tailored_doc = await db[self.collection_name].find_one(
+            self._id_query(id, user_id)
+        )
         if not tailored_doc:
             return None
 
@@ -127,32 +169,42 @@ class TailoredResumeCRUD:
             original_parsed=original_parsed,
         )
 
-    async def get_by_resume(
+    async def _list_summaries(
         self,
         db: AsyncIOMotorDatabase,
-        resume_id: str,
-        status: TailoredResumeStatus | None = None,
-        skip: int = 0,
-        limit: int = 100,
-        projection: dict[str, Any] | None = None,
-    ) -> list[TailoredResumeDocument]:
-        """Get all tailored resumes for a base resume, optionally filtered by status."""
-        if not ObjectId.is_valid(resume_id):
-            return []
-
-        query: dict[str, Any] = {"resume_id": ObjectId(resume_id)}
+        query: dict[str, Any],
+        status: TailoredResumeStatus | None,
+        skip: int,
+        limit: int,
+    ) -> list[TailoredResumeSummary]:
+        """Run a list query, newest first, returning list-view summaries."""
         if status is not None:
             query["status"] = status.value
 
         cursor = (
             db[self.collection_name]
-            .find(query, projection)
+            .find(query, self.SUMMARY_PROJECTION)
             .sort("updated_at", -1)
             .skip(skip)
             .limit(limit)
         )
         docs = await cursor.to_list(length=limit)
-        return [TailoredResumeDocument(**doc) for doc in docs]
+        return [TailoredResumeSummary(**doc) for doc in docs]
+
+    async def get_by_resume(
+        self,
+        db: AsyncIOMotorDatabase,
+        resume_id: str,
+        status: TailoredResumeStatus | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TailoredResumeSummary]:
+        """Get all tailored resumes for a base resume, optionally filtered by status."""
+        if not ObjectId.is_valid(resume_id):
+            return []
+        return await self._list_summaries(
+            db, {"resume_id": ObjectId(resume_id)}, status, skip, limit
+        )
 
     async def get_by_user(
         self,
@@ -161,50 +213,36 @@ class TailoredResumeCRUD:
         status: TailoredResumeStatus | None = None,
         skip: int = 0,
         limit: int = 100,
-        projection: dict[str, Any] | None = None,
-    ) -> list[TailoredResumeDocument]:
+    ) -> list[TailoredResumeSummary]:
         """Get all tailored resumes for a user, optionally filtered by status."""
-        query: dict[str, Any] = {"user_id": user_id}
-        if status is not None:
-            query["status"] = status.value
-
-        cursor = (
-            db[self.collection_name]
-            .find(query, projection)
-            .sort("updated_at", -1)
-            .skip(skip)
-            .limit(limit)
-        )
-        docs = await cursor.to_list(length=limit)
-        return [TailoredResumeDocument(**doc) for doc in docs]
+        return await self._list_summaries(db, {"user_id": user_id}, status, skip, limit)
 
     async def get_by_job_source(
         self,
         db: AsyncIOMotorDatabase,
         job_source_type: Literal["user_created", "job_listing"],
         job_source_id: int,
+        user_id: int,
         status: TailoredResumeStatus | None = None,
-        projection: dict[str, Any] | None = None,
-    ) -> list[TailoredResumeDocument]:
-        """Get all tailored resumes for a specific job."""
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TailoredResumeSummary]:
+        """Get a user's tailored resumes for a specific job."""
         query: dict[str, Any] = {
             "job_source.type": job_source_type,
             "job_source.id": job_source_id,
+            "user_id": user_id,
         }
-        if status is not None:
-            query["status"] = status.value
-
-        cursor = db[self.collection_name].find(query, projection)
-        docs = await cursor.to_list(length=100)
-        return [TailoredResumeDocument(**doc) for doc in docs]
+        return await self._list_summaries(db, query, status, skip, limit)
 
     async def update(
         self,
         db: AsyncIOMotorDatabase,
         id: str,
         obj_in: TailoredResumeUpdate,
+        user_id: int | None = None,
     ) -> TailoredResumeDocument | None:
-        """Update an existing tailored resume."""
+        """Update an existing tailored resume, optionally scoped to an owner."""
         if not ObjectId.is_valid(id):
             return None
 
@@ -222,12 +260,12 @@ class TailoredResumeCRUD:
             update_data["style_settings"] = obj_in.style_settings
 
         if not update_data:
-            return await self.get(db, id)
+            return await self.get(db, id, user_id=user_id)
 
         update_data["updated_at"] = datetime.now(timezone.utc)
 
         result = await db[self.collection_name].find_one_and_update(
-            {"_id": ObjectId(id)},
+            self._id_query(id, user_id),
             {"$set": update_data},
             return_document=True,
         )
@@ -238,19 +276,26 @@ class TailoredResumeCRUD:
         db: AsyncIOMotorDatabase,
         id: str,
         obj_in: TailoredResumeFinalize,
+        user_id: int | None = None,
     ) -> TailoredResumeDocument | None:
         """Finalize a tailored resume with the user's approved changes.
 
         This is called when the user clicks "Finalize" after accepting/rejecting
         sections on the frontend. The finalized_data is the merged document
         the user built by accepting some AI changes and keeping some originals.
+
+        Only a not-yet-finalized document (owned by ``user_id``, if given)
+        matches, so the status check and the write are one atomic operation.
         """
         if not ObjectId.is_valid(id):
             return None
 
+        query = self._id_query(id, user_id)
+        query["status"] = {"$ne": TailoredResumeStatus.FINALIZED.value}
+
         now = datetime.now(timezone.utc)
         result = await db[self.collection_name].find_one_and_update(
-            {"_id": ObjectId(id)},
+            query,
             {
                 "$set": {
                     "finalized_data": obj_in.finalized_data,
@@ -314,11 +359,12 @@ class TailoredResumeCRUD:
         self,
         db: AsyncIOMotorDatabase,
         id: str,
+        user_id: int | None = None,
     ) -> bool:
-        """Delete a tailored resume by its ObjectId."""
+        """Delete a tailored resume by its ObjectId, optionally scoped to an owner."""
         if not ObjectId.is_valid(id):
             return False
-        result = await db[self.collection_name].delete_one({"_id": ObjectId(id)})
+        result = await db[self.collection_name].delete_one(self._id_query(id, user_id))
         return result.deleted_count > 0
 
     async def delete_by_resume(
@@ -350,10 +396,9 @@ class TailoredResumeCRUD:
         """Check if a tailored resume exists, optionally verifying ownership."""
         if not ObjectId.is_valid(id):
             return False
-        query: dict[str, Any] = {"_id": ObjectId(id)}
-        if user_id is not None:
-            query["user_id"] = user_id
-        doc = await db[self.collection_name].find_one(query, {"_id": 1})
+        doc = await db[self.collection_name].find_one(
+            self._id_query(id, user_id), {"_id": 1}
+        )
         return doc is not None
 
 
@@ -10,7 +10,22 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    ARRAY,
+    ColumnElement,
+    Integer,
+    Text,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.protocols import (
@@ -20,6 +35,36 @@ from app.core.protocols import (
 )
 from app.models.resume_build import ResumeBuild
 
+# Listing order: most recently edited first (never-edited builds, whose
+# updated_at is still NULL, lead as in Postgres' default DESC NULLS FIRST),
+# then newest created. public_id breaks exact ties so keyset cursors see a
+# total order.
+_LIST_ORDER = (
+    ResumeBuild.updated_at.desc().nullsfirst(),
+    ResumeBuild.created_at.desc(),
+    ResumeBuild.public_id.desc(),
+)
+
+
+def _after_position(
+    before: tuple[datetime | None, datetime, UUID],
+) -> ColumnElement[bool]:
+    """Condition matching rows that sort after ``before`` in ``_LIST_ORDER``."""
+    updated_at, created_at, public_id = before
+    tail = tuple_(ResumeBuild.created_at, ResumeBuild.public_id) < tuple_(
+        created_at, public_id
+    )
+    if updated_at is None:
+        # Every edited build sorts after the NULL updated_at group
+        return or_(
+            ResumeBuild.updated_at.is_not(None),
+            and_(ResumeBuild.updated_at.is_(None), tail),
+        )
+    return or_(
+        ResumeBuild.updated_at < updated_at,
+        and_(ResumeBuild.updated_at == updated_at, tail),
+    )
+
 
 def _resume_build_to_data(resume_build: ResumeBuild) -> ResumeBuildData:
     """Convert ResumeBuild model to ResumeBuildData TypedDict."""
@@ -67,9 +112,9 @@ class ResumeBuildRepository:
             pulled_block_ids=[],
             pending_diffs=[],
         )
+        # INSERT ... RETURNING id, created_at (eager_defaults); no refresh
         db.add(db_obj)
         await db.flush()
-        await db.refresh(db_obj)
         return _resume_build_to_data(db_obj)
 
     async def get(
@@ -80,15 +125,9 @@ class ResumeBuildRepository:
         user_id: int,
     ) -> ResumeBuildData | None:
         """Get resume build by ID with user ownership check."""
-        result = await db.execute(
-            select(ResumeBuild).where(
-                and_(
-                    ResumeBuild.id == resume_build_id,
-                    ResumeBuild.user_id == user_id,
-                )
-            )
+        resume_build = await self.get_model(
+            db, resume_build_id=resume_build_id, user_id=user_id
         )
-        resume_build = result.scalar_one_or_none()
         return _resume_build_to_data(resume_build) if resume_build else None
 
     async def get_model(
@@ -98,16 +137,17 @@ class ResumeBuildRepository:
         resume_build_id: int,
         user_id: int,
     ) -> ResumeBuild | None:
-        """Get the raw SQLAlchemy model (for internal use)."""
-        result = await db.execute(
-            select(ResumeBuild).where(
-                and_(
-                    ResumeBuild.id == resume_build_id,
-                    ResumeBuild.user_id == user_id,
-                )
-            )
-        )
-        return result.scalar_one_or_none()
+        """
+        Get the raw SQLAlchemy model (for internal use).
+
+        Uses ``Session.get`` so a build the route already resolved (by public
+        ID) comes straight from the identity map; every mutation below starts
+        here, so a resolve-then-mutate request costs one SELECT, not three.
+        """
+        resume_build = await db.get(ResumeBuild, resume_build_id)
+        if resume_build is None or resume_build.user_id != user_id:
+            return None
+        return resume_build
 
     async def get_by_public_id(
         self,
@@ -146,6 +186,17 @@ class ResumeBuildRepository:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _list_conditions(user_id: int, status: ResumeBuildStatus | None) -> list:
+        """Owner and optional status filters shared by listing and counting."""
+        conditions = [ResumeBuild.user_id == user_id]
+        if status is not None:
+            status_value = (
+                status.value if isinstance(status, ResumeBuildStatus) else status
+            )
+            conditions.append(ResumeBuild.status == status_value)
+        return conditions
+
     async def list_builds(
         self,
         db: AsyncSession,
@@ -154,24 +205,63 @@ class ResumeBuildRepository:
         status: ResumeBuildStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        before: tuple[datetime | None, datetime, UUID] | None = None,
     ) -> list[ResumeBuildData]:
-        """List user's resume builds with optional status filter."""
-        conditions = [ResumeBuild.user_id == user_id]
+        """
+        List user's resume builds with optional status filter.
 
-        if status is not None:
-            status_value = status.value if isinstance(status, ResumeBuildStatus) else status
-            conditions.append(ResumeBuild.status == status_value)
+        Ordered most recently updated first. Pass ``before`` (the
+        ``(updated_at, created_at, public_id)`` of the last row of the
+        previous page) for keyset pagination; ``offset`` is kept for legacy
+        callers and should stay 0 when ``before`` is set.
+        """
+        conditions = self._list_conditions(user_id, status)
+
+        if before is not None:
+            conditions.append(_after_position(before))
 
         result = await db.execute(
             select(ResumeBuild)
             .where(and_(*conditions))
-            .order_by(ResumeBuild.updated_at.desc().nullsfirst(), ResumeBuild.created_at.desc())
+            .order_by(*_LIST_ORDER)
             .offset(offset)
             .limit(limit)
         )
         resume_builds = result.scalars().all()
         return [_resume_build_to_data(rb) for rb in resume_builds]
 
+    async def list_builds_with_count(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        status: ResumeBuildStatus | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[ResumeBuildData], int]:
+        """
+        List an offset page of resume builds together with the total count.
+
+        The total rides along as ``COUNT(*) OVER ()`` on each row, so a page
+        costs one query instead of a list plus a count. Only a page past the
+        end (no rows to carry the total) falls back to ``count``.
+        """
+        result = await db.execute(
+            select(ResumeBuild, func.count().over().label("total"))
+            .where(and_(*self._list_conditions(user_id, status)))
+            .order_by(*_LIST_ORDER)
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            total = await self.count(db, user_id=user_id, status=status)
+        else:
+            total = 0
+        return [_resume_build_to_data(row.ResumeBuild) for row in rows], total
+
     async def count(
         self,
         db: AsyncSession,
@@ -180,17 +270,42 @@ class ResumeBuildRepository:
         status: ResumeBuildStatus | None = None,
     ) -> int:
         """Count resume builds matching filters."""
-        conditions = [ResumeBuild.user_id == user_id]
-
-        if status is not None:
-            status_value = status.value if isinstance(status, ResumeBuildStatus) else status
-            conditions.append(ResumeBuild.status == status_value)
+        conditions = self._list_conditions(user_id, status)
 
         result = await db.execute(
             select(func.count(ResumeBuild.id)).where(and_(*conditions))
         )
         return result.scalar() or 0
 
+    async def update_details(
+        self,
+        db: AsyncSession,
+        *,
+        resume_build_id: int,
+        user_id: int,
+        fields: dict[str, Any],
+    ) -> ResumeBuildData | None:
+        """
+        Update basic resume build columns (job title, company, description).
+
+        One UPDATE ... RETURNING writes the fields and reads the row back,
+        including the new updated_at.
+        """
+        if not fields:
+            return await self.get(db, resume_build_id=resume_build_id, user_id=user_id)
+
+        stmt = (
+            update(ResumeBuild)
+            .where(ResumeBuild.id == resume_build_id, ResumeBuild.user_id == user_id)
+            .values(**fields)
+            .returning(ResumeBuild)
+            # Refresh the instance already in the identity map from RETURNING
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        resume_build = result.scalar_one_or_none()
+        return _resume_build_to_data(resume_build) if resume_build else None
+
     async def update_sections(
         self,
         db: AsyncSession,
@@ -199,23 +314,44 @@ class ResumeBuildRepository:
         user_id: int,
         sections: dict[str, Any],
     ) -> ResumeBuildData | None:
-        """Update resume build content sections (merge with existing)."""
-        resume_build = await self.get_model(db, resume_build_id=resume_build_id, user_id=user_id)
-        if not resume_build:
-            return None
-
-        # Merge new sections with existing
-        current_sections = dict(resume_build.sections or {})
-        current_sections.update(sections)
-        resume_build.sections = current_sections
+        """
+        Update resume build content sections (merge with existing).
 
-        # Auto-transition to in_progress when editing
-        if resume_build.status == ResumeBuildStatus.DRAFT.value:
-            resume_build.status = ResumeBuildStatus.IN_PROGRESS.value
+        The merge runs in Postgres as one UPDATE ... RETURNING, so concurrent
+        edits to different sections don't overwrite each other. Top-level
+        keys passed as null are removed.
+        """
+        removed_keys = [key for key, value in sections.items() if value is None]
+        patch = {key: value for key, value in sections.items() if value is not None}
 
-        db.add(resume_build)
-        await db.flush()
-        await db.refresh(resume_build)
+        merged = func.coalesce(ResumeBuild.sections, cast({}, JSONB)).op("||")(
+            literal(patch, JSONB)
+        )
+        if removed_keys:
+            merged = merged.op("-")(literal(removed_keys, ARRAY(Text)))
+
+        stmt = (
+            update(ResumeBuild)
+            .where(ResumeBuild.id == resume_build_id, ResumeBuild.user_id == user_id)
+            .values(
+                sections=merged,
+                # Auto-transition to in_progress when editing
+                status=case(
+                    (
+                        ResumeBuild.status == ResumeBuildStatus.DRAFT.value,
+                        ResumeBuildStatus.IN_PROGRESS.value,
+                    ),
+                    else_=ResumeBuild.status,
+                ),
+            )
+            .returning(ResumeBuild)
+            # Refresh the instance already in the identity map from RETURNING
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        resume_build = result.scalar_one_or_none()
+        if not resume_build:
+            return None
         return _resume_build_to_data(resume_build)
 
     async def pull_blocks(
@@ -226,23 +362,39 @@ class ResumeBuildRepository:
         user_id: int,
         block_ids: list[int],
     ) -> ResumeBuildData | None:
-        """Pull blocks from Vault into resume build."""
+        """
+        Pull blocks from Vault into resume build.
+
+        Appends only block IDs not already pulled, preserving request order.
+        No write is issued when nothing would change.
+        """
         resume_build = await self.get_model(db, resume_build_id=resume_build_id, user_id=user_id)
         if not resume_build:
             return None
 
-        # Add new block IDs, avoiding duplicates
-        current_ids = set(resume_build.pulled_block_ids or [])
-        new_ids = current_ids | set(block_ids)
-        resume_build.pulled_block_ids = list(new_ids)
+        # Single pass: keep first occurrence of each ID not already pulled
+        current_ids = resume_build.pulled_block_ids or []
+        seen = set(current_ids)
+        newly_pulled = []
+        for block_id in block_ids:
+            if block_id not in seen:
+                seen.add(block_id)
+                newly_pulled.append(block_id)
+
+        is_draft = resume_build.status == ResumeBuildStatus.DRAFT.value
+        if not newly_pulled and not is_draft:
+            return _resume_build_to_data(resume_build)
+
+        if newly_pulled:
+            resume_build.pulled_block_ids = current_ids + newly_pulled
 
         # Auto-transition to in_progress when pulling blocks
-        if resume_build.status == ResumeBuildStatus.DRAFT.value:
+        if is_draft:
             resume_build.status = ResumeBuildStatus.IN_PROGRESS.value
 
+        # Single UPDATE ... RETURNING updated_at (eager_defaults); no refresh
         db.add(resume_build)
         await db.flush()
-        await db.refresh(resume_build)
         return _resume_build_to_data(resume_build)
 
     async def remove_block(
@@ -264,7 +416,6 @@ class ResumeBuildRepository:
             ]
             db.add(resume_build)
             await db.flush()
-            await db.refresh(resume_build)
 
         return _resume_build_to_data(resume_build)
 
@@ -276,20 +427,16 @@ class ResumeBuildRepository:
         user_id: int,
         diffs: list[DiffSuggestionData],
     ) -> ResumeBuildData | None:
-        """Add AI-generated diff suggestions."""
-        resume_build = await self.get_model(db, resume_build_id=resume_build_id, user_id=user_id)
-        if not resume_build:
-            return None
-
-        # Append new diffs to existing
-        current_diffs = list(resume_build.pending_diffs or [])
-        current_diffs.extend(diffs)
-        resume_build.pending_diffs = current_diffs
+        """
+        Add AI-generated diff suggestions.
 
-        db.add(resume_build)
-        await db.flush()
-        await db.refresh(resume_build)
-        return _resume_build_to_data(resume_build)
+        The append runs in Postgres (``pending_diffs || :diffs``), so only the
+        new diffs go over the wire, not the whole array.
+        """
+        appended = func.coalesce(ResumeBuild.pending_diffs, cast([], JSONB)).op("||")(
+            literal(list(diffs), JSONB)
+        )
+        return await self._update_pending_diffs(db, resume_build_id, user_id, appended)
 
     async def accept_diff(
         self,
@@ -324,9 +471,9 @@ class ResumeBuildRepository:
             resume_build.pending_diffs[:diff_index] + resume_build.pending_diffs[diff_index + 1:]
         )
 
+        # Single UPDATE ... RETURNING updated_at (eager_defaults); no refresh
         db.add(resume_build)
         await db.flush()
-        await db.refresh(resume_build)
         return _resume_build_to_data(resume_build)
 
     async def reject_diff(
@@ -345,15 +492,29 @@ class ResumeBuildRepository:
         if not resume_build.pending_diffs or diff_index >= len(resume_build.pending_diffs):
             return _resume_build_to_data(resume_build)
 
-        # Remove the diff without applying
-        resume_build.pending_diffs = (
-            resume_build.pending_diffs[:diff_index] + resume_build.pending_diffs[diff_index + 1:]
-        )
+        # Remove the diff without applying (jsonb - integer drops by index)
+        remaining = ResumeBuild.pending_diffs.op("-")(literal(diff_index, Integer))
+        return await self._update_pending_diffs(db, resume_build_id, user_id, remaining)
 
-        db.add(resume_build)
-        await db.flush()
-        await db.refresh(resume_build)
-        return _resume_build_to_data(resume_build)
+    async def _update_pending_diffs(
+        self,
+        db: AsyncSession,
+        resume_build_id: int,
+        user_id: int,
+        pending_diffs: Any,
+    ) -> ResumeBuildData | None:
+        """Set pending_diffs to a SQL expression with one UPDATE ... RETURNING."""
+        stmt = (
+            update(ResumeBuild)
+            .where(ResumeBuild.id == resume_build_id, ResumeBuild.user_id == user_id)
+            .values(pending_diffs=pending_diffs)
+            .returning(ResumeBuild)
+            # Refresh the instance already in the identity map from RETURNING
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        resume_build = result.scalar_one_or_none()
+        return _resume_build_to_data(resume_build) if resume_build else None
 
     async def update_status(
         self,
@@ -374,9 +535,9 @@ class ResumeBuildRepository:
         if status == ResumeBuildStatus.EXPORTED:
             resume_build.exported_at = datetime.now(timezone.utc)
 
+        # Single UPDATE ... RETURNING updated_at (eager_defaults); no refresh
         db.add(resume_build)
         await db.flush()
-        await db.refresh(resume_build)
         return _resume_build_to_data(resume_build)
 
     async def delete(
@@ -411,7 +572,6 @@ class ResumeBuildRepository:
         resume_build.job_embedding = embedding
         db.add(resume_build)
         await db.flush()
-        await db.refresh(resume_build)
         return _resume_build_to_data(resume_build)
 
     async def clear_pending_diffs(
@@ -427,9 +587,9 @@ class ResumeBuildRepository:
             return None
 
         resume_build.pending_diffs = []
+        # Single UPDATE ... RETURNING updated_at (eager_defaults); no refresh
         db.add(resume_build)
         await db.flush()
-        await db.refresh(resume_build)
         return _resume_build_to_data(resume_build)
 
     def _apply_diff(
@@ -1,7 +1,6 @@
 """Redis connection management using redis.asyncio."""
 
-import redis.asyncio as redis
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.core.config import get_settings
 
@@ -22,11 +21,14 @@ async def connect_redis() -> None:
 
     Supports both redis:// (local) and rediss:// (TLS, e.g., Upstash) protocols.
     """
-    redis_db.client = redis.from_url(
+    pool = BlockingConnectionPool.from_url(
         settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        timeout=settings.redis_pool_timeout,
         encoding="utf-8",
         decode_responses=True,
     )
+    redis_db.client = Redis(connection_pool=pool)
 
     # Verify connection is working
     await redis_db.client.ping()
@@ -35,7 +37,7 @@ async def connect_redis() -> None:
 async def close_redis() -> None:
     """Close Redis connection on application shutdown."""
     if redis_db.client:
-        await redis_db.client.aclose()
+        await redis_db.client.aclose(close_connection_pool=True)
 
 
 def get_redis() -> Redis:
@@ -1,5 +1,6 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+from pydantic_core import from_json, to_json
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
@@ -8,29 +9,63 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
-# Use NullPool when connecting through Supabase's PgBouncer pooler (port 6543).
-# This delegates all connection pooling to Supabase, avoiding double-pooling
-# and reducing connection exhaustion on free tier.
-#
-# For direct connections (port 5432), you would instead configure:
-#   pool_size=2, max_overflow=3, pool_timeout=30, pool_recycle=300, pool_pre_ping=True
+
+def _engine_options() -> dict[str, Any]:
+    """Pool and driver options for the async engine.
+
+    Default (``db_pool_size == 0``): NullPool, for Supabase's PgBouncer pooler
+    (port 6543). This delegates all connection pooling to Supabase, avoiding
+    double-pooling and reducing connection exhaustion on free tier.
+
+    Direct connections (port 5432) set ``DB_POOL_SIZE`` to get a sized
+    in-process pool with pre-ping and recycling. Connections are then
+    long-lived and never rotated by a pooler, so asyncpg's per-connection
+    prepared-statement cache is left enabled and hot queries (job listing
+    list/get) skip re-planning after their first execution on a connection.
+    """
+    if settings.db_pool_size > 0:
+        return {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
+    return {
+        "poolclass": NullPool,
+        "connect_args": {
+            # Disable asyncpg's built-in statement cache (default: 100).
+            # Required when behind Supavisor/PgBouncer — without this,
+            # asyncpg skips mark_unprepared() on unnamed statements,
+            # causing "prepared statement does not exist" after connection rotation.
+            "statement_cache_size": 0,
+            # Disable SQLAlchemy's adapter-level prepared-statement LRU cache.
+            "prepared_statement_cache_size": 0,
+            # Force unnamed statements so PostgreSQL never stores named
+            # statements that become stale after pooler connection rotation.
+            "prepared_statement_name_func": lambda: "",
+        },
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB bind values with pydantic-core instead of stdlib json.
+
+    JSONB columns carry large payloads (768-float embedding vectors, resume
+    sections); pydantic-core encodes and decodes them several times faster.
+    """
+    return to_json(value).decode()
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.environment == "development",
     future=True,
-    poolclass=NullPool,
-    connect_args={
-        # Disable asyncpg's built-in statement cache (default: 100).
-        # Required when behind Supavisor/PgBouncer — without this,
-        # asyncpg skips mark_unprepared() on unnamed statements,
-        # causing "prepared statement does not exist" after connection rotation.
-        "statement_cache_size": 0,
-        # Disable SQLAlchemy's adapter-level prepared-statement LRU cache.
-        "prepared_statement_cache_size": 0,
-        # Force unnamed statements so PostgreSQL never stores named
-        # statements that become stale after pooler connection rotation.
-        "prepared_statement_name_func": lambda: "",
-    },
+    query_cache_size=settings.db_query_cache_size,
+    json_serializer=_json_serializer,
+    json_deserializer=from_json,
+    **_engine_options(),
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -20,6 +20,7 @@ from app.crud.mongo.exceptions import VersionConflictError
 from app.db.mongodb import close_mongodb, connect_mongodb, get_mongodb
 from app.db.redis import close_redis, connect_redis, get_redis
 from app.db.session import AsyncSessionLocal, engine
+from app.middleware.body_size_limit import BodySizeLimitMiddleware
 from app.middleware.rate_limiter import RateLimitConfig, RateLimitMiddleware
 from app.services.document.converter import DocumentConversionError
 from app.services.scraping.apify_client import ApifyClientError
@@ -349,6 +350,12 @@ async def redis_error_handler(request: Request, exc: RedisError) -> JSONResponse
 
 
 # Add middleware in order (last added = first executed)
+# Request body size limit (rejects oversized bodies before routes parse them)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_bytes=settings.max_request_body_mb * 1024 * 1024,
+)
+
 # Rate limiting middleware
 if settings.rate_limit_enabled:
     rate_limit_config = RateLimitConfig(
@@ -3,10 +3,12 @@ Middleware Package
 
 Contains FastAPI middleware for cross-cutting concerns:
 - Rate limiting
+- Request body size limits
 - Audit logging
 - Request/response logging
 """
 
+from app.middleware.body_size_limit import BodySizeLimitMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware, rate_limit_settings
 
-__all__ = ["RateLimitMiddleware", "rate_limit_settings"]
+__all__ = ["BodySizeLimitMiddleware", "RateLimitMiddleware", "rate_limit_settings"]
@@ -0,0 +1,73 @@
+"""
+Request Body Size Limit Middleware
+
+Rejects oversized request bodies before the route parses them. Batch
+ingestion and document upload payloads are otherwise read and parsed in
+full before any schema limit (e.g. ``max_length`` on ``jobs``) can apply.
+
+- Requests declaring a ``Content-Length`` over the limit get an immediate
+  413 without reading the body.
+- Bodies without a ``Content-Length`` (chunked) are counted as they
+  stream in and rejected once they pass the limit.
+
+Implemented as plain ASGI middleware rather than ``BaseHTTPMiddleware`` so
+request and response bodies are streamed through untouched.
+"""
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+
+class BodySizeLimitMiddleware:
+    """Reject request bodies larger than ``max_body_bytes`` with 413."""
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    def _too_large_detail(self) -> str:
+        limit_mb = self.max_body_bytes / (1024 * 1024)
+        return f"Request body exceeds {limit_mb:g}MB limit"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        content_length: int | None = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    content_length = None
+                break
+
+        if content_length is not None and content_length > self.max_body_bytes:
+            response = JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"detail": self._too_large_detail()},
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised while the route reads its body, so FastAPI's
+                    # HTTPException handler renders the 413
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self._too_large_detail(),
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -9,14 +9,17 @@ not user-owned but system-wide resources.
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     DateTime,
+    Float,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.db.session import Base
@@ -57,6 +60,9 @@ class JobListing(Base):
     job_description_html = Column(Text, nullable=True)  # HTML formatted description
     extracted_keywords = Column(JSONB, nullable=True)  # Fit-scoring keywords + extracted_at
     description_embedding = Column(JSONB, nullable=True)  # list[float] for v4 hybrid scorer
+    # Per-vector int8 quantization of description_embedding (768 bytes + scale)
+    description_embedding_q8 = Column(LargeBinary, nullable=True)
+    description_embedding_scale = Column(Float, nullable=True)
     job_url = Column(String(2000), nullable=False)
     job_url_direct = Column(String(2000), nullable=True)
     apply_url = Column(String(2000), nullable=True)  # Direct application link
@@ -82,6 +88,22 @@ class JobListing(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Full-text search document, maintained by Postgres (migration
+    # 20261016_0002) and backed by the ix_job_listings_search_vector GIN index.
+    # Deferred so full-row loads never pull it.
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', "
+                "coalesce(job_title, '') || ' ' || "
+                "coalesce(company_name, '') || ' ' || "
+                "coalesce(job_description, ''))",
+                persisted=True,
+            ),
+        )
+    )
+
     # Relationships
     user_interactions = relationship(
         "UserJobInteraction",
@@ -121,6 +143,9 @@ class JobListing(Base):
         # - ix_job_listings_job_function_gin
         # - ix_job_listings_industry_gin
         # - ix_job_listings_company_name_gin
+        #
+        # Full-text GIN index (created via migration 20261016_0002, not declarative):
+        # - ix_job_listings_search_vector: search_vector
     )
 
     def __repr__(self) -> str:
@@ -36,6 +36,7 @@ from app.models.mongo.tailored_resume import (
     TailoredResumeDocument,
     TailoredResumeFinalize,
     TailoredResumeStatus,
+    TailoredResumeSummary,
     TailoredResumeUpdate,
 )
 
@@ -57,6 +58,7 @@ __all__ = [
     "TailoredResumeUpdate",
     "TailoredResumeFinalize",
     "TailoredResumeStatus",
+    "TailoredResumeSummary",
     "JobSource",
     "ATSKeywords",
     # Resume Build
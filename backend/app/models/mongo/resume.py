@@ -278,6 +278,10 @@ class ResumeDocument(BaseModel):
     parsed_verified: bool = False
     parsed_verified_at: datetime | None = None
 
+    # SHA256 prefix of raw_content (CacheService.hash_content), stored on
+    # create/update so ATS cache lookups don't need to load raw_content
+    raw_content_hash: str | None = None
+
     # Fit pre-scoring (populated by resume_keywords.py on parse/update)
     extracted_keywords: list[str] | None = None
     keywords_content_hash: str | None = None
@@ -286,6 +290,7 @@ class ResumeDocument(BaseModel):
     # Computed once per parsed-content change; paired with its own hash.
     content_embedding: list[float] | None = None
     embedding_content_hash: str | None = None
+    embedding_sim_signature: int | None = None  # SimHash of the embedded text
 
     model_config = {
         "populate_by_name": True,
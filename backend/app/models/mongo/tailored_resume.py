@@ -119,6 +119,29 @@ class TailoredResumeDocument(BaseModel):
         return self.job_source.type
 
 
+class TailoredResumeSummary(BaseModel):
+    """List-view subset of a TailoredResume document.
+
+    Loaded with ``TailoredResumeCRUD.SUMMARY_PROJECTION`` so listings never
+    pull tailored_data / finalized_data.
+    """
+
+    id: PyObjectId = Field(alias="_id")
+    resume_id: PyObjectId
+    job_source: JobSource
+    status: TailoredResumeStatus = TailoredResumeStatus.PENDING
+    match_score: float | None = None
+    job_title: str | None = None
+    company_name: str | None = None
+    created_at: datetime
+    updated_at: datetime | None = None
+
+    model_config = {
+        "populate_by_name": True,
+        "arbitrary_types_allowed": True,
+    }
+
+
 class TailoredResumeCreate(BaseModel):
     """Schema for creating a new tailored resume."""
 
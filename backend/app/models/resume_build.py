@@ -103,8 +103,15 @@ class ResumeBuild(Base):
     __table_args__ = (
         Index("ix_resume_builds_user_id", "user_id"),
         Index("ix_resume_builds_status", "user_id", "status"),
+        # Created via migration (CONCURRENTLY, not declarative):
+        # - ix_resume_builds_user_updated (20261016_0003):
+        #   (user_id, updated_at DESC, created_at DESC, public_id DESC)
     )
 
+    # Fetch SQL-generated values (updated_at on UPDATE) via RETURNING during
+    # flush, so mutations don't need a follow-up refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
     def is_draft(self) -> bool:
         """Check if resume build is in draft status."""
         return self.status == "draft"
@@ -90,6 +90,9 @@ class UserJobInteraction(Base):
         # Partial indexes created via migration (CONCURRENTLY, not declarative):
         # - idx_uji_fit_score (20260420_0001): (user_id, fit_score_raw DESC) WHERE fit_score_raw IS NOT NULL
         # - idx_uji_fit_not_capped (20260424_0001): (user_id, fit_score_raw DESC) WHERE fit_score_raw IS NOT NULL AND fit_score_is_capped IS NOT TRUE
+        # - idx_uji_saved (20261016_0001): (user_id, job_listing_id) WHERE is_saved = TRUE
+        # - idx_uji_hidden (20261016_0001): (user_id, job_listing_id) WHERE is_hidden = TRUE
+        # - idx_uji_applied (20261016_0001): (user_id, applied_at DESC) WHERE applied_at IS NOT NULL
     )
 
     def __repr__(self) -> str:
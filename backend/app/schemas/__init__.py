@@ -38,6 +38,7 @@ from app.schemas.resume_build import (
     ResumeBuildBase,
     ResumeBuildCreate,
     ResumeBuildListResponse,
+    ResumeBuildMinimalResponse,
     ResumeBuildResponse,
     ResumeBuildUpdate,
     SuggestRequest,
@@ -128,6 +129,7 @@ __all__ = [
     "ResumeBuildUpdate",
     "ResumeBuildResponse",
     "ResumeBuildListResponse",
+    "ResumeBuildMinimalResponse",
     "SuggestRequest",
     "SuggestResponse",
     "DiffActionRequest",
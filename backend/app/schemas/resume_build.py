@@ -66,13 +66,27 @@ class ResumeBuildResponse(ResumeBuildBase):
     exported_at: datetime | None = None
 
 
+class ResumeBuildMinimalResponse(BaseModel):
+    """Schema for mutation responses requested with ``?include=minimal``."""
+
+    id: UUID
+    status: str
+    updated_at: datetime | None = None
+
+
 class ResumeBuildListResponse(BaseModel):
     """Schema for paginated resume build list responses."""
 
     resume_builds: list[ResumeBuildResponse]
-    total: int
+    total: int | None = Field(
+        None, description="Total matching builds (omitted when paginating by cursor)"
+    )
     limit: int
     offset: int
+    has_more: bool = False
+    next_cursor: str | None = Field(
+        None, description="Pass as `cursor` to fetch the next page"
+    )
 
 
 class SuggestRequest(BaseModel):
@@ -8,7 +8,6 @@ Supports:
 The provider is selected via AI_PROVIDER environment variable.
 """
 
-import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -26,6 +25,28 @@ class AIServiceError(Exception):
     pass
 
 
+@lru_cache
+def get_openai_client(api_key: str):
+    """Shared AsyncOpenAI client for an API key.
+
+    Every model-specific client and the embedding service reuse one SDK
+    client, and so one keep-alive connection pool, instead of each holding
+    its own. Calls are natively async, so concurrency is not capped by the
+    default thread pool that ``asyncio.to_thread`` runs on.
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
+
+
+@lru_cache
+def get_gemini_client(api_key: str):
+    """Shared Gemini SDK client for an API key (see ``get_openai_client``)."""
+    from google import genai
+
+    return genai.Client(api_key=api_key)
+
+
 class BaseAIClient(ABC):
     """Abstract base class for AI clients."""
 
@@ -48,8 +69,13 @@ class BaseAIClient(ABC):
         user_prompt: str,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        json_mode: bool = False,
     ) -> AIResponse:
-        """Generate a response from the AI model with usage metrics."""
+        """Generate a response from the AI model with usage metrics.
+
+        ``json_mode`` asks the provider to constrain decoding to JSON where
+        it supports that for any top-level value (objects and arrays).
+        """
         pass
 
     async def generate(
@@ -80,13 +106,12 @@ class BaseAIClient(ABC):
         max_tokens: int = 4096,
     ) -> str:
         """Generate a JSON response from the AI model."""
-        json_system = f"{system_prompt}\n\nIMPORTANT: Respond ONLY with valid JSON. No markdown code blocks, no explanations, just the raw JSON object."
-        return await self.generate(
-            system_prompt=json_system,
+        response = await self.generate_json_with_metrics(
+            system_prompt=system_prompt,
             user_prompt=user_prompt,
             max_tokens=max_tokens,
-            temperature=0.3,  # Lower temperature for structured output
         )
+        return response.content
 
     async def generate_json_with_metrics(
         self,
@@ -101,6 +126,7 @@ class BaseAIClient(ABC):
             user_prompt=user_prompt,
             max_tokens=max_tokens,
             temperature=0.3,  # Lower temperature for structured output
+            json_mode=True,
         )
 
 
@@ -108,9 +134,7 @@ class GeminiAIClient(BaseAIClient):
     """Wrapper around Google Gemini API client."""
 
     def __init__(self, api_key: str, model: str):
-        from google import genai
-
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_gemini_client(api_key)
         self.model = model
 
     @property
@@ -129,6 +153,7 @@ class GeminiAIClient(BaseAIClient):
         user_prompt: str,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        json_mode: bool = False,
     ) -> AIResponse:
         """Generate a response from the Gemini model with usage metrics."""
         from google.genai import errors, types
@@ -139,13 +164,14 @@ class GeminiAIClient(BaseAIClient):
         config = types.GenerateContentConfig(
             max_output_tokens=max_tokens,
             temperature=temperature,
+            # Decoding is constrained to JSON: no markdown fences or prose
+            response_mime_type="application/json" if json_mode else None,
         )
 
         start_time = time.perf_counter()
 
         try:
-            response = await asyncio.to_thread(
-                self.client.models.generate_content,
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=full_prompt,
                 config=config,
@@ -187,9 +213,7 @@ class OpenAIClient(BaseAIClient):
     """Wrapper around OpenAI API client."""
 
     def __init__(self, api_key: str, model: str):
-        from openai import OpenAI
-
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model
 
     @property
@@ -208,15 +232,19 @@ class OpenAIClient(BaseAIClient):
         user_prompt: str,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        json_mode: bool = False,
     ) -> AIResponse:
-        """Generate a response from the OpenAI model with usage metrics."""
+        """Generate a response from the OpenAI model with usage metrics.
+
+        ``json_mode`` is not forwarded: OpenAI's JSON mode only permits a
+        top-level object, and several prompts ask for a JSON array.
+        """
         from openai import APIConnectionError, APIError, RateLimitError
 
         start_time = time.perf_counter()
 
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -30,6 +30,7 @@ from enum import Enum
 from functools import lru_cache
 
 from app.core.config import get_settings
+from app.services.ai.client import get_gemini_client, get_openai_client
 from app.services.ai.response import (
     AIUsageMetrics,
     BatchEmbeddingResponse,
@@ -60,6 +61,14 @@ class EmbeddingTaskType(str, Enum):
 class BaseEmbeddingService(ABC):
     """Abstract base class for embedding services."""
 
+    # Batch embedding: inputs per provider request, and requests in flight
+    MAX_BATCH_SIZE = 100
+    MAX_BATCH_CONCURRENCY = 4
+
+    # Near-duplicate detection: SimHash signatures within this many differing
+    # bits are treated as the same content for embedding reuse
+    SIM_SIGNATURE_MAX_DISTANCE = 3
+
     def __init__(self, strip_pii: bool = True):
         """Initialize the embedding service.
 
@@ -108,6 +117,63 @@ class BaseEmbeddingService(ABC):
         """Internal implementation of embedding generation with metrics."""
         pass
 
+    @abstractmethod
+    async def _embed_batch_impl(
+        self,
+        texts: list[str],
+        task_type: EmbeddingTaskType,
+    ) -> tuple[list[list[float]], int]:
+        """
+        Embed up to MAX_BATCH_SIZE texts in one provider request.
+
+        Returns the embeddings in input order and the total token count.
+        """
+        pass
+
+    async def _embed_batch(
+        self,
+        contents: list[str],
+        titles: list[str] | None,
+        task_type: EmbeddingTaskType,
+    ) -> tuple[list[list[float]], int]:
+        """
+        Embed many texts with bounded concurrent batch requests.
+
+        Inputs are PII-stripped, split into MAX_BATCH_SIZE chunks and sent
+        with at most MAX_BATCH_CONCURRENCY requests in flight; results are
+        reassembled in input order.
+        """
+        if titles and len(titles) != len(contents):
+            raise ValueError("titles must have same length as contents")
+
+        texts = []
+        for i, text in enumerate(contents):
+            title = titles[i] if titles else None
+            if self._pii_stripper:
+                text = self._pii_stripper.strip(text)
+                if title:
+                    title = self._pii_stripper.strip(title)
+            if title and task_type == EmbeddingTaskType.RETRIEVAL_DOCUMENT:
+                text = f"{title}\n\n{text}"
+            texts.append(text)
+
+        semaphore = asyncio.Semaphore(self.MAX_BATCH_CONCURRENCY)
+
+        async def embed_chunk(chunk: list[str]) -> tuple[list[list[float]], int]:
+            async with semaphore:
+                return await self._embed_batch_impl(chunk, task_type)
+
+        results = await asyncio.gather(
+            *(
+                embed_chunk(texts[start : start + self.MAX_BATCH_SIZE])
+                for start in range(0, len(texts), self.MAX_BATCH_SIZE)
+            )
+        )
+
+        embeddings = [embedding for chunk, _ in results for embedding in chunk]
+        total_tokens = sum(tokens for _, tokens in results)
+        return embeddings, total_tokens
+
     async def _embed(
         self,
         text: str,
@@ -213,18 +279,29 @@ class BaseEmbeddingService(ABC):
         """
         Batch embed multiple documents efficiently.
 
-        More efficient than individual calls for bulk operations
-        like initial resume parsing or migration.
+        Uses the provider's batch endpoint (MAX_BATCH_SIZE inputs per
+        request, MAX_BATCH_CONCURRENCY requests in flight) instead of one
+        request per document.
         """
-        if titles and len(titles) != len(contents):
-            raise ValueError("titles must have same length as contents")
+        embeddings, _ = await self._embed_batch(
+            contents, titles, EmbeddingTaskType.RETRIEVAL_DOCUMENT
+        )
+        return embeddings
 
-        embeddings = []
-        for i, content in enumerate(contents):
-            title = titles[i] if titles else None
-            embedding = await self.embed_document(content, title)
-            embeddings.append(embedding)
+    async def embed_many(
+        self,
+        texts: list[str],
+        task_type: EmbeddingTaskType | str = EmbeddingTaskType.RETRIEVAL_DOCUMENT,
+    ) -> list[list[float]]:
+        """
+        Embed many texts of one task type with packed batch requests.
 
+        Use for bulk queries as well as documents (e.g. matching many job
+        requirements at once) instead of looping over embed_query.
+        """
+        embeddings, _ = await self._embed_batch(
+            texts, None, EmbeddingTaskType(task_type)
+        )
         return embeddings
 
     # --- Methods with metrics (for usage tracking) ---
@@ -264,21 +341,14 @@ class BaseEmbeddingService(ABC):
         """
         Batch embed multiple documents with aggregated usage metrics.
 
-        Returns all embeddings and combined metrics.
+        Returns all embeddings and combined metrics. Latency is the wall
+        time of the whole batch, since requests run concurrently.
         """
-        if titles and len(titles) != len(contents):
-            raise ValueError("titles must have same length as contents")
-
-        embeddings = []
-        total_input_tokens = 0
-        total_latency_ms = 0
-
-        for i, content in enumerate(contents):
-            title = titles[i] if titles else None
-            response = await self.embed_document_with_metrics(content, title)
-            embeddings.append(response.embedding)
-            total_input_tokens += response.metrics.input_tokens
-            total_latency_ms += response.metrics.latency_ms
+        start_time = time.perf_counter()
+        embeddings, total_input_tokens = await self._embed_batch(
+            contents, titles, EmbeddingTaskType.RETRIEVAL_DOCUMENT
+        )
+        total_latency_ms = int((time.perf_counter() - start_time) * 1000)
 
         aggregated_metrics = AIUsageMetrics(
             input_tokens=total_input_tokens,
@@ -297,17 +367,20 @@ class BaseEmbeddingService(ABC):
     @staticmethod
     def compute_content_hash(content: str) -> str:
         """
-        Compute SHA-256 hash for content change detection.
+        Compute a content digest for change detection.
 
-        Use this to check if content needs re-embedding.
+        Use this to check if content needs re-embedding. The digest is not a
+        security primitive, so it uses BLAKE2b-256, which is faster than
+        SHA-256 in software and has the same 64-character hex length.
         """
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=32).hexdigest()
 
     def check_needs_embedding(
         self,
         new_content: str,
         current_hash: str | None,
         current_embedding: list[float] | None,
+        current_sim_signature: int | None = None,
     ) -> bool:
         """
         Check if content needs (re-)embedding.
@@ -315,15 +388,53 @@ class BaseEmbeddingService(ABC):
         Returns True if:
         - No existing embedding
         - No existing hash
-        - Content has changed (hash mismatch)
+        - Content has changed (hash mismatch), and is not a near-duplicate
+          of the embedded content when ``current_sim_signature`` is given
         """
         if current_embedding is None:
             return True
         if current_hash is None:
             return True
 
-        new_hash = self.compute_content_hash(new_content)
-        return new_hash != current_hash
+        if self.compute_content_hash(new_content) == current_hash:
+            return False
+        # Hashes stored before the switch to BLAKE2b are SHA-256
+        legacy_hash = hashlib.sha256(new_content.encode("utf-8")).hexdigest()
+        if legacy_hash == current_hash:
+            return False
+        if current_sim_signature is not None:
+            return not self.is_near_duplicate(
+                self.compute_sim_signature(new_content), current_sim_signature
+            )
+        return True
+
+    @staticmethod
+    def compute_sim_signature(content: str) -> int:
+        """
+        Compute a 64-bit SimHash over word 3-gram shingles of ``content``.
+
+        Unlike the content hash, small edits (a typo fix, added punctuation)
+        change only a few bits. Returned as a signed 64-bit integer so it
+        fits a Postgres ``bigint`` / BSON int64.
+        """
+        words = content.lower().split()
+        shingles = [" ".join(words[i : i + 3]) for i in range(max(len(words) - 2, 1))]
+        counts = [0] * 64
+        for shingle in shingles:
+            h = int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(),
+                "big",
+            )
+            for bit in range(64):
+                counts[bit] += 1 if (h >> bit) & 1 else -1
+        signature = sum(1 << bit for bit in range(64) if counts[bit] > 0)
+        return signature - (1 << 64) if signature >= 1 << 63 else signature
+
+    @classmethod
+    def is_near_duplicate(cls, signature: int, other: int) -> bool:
+        """True if two SimHash signatures differ in at most a few bits."""
+        distance = ((signature ^ other) & 0xFFFFFFFFFFFFFFFF).bit_count()
+        return distance <= cls.SIM_SIGNATURE_MAX_DISTANCE
 
 
 class GeminiEmbeddingService(BaseEmbeddingService):
@@ -339,9 +450,7 @@ class GeminiEmbeddingService(BaseEmbeddingService):
 
     def __init__(self, api_key: str, strip_pii: bool = True):
         super().__init__(strip_pii)
-        from google import genai
-
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_gemini_client(api_key)
         self.model = self.EMBEDDING_MODEL
 
     @property
@@ -375,9 +484,8 @@ class GeminiEmbeddingService(BaseEmbeddingService):
             output_dimensionality=self.EMBEDDING_DIMENSIONS,
         )
 
-        # Generate embedding (non-blocking)
-        result = await asyncio.to_thread(
-            self.client.models.embed_content,
+        # Generate embedding
+        result = await self.client.aio.models.embed_content(
             model=self.model,
             contents=content,
             config=config,
@@ -408,9 +516,8 @@ class GeminiEmbeddingService(BaseEmbeddingService):
 
         start_time = time.perf_counter()
 
-        # Generate embedding (non-blocking)
-        result = await asyncio.to_thread(
-            self.client.models.embed_content,
+        # Generate embedding
+        result = await self.client.aio.models.embed_content(
             model=self.model,
             contents=content,
             config=config,
@@ -439,6 +546,30 @@ class GeminiEmbeddingService(BaseEmbeddingService):
             model=self.model,
         )
 
+    async def _embed_batch_impl(
+        self,
+        texts: list[str],
+        task_type: EmbeddingTaskType,
+    ) -> tuple[list[list[float]], int]:
+        from google.genai import types
+
+        config = types.EmbedContentConfig(
+            task_type=task_type.value,
+            output_dimensionality=self.EMBEDDING_DIMENSIONS,
+        )
+
+        # One request for the whole chunk
+        result = await self.client.aio.models.embed_content(
+            model=self.model,
+            contents=texts,
+            config=config,
+        )
+
+        if not result.embeddings or len(result.embeddings) != len(texts):
+            raise ValueError("Gemini API returned an incomplete batch of embeddings")
+        total_tokens = getattr(result, "total_tokens", 0) or 0
+        return [list(embedding.values) for embedding in result.embeddings], total_tokens
+
 
 class OpenAIEmbeddingService(BaseEmbeddingService):
     """
@@ -452,9 +583,7 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
 
     def __init__(self, api_key: str, model: str = "text-embedding-3-small", strip_pii: bool = True):
         super().__init__(strip_pii)
-        from openai import OpenAI
-
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = model
 
     @property
@@ -480,9 +609,8 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
         if title and task_type == EmbeddingTaskType.RETRIEVAL_DOCUMENT:
             content = f"{title}\n\n{text}"
 
-        # Generate embedding (non-blocking)
-        result = await asyncio.to_thread(
-            self.client.embeddings.create,
+        # Generate embedding
+        result = await self.client.embeddings.create(
             model=self.model,
             input=content,
         )
@@ -502,9 +630,8 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
 
         start_time = time.perf_counter()
 
-        # Generate embedding (non-blocking)
-        result = await asyncio.to_thread(
-            self.client.embeddings.create,
+        # Generate embedding
+        result = await self.client.embeddings.create(
             model=self.model,
             input=content,
         )
@@ -528,6 +655,22 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
             model=self.model,
         )
 
+    async def _embed_batch_impl(
+        self,
+        texts: list[str],
+        task_type: EmbeddingTaskType,
+    ) -> tuple[list[list[float]], int]:
+        # One request for the whole chunk
+        result = await self.client.embeddings.create(
+            model=self.model,
+            input=texts,
+        )
+
+        # Results carry their input index; don't rely on response order
+        data = sorted(result.data, key=lambda item: item.index)
+        total_tokens = result.usage.total_tokens if result.usage else 0
+        return [item.embedding for item in data], total_tokens
+
 
 # Type alias for the service interface
 EmbeddingService = BaseEmbeddingService
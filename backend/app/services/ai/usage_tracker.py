@@ -8,7 +8,7 @@ import logging
 from decimal import Decimal
 from functools import lru_cache
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Numeric, func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.ai_pricing_config import AIPricingConfig
@@ -17,26 +17,18 @@ from app.services.ai.response import AIResponse, EmbeddingResponse
 
 logger = logging.getLogger(__name__)
 
+# Thousands of tokens, bound as an exact numeric for the cost expression
+_TOKENS_TYPE = Numeric(20, 6)
+
 
 class AIUsageTracker:
     """Tracks AI API usage for analytics and cost monitoring."""
 
     @staticmethod
-    async def get_current_pricing(
-        db: AsyncSession,
-        provider: str,
-        model: str,
-    ) -> tuple[Decimal, Decimal]:
-        """Get current pricing for a model.
-
-        Returns:
-            Tuple of (input_cost_per_1k, output_cost_per_1k)
-        """
-        query = (
-            select(
-                AIPricingConfig.input_cost_per_1k,
-                AIPricingConfig.output_cost_per_1k,
-            )
+    def _current_rate(provider: str, model: str, rate_column) -> ColumnElement:
+        """Scalar subquery for the active per-1K rate of a model (0 if none)."""
+        rate = (
+            select(rate_column)
             .where(
                 AIPricingConfig.provider == provider,
                 AIPricingConfig.model == model,
@@ -44,29 +36,38 @@ class AIUsageTracker:
             )
             .order_by(AIPricingConfig.effective_date.desc())
             .limit(1)
+            .scalar_subquery()
         )
+        return func.coalesce(rate, 0)
 
-        result = await db.execute(query)
-        row = result.first()
-
-        if row:
-            return row.input_cost_per_1k, row.output_cost_per_1k
-
-        # Default to zero if no pricing configured
-        logger.warning(f"No pricing config found for {provider}/{model}")
-        return Decimal("0"), Decimal("0")
-
-    @staticmethod
-    def calculate_cost(
+    @classmethod
+    def cost_expression(
+        cls,
+        provider: str,
+        model: str,
         input_tokens: int,
-        output_tokens: int,
-        input_cost_per_1k: Decimal,
-        output_cost_per_1k: Decimal,
-    ) -> Decimal:
-        """Calculate total cost for token usage."""
-        input_cost = (Decimal(input_tokens) / 1000) * input_cost_per_1k
-        output_cost = (Decimal(output_tokens) / 1000) * output_cost_per_1k
-        return input_cost + output_cost
+        output_tokens: int = 0,
+    ) -> ColumnElement:
+        """Build the SQL expression pricing token usage at the current rates.
+
+        Evaluated inside the log INSERT so the pricing lookup does not need
+        its own round trip.
+        """
+        cost = literal(Decimal(input_tokens) / 1000, _TOKENS_TYPE) * cls._current_rate(
+            provider, model, AIPricingConfig.input_cost_per_1k
+        )
+        if output_tokens:
+            cost = cost + literal(
+                Decimal(output_tokens) / 1000, _TOKENS_TYPE
+            ) * cls._current_rate(provider, model, AIPricingConfig.output_cost_per_1k)
+        return cost
+
+    async def _insert_log(self, db: AsyncSession, **values) -> AIUsageLog:
+        """Insert a usage log with INSERT ... RETURNING and return the row."""
+        log = await db.scalar(insert(AIUsageLog).values(**values).returning(AIUsageLog))
+        if log.total_tokens and not log.cost_usd:
+            logger.warning(f"No pricing config found for {log.provider}/{log.model}")
+        return log
 
     async def log_generation(
         self,
@@ -110,19 +111,9 @@ class AIUsageTracker:
             total_tokens = response.metrics.total_tokens
             latency_ms = response.metrics.latency_ms
 
-        # Get current pricing
-        input_rate, output_rate = await self.get_current_pricing(db, provider, model)
-
-        # Calculate cost
-        cost = self.calculate_cost(
-            input_tokens,
-            output_tokens,
-            input_rate,
-            output_rate,
-        )
-
-        # Create log entry
-        log = AIUsageLog(
+        # Cost is priced against the active config within the INSERT itself
+        return await self._insert_log(
+            db,
             user_id=user_id,
             endpoint=endpoint,
             provider=provider,
@@ -131,17 +122,12 @@ class AIUsageTracker:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             total_tokens=total_tokens,
-            cost_usd=cost,
+            cost_usd=self.cost_expression(provider, model, input_tokens, output_tokens),
             latency_ms=latency_ms,
             success=success,
             error_message=error_message,
         )
 
-        db.add(log)
-        # Note: Caller is responsible for committing the session
-
-        return log
-
     async def log_embedding(
         self,
         db: AsyncSession,
@@ -168,13 +154,8 @@ class AIUsageTracker:
             Caller is responsible for committing the session.
         """
         # Embeddings only have input tokens
-        input_rate, _ = await self.get_current_pricing(
-            db, response.provider, response.model
-        )
-
-        cost = (Decimal(response.metrics.total_tokens) / 1000) * input_rate
-
-        log = AIUsageLog(
+        return await self._insert_log(
+            db,
             user_id=user_id,
             endpoint=endpoint,
             provider=response.provider,
@@ -183,15 +164,14 @@ class AIUsageTracker:
             input_tokens=response.metrics.input_tokens,
             output_tokens=0,
             total_tokens=response.metrics.total_tokens,
-            cost_usd=cost,
+            cost_usd=self.cost_expression(
+                response.provider, response.model, response.metrics.total_tokens
+            ),
             latency_ms=response.metrics.latency_ms,
             success=success,
             error_message=error_message,
         )
 
-        db.add(log)
-        return log
-
     async def log_embedding_raw(
         self,
         db: AsyncSession,
@@ -222,10 +202,8 @@ class AIUsageTracker:
         Returns:
             The created log entry
         """
-        input_rate, _ = await self.get_current_pricing(db, provider, model)
-        cost = (Decimal(total_tokens) / 1000) * input_rate
-
-        log = AIUsageLog(
+        return await self._insert_log(
+            db,
             user_id=user_id,
             endpoint=endpoint,
             provider=provider,
@@ -234,15 +212,12 @@ class AIUsageTracker:
             input_tokens=total_tokens,
             output_tokens=0,
             total_tokens=total_tokens,
-            cost_usd=cost,
+            cost_usd=self.cost_expression(provider, model, total_tokens),
             latency_ms=latency_ms,
             success=success,
             error_message=error_message,
         )
 
-        db.add(log)
-        return log
-
 
 @lru_cache
 def get_usage_tracker() -> AIUsageTracker:
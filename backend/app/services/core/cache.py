@@ -1,9 +1,11 @@
+import base64
 import hashlib
-import json
+from array import array
 from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Any
 
+from pydantic_core import from_json, to_json
 from redis.asyncio import Redis
 
 
@@ -13,6 +15,7 @@ class CacheService:
     # Cache TTL values in seconds
     PARSE_TTL = 60 * 60 * 24  # 24 hours for parsed content
     TAILOR_TTL = 60 * 60 * 24 * 7  # 7 days for tailored results
+    QUICK_MATCH_TTL = 60 * 60 * 24  # 24 hours, matches the parse caches it derives from
     ATS_TTL = 60 * 60 * 24  # 24 hours for ATS analysis results
 
     def __init__(self, redis_client: Redis):
@@ -28,43 +31,92 @@ class CacheService:
         key = self._make_key("resume_parsed", raw_content)
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set_parsed_resume(self, raw_content: str, parsed: dict) -> None:
         """Cache parsed resume."""
         key = self._make_key("resume_parsed", raw_content)
-        await self.redis.setex(key, self.PARSE_TTL, json.dumps(parsed))
+        await self.redis.setex(key, self.PARSE_TTL, to_json(parsed))
 
     async def get_parsed_job(self, raw_content: str) -> dict | None:
         """Get cached parsed job description."""
         key = self._make_key("job_parsed", raw_content)
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set_parsed_job(self, raw_content: str, parsed: dict) -> None:
         """Cache parsed job description."""
         key = self._make_key("job_parsed", raw_content)
-        await self.redis.setex(key, self.PARSE_TTL, json.dumps(parsed))
+        await self.redis.setex(key, self.PARSE_TTL, to_json(parsed))
+
+    def _make_tailored_key(
+        self,
+        model: str,
+        resume_hash: str,
+        job_hash: str,
+        focus_keywords: list[str] | None,
+    ) -> str:
+        """Build a content-addressed tailoring cache key.
+
+        Keyed by what the output depends on (resume content, job content,
+        focus keywords and model) rather than resume/job IDs, so re-tailoring
+        the same pair through a different job record or resume copy still hits.
+        ``None`` focus keywords ("use all") are distinct from an empty list.
+        """
+        focus = (
+            "*"
+            if focus_keywords is None
+            else ",".join(sorted({k.lower() for k in focus_keywords}))
+        )
+        digest = hashlib.sha256(
+            f"{resume_hash}|{job_hash}|{focus}".encode()
+        ).hexdigest()[:32]
+        return f"tailored:v2:{model}:{digest}"
 
     async def get_tailored_result(
-        self, resume_id: int, job_id: int, resume_hash: str, job_hash: str
+        self,
+        model: str,
+        resume_hash: str,
+        job_hash: str,
+        focus_keywords: list[str] | None = None,
     ) -> dict | None:
         """Get cached tailoring result."""
-        key = f"tailored:{resume_id}:{job_id}:{resume_hash[:8]}:{job_hash[:8]}"
+        key = self._make_tailored_key(model, resume_hash, job_hash, focus_keywords)
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set_tailored_result(
-        self, resume_id: int, job_id: int, resume_hash: str, job_hash: str, result: dict
+        self,
+        model: str,
+        resume_hash: str,
+        job_hash: str,
+        focus_keywords: list[str] | None,
+        result: dict,
     ) -> None:
         """Cache tailoring result."""
-        key = f"tailored:{resume_id}:{job_id}:{resume_hash[:8]}:{job_hash[:8]}"
-        await self.redis.setex(key, self.TAILOR_TTL, json.dumps(result))
+        key = self._make_tailored_key(model, resume_hash, job_hash, focus_keywords)
+        await self.redis.setex(key, self.TAILOR_TTL, to_json(result))
+
+    async def get_quick_match(
+        self, model: str, resume_hash: str, job_hash: str
+    ) -> dict | None:
+        """Get cached quick match score."""
+        data = await self.redis.get(f"quick_match:{model}:{resume_hash}:{job_hash}")
+        if data:
+            return from_json(data)
+        return None
+
+    async def set_quick_match(
+        self, model: str, resume_hash: str, job_hash: str, result: dict
+    ) -> None:
+        """Cache quick match score."""
+        key = f"quick_match:{model}:{resume_hash}:{job_hash}"
+        await self.redis.setex(key, self.QUICK_MATCH_TTL, to_json(result))
 
     async def invalidate_resume(self, raw_content: str) -> None:
         """Invalidate cached parsed resume."""
@@ -122,7 +174,7 @@ class CacheService:
         key = self._make_ats_key(resume_content_hash, job_id)
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set_ats_result(
@@ -147,7 +199,7 @@ class CacheService:
             "cached_at": datetime.now(timezone.utc).isoformat(),
             "resume_content_hash": resume_content_hash,
         }
-        await self.redis.setex(key, self.ATS_TTL, json.dumps(cached_data))
+        await self.redis.setex(key, self.ATS_TTL, to_json(cached_data))
 
     async def get_ats_metadata(
         self, resume_content_hash: str, job_id: int
@@ -204,7 +256,7 @@ class CacheService:
         key = self._make_deep_analysis_key(resume_content_hash, job_listing_id)
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set_deep_analysis_result(
@@ -216,7 +268,7 @@ class CacheService:
         """Cache the serialized deep-analysis response."""
         key = self._make_deep_analysis_key(resume_content_hash, job_listing_id)
         await self.redis.setex(
-            key, self.DEEP_ANALYSIS_TTL, json.dumps(payload, default=str)
+            key, self.DEEP_ANALYSIS_TTL, to_json(payload, fallback=str)
         )
 
     async def invalidate_deep_analysis_result(
@@ -226,17 +278,63 @@ class CacheService:
         key = self._make_deep_analysis_key(resume_content_hash, job_listing_id)
         await self.redis.delete(key)
 
+    # Embedding Cache Methods
+    #
+    # Vectors are packed as float32 and base64-encoded (the shared client
+    # uses decode_responses=True, so raw bytes can't round-trip). That is
+    # roughly a third of the size of the equivalent JSON float list.
+    EMBEDDING_TTL = 60 * 60 * 24  # 24 hours
+
+    def _make_embedding_key(self, model: str, task_type: str, text: str) -> str:
+        """Key for an embedding of ``text`` from ``model`` / ``task_type``."""
+        text_hash = hashlib.sha1(text.encode()).hexdigest()
+        return f"emb:{model}:{task_type}:{text_hash}"
+
+    async def get_embedding(
+        self, model: str, task_type: str, text: str
+    ) -> list[float] | None:
+        """Get a cached embedding vector."""
+        key = self._make_embedding_key(model, task_type, text)
+        data = await self.redis.get(key)
+        if data:
+            return array("f", base64.b64decode(data)).tolist()
+        return None
+
+    async def get_embeddings(
+        self, model: str, task_type: str, texts: list[str]
+    ) -> list[list[float] | None]:
+        """Get cached embedding vectors for many texts in one round trip.
+
+        Returns one entry per text, in order, with ``None`` for misses.
+        """
+        if not texts:
+            return []
+        keys = [self._make_embedding_key(model, task_type, text) for text in texts]
+        values = await self.redis.mget(keys)
+        return [
+            array("f", base64.b64decode(data)).tolist() if data else None
+            for data in values
+        ]
+
+    async def set_embedding(
+        self, model: str, task_type: str, text: str, embedding: list[float]
+    ) -> None:
+        """Cache an embedding vector."""
+        key = self._make_embedding_key(model, task_type, text)
+        packed = base64.b64encode(array("f", embedding).tobytes()).decode("ascii")
+        await self.redis.setex(key, self.EMBEDDING_TTL, packed)
+
     # Generic cache methods (for ICache protocol)
     async def get(self, key: str) -> Any | None:
         """Get cached value by key."""
         data = await self.redis.get(key)
         if data:
-            return json.loads(data)
+            return from_json(data)
         return None
 
     async def set(self, key: str, value: Any, ttl_seconds: int = 3600) -> None:
         """Set cached value with TTL."""
-        await self.redis.setex(key, ttl_seconds, json.dumps(value))
+        await self.redis.setex(key, ttl_seconds, to_json(value))
 
     async def delete(self, key: str) -> None:
         """Delete cached value."""
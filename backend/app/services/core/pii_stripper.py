@@ -98,9 +98,34 @@ class PIIStripper:
         ),
     }
 
+    # Cheap scans that every match of a pattern must satisfy. Most text holds
+    # no PII, so a pattern whose guard fails on the input is skipped instead
+    # of running its (backtracking) search. Placeholders substituted by
+    # earlier patterns never satisfy a guard that the input failed.
+    _DIGIT_GUARD = r"\d"
+    PATTERN_GUARDS = {
+        "ssn": _DIGIT_GUARD,
+        "credit_card": _DIGIT_GUARD,
+        "email": "@",
+        "phone": _DIGIT_GUARD,
+        "phone_intl": _DIGIT_GUARD,
+        "ip_address": _DIGIT_GUARD,
+        "url": r"https?://|www\.",
+        "street_address": _DIGIT_GUARD,
+        "zip_code": _DIGIT_GUARD,
+        "date_of_birth": r"DOB|Birth|Born",
+        "labeled_email": "@",
+        "labeled_phone": r"Phone|Tel|Mobile|Cell|Fax",
+        "labeled_address": "Address",
+    }
+
     def __init__(self):
         """Initialize compiled regex patterns for performance."""
         self._compiled_patterns: dict[str, tuple[re.Pattern, str]] = {}
+        self._compiled_guards: dict[str, re.Pattern] = {
+            guard: re.compile(guard, re.IGNORECASE)
+            for guard in set(self.PATTERN_GUARDS.values())
+        }
 
         # Compile all patterns
         for name, (pattern, replacement) in self.PATTERNS.items():
@@ -115,6 +140,19 @@ class PIIStripper:
                 replacement,
             )
 
+    def _candidate_patterns(self, text: str) -> set[str]:
+        """Names of the patterns whose guard passes (or that have none)."""
+        passed = {
+            guard
+            for guard, compiled in self._compiled_guards.items()
+            if compiled.search(text)
+        }
+        return {
+            name
+            for name in self._compiled_patterns
+            if name not in self.PATTERN_GUARDS or self.PATTERN_GUARDS[name] in passed
+        }
+
     def strip(self, text: str) -> str:
         """
         Remove PII from text, replacing with placeholders.
@@ -138,16 +176,19 @@ class PIIStripper:
             return text
 
         result = text
+        candidates = self._candidate_patterns(text)
 
         # Apply labeled patterns first (more specific)
         for name in self.LABELED_PATTERNS:
-            pattern, replacement = self._compiled_patterns[name]
-            result = pattern.sub(replacement, result)
+            if name in candidates:
+                pattern, replacement = self._compiled_patterns[name]
+                result = pattern.sub(replacement, result)
 
         # Apply general patterns
         for name in self.PATTERNS:
-            pattern, replacement = self._compiled_patterns[name]
-            result = pattern.sub(replacement, result)
+            if name in candidates:
+                pattern, replacement = self._compiled_patterns[name]
+                result = pattern.sub(replacement, result)
 
         return result
 
@@ -167,12 +208,13 @@ class PIIStripper:
             return []
 
         entities: list[PIIEntityData] = []
+        candidates = self._candidate_patterns(text)
 
         # Check all patterns
-        all_patterns = {**self.PATTERNS, **self.LABELED_PATTERNS}
-
-        for name, (pattern_str, _) in all_patterns.items():
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+        for name in (*self.PATTERNS, *self.LABELED_PATTERNS):
+            if name not in candidates:
+                continue
+            pattern, _ = self._compiled_patterns[name]
 
             for match in pattern.finditer(text):
                 # Map pattern names to PII types
@@ -5,8 +5,11 @@ Converts tailored resume content to PDF, DOCX, and plain text formats.
 PDF generation uses WeasyPrint with Jinja2 templates.
 """
 
+import asyncio
 import io
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from docx import Document
@@ -24,6 +27,11 @@ if WEASYPRINT_AVAILABLE:
     from weasyprint import HTML
     from weasyprint.text.fonts import FontConfiguration
 
+# WeasyPrint/Pango make no thread-safety guarantees and the FontConfiguration
+# is shared by the cached ExportService, so PDF renders are serialized per
+# process inside generate_pdf, whichever thread calls it.
+_PDF_RENDER_LOCK = threading.Lock()
+
 
 @dataclass
 class PDFResult:
@@ -202,8 +210,14 @@ class ExportService:
         html_content = self._template_renderer.render(normalized, style)
 
         # Generate PDF using WeasyPrint
-        html = HTML(string=html_content)
-        document = html.render(font_config=self._font_config)
+        with _PDF_RENDER_LOCK:
+            html = HTML(string=html_content)
+            document = html.render(font_config=self._font_config)
+
+            # Write PDF to bytes
+            buffer = io.BytesIO()
+            document.write_pdf(buffer)
+            buffer.seek(0)
 
         # Get page count
         page_count = len(document.pages)
@@ -212,42 +226,48 @@ class ExportService:
         # For now, we consider overflow if > 1 page and user expected 1
         overflows = page_count > 1
 
-        # Write PDF to bytes
-        buffer = io.BytesIO()
-        document.write_pdf(buffer)
-        buffer.seek(0)
-
         return PDFResult(
             content=buffer.getvalue(),
             page_count=page_count,
             overflows=overflows,
         )
 
-    # Async wrapper methods for workshop router compatibility
+    # Async wrapper methods for workshop router compatibility.
+    # PDF/DOCX generation is CPU-bound (layout + zip encoding), so it runs in a
+    # worker thread instead of stalling the event loop for the whole render.
     async def export_pdf(
         self,
         content: dict[str, Any],
         template: str = "classic",
         contact: dict[str, Any] | None = None,
+        options: ExportOptions | None = None,
     ) -> PDFResult:
-        """Export resume content as PDF bytes with metadata."""
-        from app.services.export.html_to_document import StyleTemplate
+        """Export resume content as PDF bytes with metadata.
 
-        try:
-            style_template = StyleTemplate(template)
-        except ValueError:
-            style_template = StyleTemplate.CLASSIC
+        ``options`` overrides ``template`` when the caller has full style
+        settings (e.g. the /api/export query parameters).
+        """
+        if options is None:
+            from app.services.export.html_to_document import StyleTemplate
+
+            try:
+                style_template = StyleTemplate(template)
+            except ValueError:
+                style_template = StyleTemplate.CLASSIC
 
-        options = ExportOptions(template=style_template)
-        return self.generate_pdf(content, options=options, contact=contact)
+            options = ExportOptions(template=style_template)
+        return await asyncio.to_thread(
+            self.generate_pdf, content, options=options, contact=contact
+        )
 
     async def export_docx(
         self,
         content: dict[str, Any],
         template: str = "default",
+        options: ExportOptions | None = None,
     ) -> bytes:
         """Export resume content as DOCX bytes."""
-        return self.generate_docx(content)
+        return await asyncio.to_thread(self.generate_docx, content, options=options)
 
     async def export_txt(
         self,
@@ -268,6 +288,13 @@ class ExportService:
         return json.dumps(content, indent=2)
 
 
+@lru_cache
 def get_export_service() -> ExportService:
-    """Get the export service instance."""
+    """
+    Get a singleton ExportService instance.
+
+    Sharing the FontConfiguration across requests is safe because
+    ``generate_pdf`` holds ``_PDF_RENDER_LOCK`` around every WeasyPrint
+    render, for both the async ``export_pdf`` path and direct sync calls.
+    """
     return ExportService()
@@ -9,6 +9,7 @@ never re-extract.
 
 import asyncio
 import logging
+from typing import Any
 
 from sqlalchemy import or_, select, update
 
@@ -17,10 +18,12 @@ from app.models.job_listing import JobListing
 from app.services.ai.embedding import EmbeddingTaskType, get_embedding_service
 from app.services.ai.response import AIResponse, AIUsageMetrics, EmbeddingResponse
 from app.services.ai.usage_tracker import get_usage_tracker
+from app.services.core.cache import CacheService, get_cache_service
 from app.services.fit_scoring.job_keywords import (
     build_keywords_payload,
     extract_job_keywords,
 )
+from app.services.fit_scoring.scorer import quantize_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,62 @@ _EXTRACTION_ENDPOINT = "/internal/fit-scoring/extract-job-keywords"
 _EMBEDDING_ENDPOINT = "/internal/fit-scoring/embed-job"
 _DEFAULT_CONCURRENCY = 3
 _DEFAULT_LIMIT = 500
+_EMBEDDING_TASK = EmbeddingTaskType.SEMANTIC_SIMILARITY
+
+
+async def _prefetch_cached_embeddings(
+    embedding_service: Any,
+    cache: CacheService | None,
+    descriptions: list[str],
+) -> list[list[float] | None]:
+    """Look up cached vectors for every description in one Redis MGET.
+
+    Most descriptions in a cold batch are misses; a single MGET resolves all
+    of them up front instead of paying one GET round trip per job inside
+    the semaphore. Cache errors are treated as all-miss.
+    """
+    if cache is None or not descriptions:
+        return [None] * len(descriptions)
+    try:
+        return await cache.get_embeddings(
+            embedding_service.model_name, _EMBEDDING_TASK.value, descriptions
+        )
+    except Exception:
+        return [None] * len(descriptions)
+
+
+async def _embed_description(
+    embedding_service: Any,
+    cache: CacheService | None,
+    description: str,
+    cached: list[float] | None = None,
+) -> tuple[list[float], EmbeddingResponse | None]:
+    """Embed a job description, reusing a Redis-cached vector if present.
+
+    Scraped listings often repeat the same description (reposts, one posting
+    per location), so the vector is cached by model + text hash. ``cached``
+    is the prefetched vector from ``_prefetch_cached_embeddings``. Returns
+    ``(embedding, None)`` on a cache hit, when no provider call (and no
+    usage) was made. Cache errors fall through to a direct embedding call.
+    """
+    if cached is not None:
+        return cached, None
+
+    model = embedding_service.model_name
+    task_type = _EMBEDDING_TASK.value
+
+    embed_response = await embedding_service._embed_with_metrics(
+        text=description,
+        task_type=_EMBEDDING_TASK,
+    )
+    if cache is not None:
+        try:
+            await cache.set_embedding(
+                model, task_type, description, embed_response.embedding
+            )
+        except Exception:
+            pass
+    return embed_response.embedding, embed_response
 
 
 async def extract_missing_job_keywords(
@@ -80,6 +139,26 @@ async def extract_missing_job_keywords(
 
     semaphore = asyncio.Semaphore(concurrency)
     embedding_service = get_embedding_service()
+    try:
+        cache: CacheService | None = get_cache_service()
+    except Exception:
+        cache = None
+
+    needs_embedding = [
+        (job_id, description)
+        for job_id, description, _, existing_embedding in rows
+        if existing_embedding is None
+    ]
+    cached_embeddings = dict(
+        zip(
+            (job_id for job_id, _ in needs_embedding),
+            await _prefetch_cached_embeddings(
+                embedding_service,
+                cache,
+                [description for _, description in needs_embedding],
+            ),
+        )
+    )
 
     # Per-job result tuple:
     # (job_id, need_kw, kws, required, ai_response,
@@ -111,11 +190,12 @@ async def extract_missing_job_keywords(
 
             if need_emb:
                 try:
-                    embed_response = await embedding_service._embed_with_metrics(
-                        text=description,
-                        task_type=EmbeddingTaskType.SEMANTIC_SIMILARITY,
+                    embedding, embed_response = await _embed_description(
+                        embedding_service,
+                        cache,
+                        description,
+                        cached_embeddings.get(job_id),
                     )
-                    embedding = embed_response.embedding
                 except Exception:
                     logger.exception("fit-scoring: embedding call failed job=%d", job_id)
                     embedding = None
@@ -176,7 +256,10 @@ async def extract_missing_job_keywords(
                 if embedding is None:
                     failed_embed += 1
                 else:
+                    q8, scale = quantize_embedding(embedding)
                     values["description_embedding"] = embedding
+                    values["description_embedding_q8"] = q8
+                    values["description_embedding_scale"] = scale
                     if embed_response is not None:
                         # Wrap EmbeddingResponse metrics into an AIResponse-shaped
                         # log entry so usage tracker sees a uniform payload.
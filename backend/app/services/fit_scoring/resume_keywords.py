@@ -80,6 +80,14 @@ def build_resume_embedding_text(parsed: ParsedContent) -> str:
     return "\n".join(parts)
 
 
-def compute_resume_embedding_hash(parsed: ParsedContent) -> str:
-    """Hash over the embedding input text (separate from keyword hash)."""
-    return CacheService.hash_content(build_resume_embedding_text(parsed))
+def compute_resume_embedding_hash(
+    parsed: ParsedContent, embedding_text: str | None = None
+) -> str:
+    """Hash over the embedding input text (separate from keyword hash).
+
+    Pass ``embedding_text`` when the caller already built it, to avoid
+    flattening the resume a second time.
+    """
+    if embedding_text is None:
+        embedding_text = build_resume_embedding_text(parsed)
+    return CacheService.hash_content(embedding_text)
@@ -23,12 +23,17 @@ the formula, matched/missing keywords, and the cap state. Each run of
 can show "Scores refreshed Xh ago".
 """
 
+import asyncio
 import logging
 import math
+import operator
 import time
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,7 +44,11 @@ from app.models.fit_score_batch_run import FitScoreBatchRun
 from app.models.job_listing import JobListing
 from app.models.mongo.resume import ParsedContent
 from app.models.user_job_interaction import UserJobInteraction
-from app.services.ai.embedding import EmbeddingTaskType, get_embedding_service
+from app.services.ai.embedding import (
+    BaseEmbeddingService,
+    EmbeddingTaskType,
+    get_embedding_service,
+)
 from app.services.fit_scoring.resume_keywords import (
     build_resume_embedding_text,
     compute_resume_embedding_hash,
@@ -79,20 +88,30 @@ def _keyword_term(resume_keywords: set[str], job_keywords: set[str]) -> float:
     return math.sqrt(ratio)
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
+def quantize_embedding(vector: Sequence[float]) -> tuple[bytes, float]:
+    """Quantize an embedding to int8 with a per-vector scale.
+
+    Returns ``(int8 bytes, scale)`` where ``vector ≈ q * scale`` and
+    ``scale = max(|v|) / 127``. An all-zero vector gets scale 0.0.
+    """
+    peak = max(map(abs, vector), default=0.0)
+    if peak <= 0.0:
+        return bytes(len(vector)), 0.0
+    scale = peak / 127
+    return array("b", [round(x / scale) for x in vector]).tobytes(), scale
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
     """Cosine similarity. Returns 0.0 if either vector is empty or zero-norm."""
     if not a or not b or len(a) != len(b):
         return 0.0
-    dot = 0.0
-    na = 0.0
-    nb = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        na += x * x
-        nb += y * y
+    # map/hypot run the per-element loop in C; this is called once per
+    # (user, job) pair with full-size embedding vectors.
+    na = math.hypot(*a)
+    nb = math.hypot(*b)
     if na <= 0.0 or nb <= 0.0:
         return 0.0
-    return dot / math.sqrt(na * nb)
+    return sum(map(operator.mul, a, b)) / (na * nb)
 
 
 def _calibrate_cosine(cos: float) -> float:
@@ -109,8 +128,8 @@ def compute_raw_score(
     job_keywords: set[str],
     *,
     job_required: set[str] | None = None,
-    resume_embedding: list[float] | None = None,
-    job_embedding: list[float] | None = None,
+    resume_embedding: Sequence[float] | None = None,
+    job_embedding: Sequence[float] | None = None,
 ) -> tuple[int, dict]:
     """Return ``(score, breakdown)`` for the given keyword/embedding state.
 
@@ -182,6 +201,13 @@ async def score_all_users() -> dict[str, int]:
         "skipped_no_job_kws": 0,
     }
 
+    # The job load is independent of the batch-run insert, the Mongo scan
+    # and the first resume's embedding call, so start it now and await it
+    # when the first user is scored. Every user in the run shares it.
+    jobs_task = asyncio.create_task(_load_scoring_jobs(with_embeddings=hybrid_enabled))
+    jobs: list[_ScoringJob] | None = None
+    skipped_no_job_kws = 0
+
     batch_run_id = await _create_batch_run()
 
     try:
@@ -192,6 +218,7 @@ async def score_all_users() -> dict[str, int]:
             "keywords_content_hash": 1,
             "content_embedding": 1,
             "embedding_content_hash": 1,
+            "embedding_sim_signature": 1,
         }
         cursor = mongo_db.resumes.find(
             {"is_master": True, "parsed_verified": True, "parsed": {"$ne": None}},
@@ -228,14 +255,34 @@ async def score_all_users() -> dict[str, int]:
             # --- Embedding (lazy-compute only when hybrid is enabled) ---
             resume_embedding: list[float] | None = doc.get("content_embedding")
             resume_emb_hash: str | None = doc.get("embedding_content_hash")
-            current_emb_hash = compute_resume_embedding_hash(parsed)
+            # Built once: the hash, the SimHash signature and the embedding
+            # call all read the same flattened text.
+            embedding_text = build_resume_embedding_text(parsed)
+            current_emb_hash = compute_resume_embedding_hash(parsed, embedding_text)
 
-            if hybrid_enabled and (
+            needs_embedding = hybrid_enabled and (
                 resume_embedding is None or resume_emb_hash != current_emb_hash
-            ):
+            )
+            if needs_embedding:
+                sim_signature = BaseEmbeddingService.compute_sim_signature(
+                    embedding_text
+                )
+                stored_signature = doc.get("embedding_sim_signature")
+                # A minor edit (typo, punctuation) keeps the stored vector and
+                # its hash, so drift is always measured against the text that
+                # was actually embedded.
+                needs_embedding = (
+                    resume_embedding is None
+                    or stored_signature is None
+                    or not BaseEmbeddingService.is_near_duplicate(
+                        sim_signature, stored_signature
+                    )
+                )
+
+            if needs_embedding:
                 try:
                     embed_response = await get_embedding_service()._embed_with_metrics(
-                        text=build_resume_embedding_text(parsed),
+                        text=embedding_text,
                         task_type=EmbeddingTaskType.SEMANTIC_SIMILARITY,
                     )
                     resume_embedding = embed_response.embedding
@@ -246,6 +293,7 @@ async def score_all_users() -> dict[str, int]:
                             "$set": {
                                 "content_embedding": resume_embedding,
                                 "embedding_content_hash": resume_emb_hash,
+                                "embedding_sim_signature": sim_signature,
                             }
                         },
                     )
@@ -261,12 +309,17 @@ async def score_all_users() -> dict[str, int]:
             # trigger re-scoring on the next run.
             combined_hash = f"{resume_kw_hash}:{resume_emb_hash or '-'}:{int(hybrid_enabled)}"
 
+            if jobs is None:
+                jobs, skipped_no_job_kws = await jobs_task
+
             async with AsyncSessionLocal() as pg_session:
                 counts = await _score_user(
                     pg_session,
                     user_id,
                     resume_keywords,
                     combined_hash,
+                    jobs,
+                    skipped_no_job_kws,
                     resume_embedding=resume_embedding if hybrid_enabled else None,
                 )
             for key, delta in counts.items():
@@ -286,6 +339,13 @@ async def score_all_users() -> dict[str, int]:
             rows_written=summary["written"],
         )
         raise
+    finally:
+        if not jobs_task.done():
+            jobs_task.cancel()
+        elif not jobs_task.cancelled():
+            # No user awaited it: retrieve any load error so it isn't logged
+            # as never retrieved (it did not affect this run)
+            jobs_task.exception()
 
     logger.info("fit-scoring: batch complete — %s", summary)
     return summary
@@ -329,48 +389,49 @@ async def _complete_batch_run(
         logger.exception("fit-scoring: failed to update batch-run id=%s", batch_run_id)
 
 
-async def _score_user(
-    pg_session: AsyncSession,
-    user_id: int,
-    resume_keywords: set[str],
-    resume_hash: str,
-    *,
-    resume_embedding: list[float] | None = None,
-) -> dict[str, int]:
-    """Score every active keyword-bearing job for one user via upsert."""
-    started = time.perf_counter()
+@dataclass(frozen=True, slots=True)
+class _ScoringJob:
+    """An active job's scoring inputs, parsed once per batch run."""
+
+    id: int
+    keywords: set[str]
+    required: set[str]
+    embedding: Sequence[float] | None
 
-    jobs_q = select(
-        JobListing.id,
-        JobListing.extracted_keywords,
-        JobListing.description_embedding,
-    ).where(
+
+async def _load_scoring_jobs(*, with_embeddings: bool) -> tuple[list[_ScoringJob], int]:
+    """Load every active keyword-bearing job once for the whole batch run.
+
+    Returns ``(jobs, skipped_no_job_kws)``, where the count is the number
+    of active jobs whose keyword payload is unusable. Embeddings are kept as
+    compact arrays: int8 for quantized rows (cosine is scale-invariant, so
+    they score as-is) and float32 for rows not yet quantized, whose JSONB
+    vector is the only one fetched.
+    """
+    columns = [JobListing.id, JobListing.extracted_keywords]
+    if with_embeddings:
+        columns += [
+            JobListing.description_embedding_q8,
+            case(
+                (
+                    JobListing.description_embedding_q8.is_(None),
+                    JobListing.description_embedding,
+                ),
+            ).label("description_embedding"),
+        ]
+    jobs_q = select(*columns).where(
         JobListing.is_active.is_(True),
         JobListing.extracted_keywords.isnot(None),
     )
-    jobs = (await pg_session.execute(jobs_q)).all()
-    if not jobs:
-        return {"written": 0, "skipped_no_change": 0, "skipped_no_job_kws": 0}
 
-    job_ids = [job.id for job in jobs]
-    existing_q = select(
-        UserJobInteraction.job_listing_id,
-        UserJobInteraction.scored_resume_hash,
-    ).where(
-        UserJobInteraction.user_id == user_id,
-        UserJobInteraction.job_listing_id.in_(job_ids),
-    )
-    already_scored: dict[int, str | None] = {
-        row.job_listing_id: row.scored_resume_hash
-        for row in (await pg_session.execute(existing_q)).all()
-    }
-
-    rows: list[dict] = []
-    skipped_no_change = 0
+    jobs: list[_ScoringJob] = []
     skipped_no_job_kws = 0
 
-    for job in jobs:
-        payload = job.extracted_keywords
+    async with AsyncSessionLocal() as pg_session:
+        rows = (await pg_session.execute(jobs_q)).all()
+
+    for row in rows:
+        payload = row.extracted_keywords
         job_keywords_raw = (
             payload.get("keywords") if isinstance(payload, dict) else None
         )
@@ -392,16 +453,63 @@ async def _score_user(
             else set()
         )
 
+        embedding: Sequence[float] | None = None
+        if with_embeddings:
+            if row.description_embedding_q8 is not None:
+                embedding = array("b", row.description_embedding_q8)
+            elif row.description_embedding is not None:
+                embedding = array("f", row.description_embedding)
+
+        jobs.append(_ScoringJob(row.id, job_keywords, job_required, embedding))
+
+    return jobs, skipped_no_job_kws
+
+
+async def _score_user(
+    pg_session: AsyncSession,
+    user_id: int,
+    resume_keywords: set[str],
+    resume_hash: str,
+    jobs: list[_ScoringJob],
+    skipped_no_job_kws: int,
+    *,
+    resume_embedding: list[float] | None = None,
+) -> dict[str, int]:
+    """Score every preloaded job for one user via upsert."""
+    started = time.perf_counter()
+
+    if not jobs:
+        return {
+            "written": 0,
+            "skipped_no_change": 0,
+            "skipped_no_job_kws": skipped_no_job_kws,
+        }
+
+    # All of the user's scored rows; rows for jobs that are no longer active
+    # are simply never looked up.
+    existing_q = select(
+        UserJobInteraction.job_listing_id,
+        UserJobInteraction.scored_resume_hash,
+    ).where(UserJobInteraction.user_id == user_id)
+    already_scored: dict[int, str | None] = {
+        row.job_listing_id: row.scored_resume_hash
+        for row in (await pg_session.execute(existing_q)).all()
+    }
+
+    rows: list[dict] = []
+    skipped_no_change = 0
+
+    for job in jobs:
         if already_scored.get(job.id) == resume_hash:
             skipped_no_change += 1
             continue
 
         raw_score, breakdown = compute_raw_score(
             resume_keywords,
-            job_keywords,
-            job_required=job_required,
+            job.keywords,
+            job_required=job.required,
             resume_embedding=resume_embedding,
-            job_embedding=job.description_embedding,
+            job_embedding=job.embedding,
         )
         rows.append(
             {
@@ -451,4 +559,4 @@ async def _score_user(
     }
 
 
-__all__ = ["score_all_users", "compute_raw_score", "TOP_N"]
+__all__ = ["score_all_users", "compute_raw_score", "quantize_embedding", "TOP_N"]
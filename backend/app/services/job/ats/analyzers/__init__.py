@@ -11,6 +11,7 @@ from .base import (
     STANDARD_SECTIONS,
     basic_keyword_extraction,
     count_keyword_frequency,
+    find_keywords_in_text,
     get_ats_tips,
     get_keyword_context,
     parse_date,
@@ -33,6 +34,7 @@ __all__ = [
     "basic_keyword_extraction",
     "get_keyword_context",
     "count_keyword_frequency",
+    "find_keywords_in_text",
     "get_ats_tips",
     "STANDARD_SECTIONS",
     "EXPECTED_SECTION_ORDER",
@@ -5,6 +5,7 @@ Shared utility functions and base configuration used across analyzers.
 """
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 
 from dateutil import parser as date_parser
@@ -89,6 +90,36 @@ def count_keyword_frequency(keyword: str, text: str) -> int:
     return len(re.findall(keyword_pattern, text.lower()))
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def find_keywords_in_text(keywords: Iterable[str], text: str) -> set[str]:
+    """
+    Return the keywords (as given) that appear in text as whole words.
+
+    Same rule as ``\\b<keyword>\\b``, case-insensitive. A single-word
+    keyword matches exactly when it equals a maximal word run of the text,
+    so those are checked against one tokenized set of the text. Only
+    multi-word or punctuated keywords ("machine learning", "c++") fall back
+    to a per-keyword regex scan.
+    """
+    text_lower = text.lower()
+    words: set[str] | None = None
+    found: set[str] = set()
+
+    for keyword in keywords:
+        keyword_lower = keyword.lower()
+        if _WORD_RE.fullmatch(keyword_lower):
+            if words is None:
+                words = set(_WORD_RE.findall(text_lower))
+            if keyword_lower in words:
+                found.add(keyword)
+        elif re.search(r"\b" + re.escape(keyword_lower) + r"\b", text_lower):
+            found.add(keyword)
+
+    return found
+
+
 # Standard resume section names that ATS systems commonly look for
 STANDARD_SECTIONS = {
     "summary": ["summary", "professional summary", "objective", "profile", "about"],
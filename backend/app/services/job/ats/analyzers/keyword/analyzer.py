@@ -4,7 +4,6 @@ ATS Keyword Analyzer.
 Main orchestrator class for keyword analysis (Stage 1 basic and Stage 2 enhanced).
 """
 
-import re
 from typing import Any
 
 from app.core.protocols import ATSReportData, ExperienceBlockData
@@ -19,6 +18,7 @@ from ...models import (
 )
 from ..base import (
     count_keyword_frequency,
+    find_keywords_in_text,
     get_keyword_context,
 )
 from .extractor import KeywordExtractor
@@ -163,12 +163,10 @@ class KeywordAnalyzer:
         # Categorize keywords
         matched_keywords: list[str] = []
         missing_keywords: list[str] = []
+        found = find_keywords_in_text(job_keywords, resume_text)
 
         for keyword in job_keywords:
-            keyword_lower = keyword.lower()
-            keyword_pattern = r"\b" + re.escape(keyword_lower) + r"\b"
-
-            if re.search(keyword_pattern, resume_text):
+            if keyword in found:
                 matched_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
@@ -245,14 +243,15 @@ class KeywordAnalyzer:
         preferred_missing: list[str] = []
         nice_to_have_matched: list[str] = []
         nice_to_have_missing: list[str] = []
+        found = find_keywords_in_text(
+            (kw_data["keyword"] for kw_data in keywords_with_importance), resume_text
+        )
 
         for kw_data in keywords_with_importance:
             keyword = kw_data["keyword"]
             importance: KeywordImportance = kw_data["importance"]
-            keyword_lower = keyword.lower()
-            keyword_pattern = r"\b" + re.escape(keyword_lower) + r"\b"
 
-            found_in_resume = bool(re.search(keyword_pattern, resume_text))
+            found_in_resume = keyword in found
             frequency = count_keyword_frequency(keyword, job_description)
             context = get_keyword_context(keyword, job_description)
 
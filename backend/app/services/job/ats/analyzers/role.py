@@ -303,8 +303,8 @@ class RoleAnalyzer:
             embedding_service = get_embedding_service()
 
             # Get embeddings for both titles
-            resume_embedding = await embedding_service.embed_for_similarity(resume_title)
-            job_embedding = await embedding_service.embed_for_similarity(job_title)
+            resume_embedding = await self._embed_title(embedding_service, resume_title)
+            job_embedding = await self._embed_title(embedding_service, job_title)
 
             # Calculate cosine similarity
             resume_vec = np.array(resume_embedding)
@@ -327,6 +327,37 @@ class RoleAnalyzer:
             # Fallback to basic string matching if embeddings fail
             return self._basic_title_similarity(resume_title, job_title)
 
+    async def _embed_title(self, embedding_service: Any, title: str) -> list[float]:
+        """
+        Embed a title for similarity, reusing a Redis-cached vector if present.
+
+        The same target job title is re-embedded on every analysis of that
+        job (re-runs, polling, each user's resume), so cache by text hash.
+        Cache errors fall through to a direct embedding call.
+        """
+        from app.services.ai.embedding import EmbeddingTaskType
+        from app.services.core.cache import get_cache_service
+
+        model = embedding_service.model_name
+        task_type = EmbeddingTaskType.SEMANTIC_SIMILARITY.value
+
+        try:
+            cache = get_cache_service()
+            cached = await cache.get_embedding(model, task_type, title)
+        except Exception:
+            cache, cached = None, None
+        if cached is not None:
+            return cached
+
+        embedding = await embedding_service.embed_for_similarity(title)
+
+        if cache is not None:
+            try:
+                await cache.set_embedding(model, task_type, title, embedding)
+            except Exception:
+                pass
+        return embedding
+
     def _basic_title_similarity(self, title1: str, title2: str) -> float:
         """
         Basic title similarity using word overlap.
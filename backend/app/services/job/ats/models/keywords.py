@@ -10,7 +10,7 @@ from typing import Any
 from ..constants import KeywordImportance
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordMatch:
     """A single match of a keyword in the resume."""
 
@@ -20,7 +20,7 @@ class KeywordMatch:
     role_end_date: str | None = None  # End date of the role (for date-based recency)
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordDetail:
     """Detailed information about a keyword."""
 
@@ -32,7 +32,7 @@ class KeywordDetail:
     context: str | None  # Sample context from job description
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedKeywordDetail:
     """
     Enhanced keyword detail with Stage 2 scoring components.
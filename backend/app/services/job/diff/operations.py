@@ -35,18 +35,27 @@ class DiffOperations:
             New document with diff applied
         """
         result = copy.deepcopy(document)
+        self._apply_in_place(result, diff)
+        return result
+
+    def _apply_in_place(
+        self,
+        result: dict[str, Any],
+        diff: DiffSuggestionData,
+    ) -> None:
+        """Apply a single diff to ``result``, mutating it."""
         operation = diff.get("operation", "replace")
         path = diff.get("path", "")
         value = diff.get("value")
 
         parts = parse_path(path)
         if not parts:
-            return result
+            return
 
         # Navigate to parent
         target, success = navigate_to_parent(result, parts[:-1])
         if not success:
-            return result
+            return
 
         final_key = parts[-1]
 
@@ -86,8 +95,6 @@ class DiffOperations:
                 except ValueError:
                     pass
 
-        return result
-
     def apply_diffs(
         self,
         document: dict[str, Any],
@@ -96,16 +103,19 @@ class DiffOperations:
         """
         Apply multiple diffs in order.
 
+        The document is copied once and every diff is applied to that copy,
+        rather than deep-copying the whole document per diff.
+
         Args:
-            document: Starting document
+            document: Starting document (not mutated)
             diffs: List of diffs to apply
 
         Returns:
             Document with all diffs applied
         """
-        result = document
+        result = copy.deepcopy(document)
         for diff in diffs:
-            result = self.apply_diff(result, diff)
+            self._apply_in_place(result, diff)
         return result
 
     def revert_diff(
@@ -10,7 +10,6 @@ import json
 import logging
 import re
 import uuid
-from dataclasses import asdict
 from typing import Any, NotRequired, TypedDict
 
 from pydantic import ValidationError
@@ -22,6 +21,7 @@ from app.services.ai.response import AccumulatedMetrics, AIResponse
 from app.services.core.cache import CacheService
 from app.services.job.analyzer import JobAnalyzer, ParsedJob
 from app.services.resume.parser import ParsedResume, ResumeParser
+from app.utils.concurrency import gather_or_cancel
 
 logger = logging.getLogger(__name__)
 
@@ -267,36 +267,45 @@ class TailoringService:
             original_parsed: Pre-parsed resume content (preferred - avoids re-parsing)
             focus_keywords: User-selected keywords to emphasize (if None, uses all vault-backed keywords)
         """
-        # Get content hashes for caching
-        resume_hash = self.resume_parser.get_content_hash(raw_resume)
+        # Hash what the prompt is built from: the (possibly user-edited)
+        # parsed resume when provided, otherwise the raw text
+        resume_hash = (
+            self.cache.hash_content(
+                json.dumps(original_parsed, sort_keys=True, default=str)
+            )
+            if original_parsed
+            else self.resume_parser.get_content_hash(raw_resume)
+        )
         job_hash = self.job_analyzer.get_content_hash(raw_job)
+        model = self.ai.model_name
 
-        # Check cache for existing tailoring result
+        # Check cache for existing tailoring result. Hits carry no ai_metrics,
+        # so callers don't log usage for a generation that didn't happen.
         cached = await self.cache.get_tailored_result(
-            resume_id, job_id, resume_hash, job_hash
+            model, resume_hash, job_hash, focus_keywords
         )
         if cached:
             return cached
 
-        # Use provided parsed content or parse the resume
+        # Use provided parsed content, otherwise parse the resume alongside
+        # the job analysis. Both services cache their output by content hash,
+        # so repeat resumes or jobs skip the LLM call either way.
         if original_parsed:
             parsed_resume = original_parsed
+            parsed_job = await self.job_analyzer.analyze(raw_job)
         else:
-            parsed_resume = await self.resume_parser.parse(raw_resume)
-
-        # Parse the job description
-        parsed_job = await self.job_analyzer.analyze(raw_job)
+            parsed_resume, parsed_job = await gather_or_cancel(
+                self.resume_parser.parse(raw_resume),
+                self.job_analyzer.analyze(raw_job),
+            )
 
         # Generate tailored content
         result = await self._generate_tailoring(parsed_resume, parsed_job, focus_keywords)
 
-        # Cache the result (convert ai_metrics dataclass to dict for JSON serialization)
-        cache_result = {
-            **result,
-            "ai_metrics": asdict(result["ai_metrics"]) if "ai_metrics" in result else None,
-        }
+        # Cache the result without per-generation usage metrics
+        cache_result = {k: v for k, v in result.items() if k != "ai_metrics"}
         await self.cache.set_tailored_result(
-            resume_id, job_id, resume_hash, job_hash, cache_result
+            model, resume_hash, job_hash, focus_keywords, cache_result
         )
 
         return result
@@ -609,20 +618,29 @@ Output format (ensure valid JSON):
         """Get a quick match score without full tailoring.
 
         Returns dict with match score data and optional ai_metrics for usage tracking.
+        Cached scores are returned without ai_metrics.
         """
+        model = self.ai.model_name
+        resume_hash = self.resume_parser.get_content_hash(raw_resume)
+        job_hash = self.job_analyzer.get_content_hash(raw_job)
+
+        cached = await self.cache.get_quick_match(model, resume_hash, job_hash)
+        if cached:
+            return cached
+
         accumulated_metrics = AccumulatedMetrics()
 
-        # Parse resume with metrics
-        parsed_resume, resume_metrics = await self.resume_parser.parse(
-            raw_resume, return_metrics=True
+        # Resume parsing and job analysis are independent LLM calls, so run
+        # them concurrently rather than paying both latencies back to back
+        (
+            (parsed_resume, resume_metrics),
+            (parsed_job, job_metrics),
+        ) = await gather_or_cancel(
+            self.resume_parser.parse(raw_resume, return_metrics=True),
+            self.job_analyzer.analyze(raw_job, return_metrics=True),
         )
         if resume_metrics:
             accumulated_metrics.add(resume_metrics)
-
-        # Parse job with metrics
-        parsed_job, job_metrics = await self.job_analyzer.analyze(
-            raw_job, return_metrics=True
-        )
         if job_metrics:
             accumulated_metrics.add(job_metrics)
 
@@ -659,6 +677,7 @@ Output format (ensure valid JSON):
             "skill_matches": list(skill_matches),
             "skill_gaps": list(skill_gaps),
         }
+        await self.cache.set_quick_match(model, resume_hash, job_hash, result)
 
         # Include AI metrics for usage tracking
         if accumulated_metrics.call_count > 0:
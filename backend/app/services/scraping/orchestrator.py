@@ -58,28 +58,17 @@ class ScraperOrchestrator:
         jobs_updated = 0
         db_errors: list[dict] = []
 
+        # One batched upsert (a few statements per 100 jobs) instead of a
+        # lookup-then-write round trip per job
         async with AsyncSessionLocal() as db:
             try:
-                for job in jobs:
-                    try:
-                        listing, is_created = await job_listing_repository.upsert_from_apify(
-                            db, job_data=job, source_platform="linkedin"
-                        )
-                        if is_created:
-                            jobs_created += 1
-                        else:
-                            jobs_updated += 1
-                    except Exception as e:
-                        db_errors.append(
-                            {
-                                "job_id": job.id,
-                                "error": str(e),
-                            }
-                        )
-                        logger.warning(
-                            f"Failed to upsert job {job.id}: {e}"
-                        )
-
+                (
+                    jobs_created,
+                    jobs_updated,
+                    db_errors,
+                ) = await job_listing_repository.batch_upsert_from_apify(
+                    db, jobs_data=jobs, source_platform="linkedin"
+                )
                 await db.commit()
 
                 logger.info(
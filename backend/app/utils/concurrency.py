@@ -0,0 +1,28 @@
+"""
+Concurrency helpers.
+"""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Run awaitables concurrently, cancelling the rest if one fails.
+
+    Plain ``asyncio.gather`` raises the first exception but leaves the other
+    awaitables running, still holding their database session or AI call.
+    This cancels them and waits for the cancellation to finish before
+    re-raising. The original exception propagates unwrapped, unlike
+    ``asyncio.TaskGroup``'s ``ExceptionGroup``, so ``HTTPException`` and
+    service errors reach their handlers unchanged.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
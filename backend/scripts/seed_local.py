@@ -15,19 +15,17 @@ from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from passlib.context import CryptContext
 from sqlalchemy import create_engine, select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.security import get_password_hash
 from app.models import User
 
 DUMMY_EMAIL = "dev@example.com"
 DUMMY_PASSWORD = "devpassword123"
 DUMMY_TITLE = "Dummy Resume"
 
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def _assert_local(url: str, label: str) -> None:
     host = urlparse(url.replace("+asyncpg", "").replace("+psycopg2", "")).hostname or ""
@@ -42,7 +40,7 @@ def seed_user(sync_url: str) -> int:
         if user is None:
             user = User(
                 email=DUMMY_EMAIL,
-                hashed_password=pwd_ctx.hash(DUMMY_PASSWORD),
+                hashed_password=get_password_hash(DUMMY_PASSWORD),
                 full_name="Jane Dev",
                 is_active=True,
                 is_admin=True,
@@ -12,10 +12,10 @@ from __future__ import annotations
 import sys
 from urllib.parse import urlparse
 
-from passlib.context import CryptContext
 from sqlalchemy import create_engine, text
 
 from app.core.config import get_settings
+from app.core.security import get_password_hash
 
 
 def main() -> None:
@@ -31,7 +31,7 @@ def main() -> None:
     if host not in {"localhost", "127.0.0.1"}:
         sys.exit(f"Refusing: DB host is {host!r}, not localhost.")
 
-    hashed = CryptContext(schemes=["bcrypt"]).hash(new_password)
+    hashed = get_password_hash(new_password)
     eng = create_engine(url)
     with eng.begin() as conn:
         result = conn.execute(
@@ -88,3 +88,34 @@ async def test_suggest_bullet_ai_service_error_returns_503(
     body = response.json()
     assert body["detail"].startswith("AI service error: ")
     assert "unavailable" in body["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_update_resume_build_persists_changes(client: AsyncClient):
+    build = await _create_build(client)
+
+    response = await client.patch(
+        f"/api/v1/resume-builds/{build['id']}",
+        json={"job_title": "Staff Engineer"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["job_title"] == "Staff Engineer"
+
+    fetched = await client.get(f"/api/v1/resume-builds/{build['id']}")
+    assert fetched.json()["job_title"] == "Staff Engineer"
+
+
+@pytest.mark.asyncio
+async def test_update_status_include_minimal_returns_summary(client: AsyncClient):
+    build = await _create_build(client)
+
+    response = await client.patch(
+        f"/api/v1/resume-builds/{build['id']}/status?include=minimal",
+        json={"status": "in_progress"},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert set(body) == {"id", "status", "updated_at"}
+    assert body["id"] == build["id"]
+    assert body["status"] == "in_progress"
@@ -156,3 +156,31 @@ async def test_delete_resume(client: AsyncClient):
     # Verify it's deleted
     get_response = await client.get(f"/api/resumes/{resume_id}")
     assert get_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_other_users_resume_is_not_found(client: AsyncClient, mongo_db):
+    """Resumes owned by another user are indistinguishable from missing ones."""
+    result = await mongo_db["resumes"].insert_one(
+        {
+            "user_id": 999,
+            "title": "Someone Else's",
+            "raw_content": "Content",
+            "version": 1,
+        }
+    )
+    resume_id = str(result.inserted_id)
+
+    get_response = await client.get(f"/api/resumes/{resume_id}")
+    assert get_response.status_code == 404
+
+    update_response = await client.put(
+        f"/api/resumes/{resume_id}", json={"title": "Hijacked", "version": 1}
+    )
+    assert update_response.status_code == 404
+
+    delete_response = await client.delete(f"/api/resumes/{resume_id}")
+    assert delete_response.status_code == 404
+
+    doc = await mongo_db["resumes"].find_one({"_id": result.inserted_id})
+    assert doc["title"] == "Someone Else's"
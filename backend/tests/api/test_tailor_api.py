@@ -593,3 +593,120 @@ class TestEdgeCases:
         )
         assert response.match_score == 95
         assert response.keyword_coverage == 0.98
+
+
+class TestTailoredResumeOwnership:
+    """Test that tailored resume routes scope lookups to the owner."""
+
+    @staticmethod
+    async def _insert_tailored(mongo_db, user_id: int, status: str = "pending") -> str:
+        from bson import ObjectId
+
+        now = datetime.now()
+        result = await mongo_db["tailored_resumes"].insert_one(
+            {
+                "resume_id": ObjectId(),
+                "user_id": user_id,
+                "job_source": {"type": "job_listing", "id": 99},
+                "tailored_data": {"summary": "Tailored"},
+                "finalized_data": None,
+                "status": status,
+                "match_score": 80.0,
+                "section_order": ["summary"],
+                "style_settings": {},
+                "created_at": now,
+                "updated_at": now,
+                "finalized_at": None,
+            }
+        )
+        return str(result.inserted_id)
+
+    @pytest.mark.asyncio
+    async def test_other_users_tailored_resume_is_not_found(self, client, mongo_db):
+        tailored_id = await self._insert_tailored(mongo_db, user_id=999)
+
+        assert (await client.get(f"/api/tailor/{tailored_id}")).status_code == 404
+        assert (
+            await client.patch(
+                f"/api/tailor/{tailored_id}", json={"section_order": ["summary"]}
+            )
+        ).status_code == 404
+        assert (
+            await client.post(
+                f"/api/tailor/{tailored_id}/finalize",
+                json={"finalized_data": {"summary": "Mine now"}},
+            )
+        ).status_code == 404
+        assert (await client.delete(f"/api/tailor/{tailored_id}")).status_code == 404
+
+        assert await mongo_db["tailored_resumes"].count_documents({}) == 1
+
+    @pytest.mark.asyncio
+    async def test_finalize_twice_returns_400(self, client, mongo_db):
+        tailored_id = await self._insert_tailored(
+            mongo_db, user_id=1, status="finalized"
+        )
+
+        response = await client.post(
+            f"/api/tailor/{tailored_id}/finalize",
+            json={"finalized_data": {"summary": "Again"}},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_returns_only_own_summaries(self, client, mongo_db):
+        own_id = await self._insert_tailored(mongo_db, user_id=1)
+        await self._insert_tailored(mongo_db, user_id=999)
+
+        response = await client.get("/api/tailor")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data] == [own_id]
+        assert data[0]["job_listing_id"] == 99
+        assert data[0]["match_score"] == 80.0
+        assert "tailored_data" not in data[0]
+
+    @pytest.mark.asyncio
+    async def test_update_returns_full_response(self, client, mongo_db):
+        tailored_id = await self._insert_tailored(mongo_db, user_id=1)
+
+        response = await client.patch(
+            f"/api/tailor/{tailored_id}",
+            json={"tailored_data": {"summary": "Edited"}, "section_order": ["summary"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == tailored_id
+        assert data["tailored_data"] == {"summary": "Edited"}
+        assert data["job_listing_id"] == 99
+        assert data["status"] == "pending"
+        assert data["is_outdated"] is False
+        assert "formatted_name" in data
+
+    @pytest.mark.asyncio
+    async def test_get_revalidates_with_etag(self, client, mongo_db):
+        tailored_id = await self._insert_tailored(mongo_db, user_id=1)
+
+        first = await client.get(f"/api/tailor/{tailored_id}")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        cached = await client.get(
+            f"/api/tailor/{tailored_id}", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+        await client.patch(
+            f"/api/tailor/{tailored_id}", json={"section_order": ["skills"]}
+        )
+        changed = await client.get(
+            f"/api/tailor/{tailored_id}", headers={"If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["section_order"] == ["skills"]
@@ -67,7 +67,7 @@ class TestUploadExtract:
     @pytest.mark.asyncio
     async def test_extract_docx_returns_html_content(self, client: AsyncClient):
         """Test that DOCX extraction returns HTML content."""
-        docx_content = b"PK fake docx content"
+        docx_content = b"PK\x03\x04 fake docx content"
         docx_mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
         with patch(
@@ -258,6 +258,48 @@ class TestUploadExtract:
         assert response.status_code == 400
         assert "empty" in response.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_extract_rejects_spoofed_content_type(self, client: AsyncClient):
+        """Test that a file whose magic bytes don't match its MIME type is rejected."""
+        with patch("app.api.routes.upload.extract_text") as mock_extract:
+            response = await client.post(
+                "/api/upload/extract",
+                files={
+                    "file": (
+                        "resume.pdf",
+                        BytesIO(b"\x89PNG\r\n\x1a\n"),
+                        "application/pdf",
+                    )
+                },
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error_code"] == "invalid_file_type"
+        mock_extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_rejects_oversize_file_without_extracting(
+        self, client: AsyncClient
+    ):
+        """Test that files over the size limit are rejected before extraction."""
+        with patch("app.api.routes.upload.MAX_UPLOAD_SIZE_BYTES", 1024), patch(
+            "app.api.routes.upload.UPLOAD_READ_CHUNK_BYTES", 256
+        ), patch("app.api.routes.upload.extract_text") as mock_extract:
+            response = await client.post(
+                "/api/upload/extract",
+                files={
+                    "file": (
+                        "resume.pdf",
+                        BytesIO(b"%PDF-" + b"x" * 4096),
+                        "application/pdf",
+                    )
+                },
+            )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error_code"] == "file_too_large"
+        mock_extract.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_extract_handles_extraction_error(self, client: AsyncClient):
         """Test error handling when extraction fails."""
@@ -84,7 +84,7 @@ if USING_POSTGRES:
 
 
 if USING_SQLITE:
-    from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+    from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
     from sqlalchemy.ext.compiler import compiles
 
     @event.listens_for(engine.sync_engine, "connect")
@@ -94,6 +94,15 @@ if USING_SQLITE:
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_sqlite_fts_stubs(dbapi_connection, connection_record):
+        """Stand-in for Postgres' to_tsvector so job_listings.search_vector
+        (a generated column) can be computed on insert. Full-text matching
+        itself is only exercised against real Postgres."""
+        dbapi_connection.create_function(
+            "to_tsvector", 2, lambda _config, text: text, deterministic=True
+        )
+
     @compiles(JSONB, "sqlite")
     def _compile_jsonb_sqlite(type_, compiler, **kw):
         return "JSON"
@@ -102,6 +111,10 @@ if USING_SQLITE:
     def _compile_array_sqlite(type_, compiler, **kw):
         return "JSON"
 
+    @compiles(TSVECTOR, "sqlite")
+    def _compile_tsvector_sqlite(type_, compiler, **kw):
+        return "TEXT"
+
 
 TestingSessionLocal = async_sessionmaker(
     engine,
@@ -217,3 +217,35 @@ class TestJobCRUDByIds:
         jobs = await job_crud.get_by_ids(db_session, ids=[job.id, 99999])
         assert len(jobs) == 1
         assert jobs[0].id == job.id
+
+    async def test_get_public_ids_maps_owned_jobs(self, db_session: AsyncSession):
+        """get_public_ids should map only the owner's jobs to their UUIDs."""
+        from app.models.user import User as _User
+
+        # Second user so the owner_id=2 job satisfies the FK.
+        db_session.add(
+            _User(
+                id=2,
+                email="user2@example.com",
+                hashed_password="hashed",
+                full_name="User Two",
+                is_active=True,
+                is_admin=False,
+            )
+        )
+        await db_session.flush()
+
+        owned = JobDescription(title="Owned", owner_id=1, raw_content="Content")
+        other = JobDescription(title="Other", owner_id=2, raw_content="Content")
+        db_session.add_all([owned, other])
+        await db_session.commit()
+
+        mapping = await job_crud.get_public_ids(
+            db_session, ids=[owned.id, other.id, 99999], owner_id=1
+        )
+
+        assert mapping == {owned.id: owned.public_id}
+
+    async def test_get_public_ids_empty_list(self, db_session: AsyncSession):
+        """get_public_ids with no IDs should skip the query."""
+        assert await job_crud.get_public_ids(db_session, ids=[], owner_id=1) == {}
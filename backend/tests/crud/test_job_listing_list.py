@@ -0,0 +1,61 @@
+"""Tests for JobListingRepository.list pagination totals.
+
+The total is read from a ``COUNT(*) OVER ()`` window column on the page
+query instead of a separate ``SELECT COUNT(*)`` round trip.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.job_listing import job_listing_repository as job_listing
+from app.schemas.job_listing import ApifyJobListing, JobListingFilters
+
+
+async def _seed(db: AsyncSession, count: int) -> None:
+    await job_listing.batch_upsert_from_apify(
+        db,
+        jobs_data=[
+            ApifyJobListing(
+                id=f"ext-{i}",
+                title=f"Engineer {i}",
+                link=f"https://linkedin.com/jobs/view/ext-{i}",
+                companyName="Acme",
+                location="Austin, TX",
+                descriptionText="Job description body.",
+            )
+            for i in range(count)
+        ],
+    )
+    await db.commit()
+
+
+async def test_total_comes_from_window_column(db_session: AsyncSession):
+    await _seed(db_session, 5)
+
+    listings, total = await job_listing.list(
+        db_session, filters=JobListingFilters(limit=2, offset=0)
+    )
+
+    assert len(listings) == 2
+    assert total == 5
+
+
+async def test_total_past_last_page_falls_back_to_count(db_session: AsyncSession):
+    await _seed(db_session, 3)
+
+    listings, total = await job_listing.list(
+        db_session, filters=JobListingFilters(limit=2, offset=10)
+    )
+
+    assert listings == []
+    assert total == 3
+
+
+async def test_known_total_is_returned_verbatim(db_session: AsyncSession):
+    await _seed(db_session, 3)
+
+    listings, total = await job_listing.list(
+        db_session, filters=JobListingFilters(limit=2, offset=0), known_total=42
+    )
+
+    assert len(listings) == 2
+    assert total == 42
@@ -93,3 +93,38 @@ async def test_new_job_inserts(db_session: AsyncSession):
     )).scalar_one_or_none()
     assert row is not None
     assert row.company_name == "Novel Co"
+
+
+def test_copy_records_encode_jsonb_columns():
+    rows = [
+        {"external_job_id": "c-1", "job_type": ["Full-time"], "benefits": None},
+    ]
+
+    records = job_listing._to_copy_records(
+        rows, ["external_job_id", "job_type", "benefits"]
+    )
+
+    assert records == [("c-1", '["Full-time"]', None)]
+
+
+async def test_repeated_external_id_across_batches_is_written_once(
+    db_session: AsyncSession,
+):
+    created, updated, errors = await job_listing.batch_upsert_from_apify(
+        db_session,
+        jobs_data=[
+            _apify_job(ext_id="dup-1", title="First Title"),
+            _apify_job(ext_id="other-1", title="Other Role"),
+            _apify_job(ext_id="dup-1", title="Last Title"),
+        ],
+        batch_size=1,
+    )
+    await db_session.commit()
+
+    assert (created, updated, errors) == (2, 0, [])
+    title = (
+        await db_session.execute(
+            select(JobListing.job_title).where(JobListing.external_job_id == "dup-1")
+        )
+    ).scalar_one()
+    assert title == "Last Title"
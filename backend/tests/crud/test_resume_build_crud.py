@@ -8,6 +8,7 @@ compatible with SQLite. These tests require PostgreSQL to run correctly.
 """
 
 import os
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 import pytest
@@ -191,6 +192,28 @@ class TestResumeBuildCRUDOwnership:
         assert len(builds) == 1
         assert builds[0]["job_title"] == "User 1 Build"
 
+    async def test_list_with_count_totals_own_builds(self, db_session: AsyncSession):
+        """The windowed total counts every matching build, not just the page."""
+        db_session.add_all(
+            [
+                ResumeBuild(job_title=f"Build {i}", user_id=1, status="draft")
+                for i in range(3)
+            ]
+        )
+        await db_session.commit()
+
+        builds, total = await resume_build_repository.list_builds_with_count(
+            db_session, user_id=1, limit=2
+        )
+        assert len(builds) == 2
+        assert total == 3
+
+        builds, total = await resume_build_repository.list_builds_with_count(
+            db_session, user_id=1, limit=2, offset=10
+        )
+        assert builds == []
+        assert total == 3
+
     async def test_get_respects_ownership(
         self,
         db_session: AsyncSession,
@@ -238,6 +261,282 @@ class TestResumeBuildCRUDOwnership:
         assert deleted is True
 
 
+class TestResumeBuildCRUDListing:
+    """Test list ordering and keyset pagination."""
+
+    @pytest_asyncio.fixture
+    async def mixed_builds(self, db_session: AsyncSession):
+        """Create builds mixing never-edited, edited and tied timestamps."""
+        base = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        edited = base + timedelta(days=3)
+        specs = [
+            ("Never edited, older", base, None),
+            ("Never edited, newer", base + timedelta(hours=1), None),
+            ("Edited recently", base + timedelta(hours=2), edited),
+            ("Edited at the same time", base + timedelta(hours=3), edited),
+            ("Edited long ago", base + timedelta(hours=4), base + timedelta(days=1)),
+        ]
+        db_session.add_all(
+            ResumeBuild(
+                job_title=title,
+                user_id=1,
+                status="draft",
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            for title, created_at, updated_at in specs
+        )
+        await db_session.commit()
+
+    async def test_list_orders_by_updated_then_created(
+        self, db_session: AsyncSession, mixed_builds
+    ):
+        """Never-edited builds lead, then most recently updated, then newest."""
+        builds = await resume_build_repository.list_builds(db_session, user_id=1)
+
+        assert [b["job_title"] for b in builds] == [
+            "Never edited, newer",
+            "Never edited, older",
+            "Edited at the same time",
+            "Edited recently",
+            "Edited long ago",
+        ]
+
+    async def test_cursor_pages_follow_offset_order(
+        self, db_session: AsyncSession, mixed_builds
+    ):
+        """Paging with ``before`` visits every build once, in list order."""
+        expected = await resume_build_repository.list_builds(db_session, user_id=1)
+
+        paged = []
+        before = None
+        while True:
+            page = await resume_build_repository.list_builds(
+                db_session, user_id=1, limit=2, before=before
+            )
+            if not page:
+                break
+            paged.extend(page)
+            last = page[-1]
+            before = (
+                datetime.fromisoformat(last["updated_at"])
+                if last["updated_at"]
+                else None,
+                datetime.fromisoformat(last["created_at"]),
+                last["public_id"],
+            )
+
+        assert [b["public_id"] for b in paged] == [b["public_id"] for b in expected]
+
+
+class TestResumeBuildIdentityMapLookups:
+    """Test that lookups after resolve reuse the session identity map."""
+
+    async def test_get_after_resolve_emits_no_sql(self, db_session: AsyncSession):
+        """get/get_model for an already-loaded build should not re-SELECT it."""
+        from sqlalchemy import event
+
+        build = ResumeBuild(job_title="Loaded Build", user_id=1, status="draft")
+        db_session.add(build)
+        await db_session.commit()
+
+        model = await resume_build_repository.get_model_by_public_id(
+            db_session, public_id=build.public_id, user_id=1
+        )
+
+        statements: list[str] = []
+        sync_engine = db_session.bind.sync_engine
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _record)
+        try:
+            found = await resume_build_repository.get(
+                db_session, resume_build_id=model.id, user_id=1
+            )
+            denied = await resume_build_repository.get_model(
+                db_session, resume_build_id=model.id, user_id=2
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _record)
+
+        assert found is not None
+        assert denied is None
+        assert statements == []
+
+
+class TestResumeBuildPullBlocks:
+    """Test pulling Vault blocks into a resume build."""
+
+    async def test_pull_blocks_appends_only_new_ids_in_order(
+        self, db_session: AsyncSession
+    ):
+        """Already-pulled and repeated IDs are skipped; order is preserved."""
+        build = ResumeBuild(
+            job_title="Pull Build",
+            user_id=1,
+            status="in_progress",
+            pulled_block_ids=[3, 1],
+        )
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.pull_blocks(
+            db_session, resume_build_id=build.id, user_id=1, block_ids=[5, 1, 2, 5]
+        )
+
+        assert result["pulled_block_ids"] == [3, 1, 5, 2]
+
+    async def test_pull_blocks_moves_draft_to_in_progress(
+        self, db_session: AsyncSession
+    ):
+        """Pulling into a draft transitions it even when no IDs are new."""
+        build = ResumeBuild(
+            job_title="Draft Build", user_id=1, status="draft", pulled_block_ids=[1]
+        )
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.pull_blocks(
+            db_session, resume_build_id=build.id, user_id=1, block_ids=[1]
+        )
+
+        assert result["pulled_block_ids"] == [1]
+        assert result["status"] == "in_progress"
+
+
+class TestResumeBuildUpdateDetails:
+    """Test the single-statement basic field update."""
+
+    async def test_update_details_persists_and_refreshes_instance(
+        self, db_session: AsyncSession
+    ):
+        """Fields are written, and the identity-map instance matches the result."""
+        build = ResumeBuild(job_title="Old Title", user_id=1, status="draft")
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.update_details(
+            db_session,
+            resume_build_id=build.id,
+            user_id=1,
+            fields={"job_title": "New Title", "job_company": "Acme"},
+        )
+
+        assert result["job_title"] == "New Title"
+        assert result["job_company"] == "Acme"
+        assert result["updated_at"] is not None
+        assert build.job_title == "New Title"
+
+    async def test_update_details_wrong_user(self, db_session: AsyncSession):
+        """Another user's build is neither updated nor returned."""
+        build = ResumeBuild(job_title="Old Title", user_id=1, status="draft")
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.update_details(
+            db_session, resume_build_id=build.id, user_id=2, fields={"job_title": "New"}
+        )
+
+        assert result is None
+
+
+class TestResumeBuildPendingDiffs:
+    """Test the database-side pending_diffs append and removal."""
+
+    async def test_add_then_reject_pending_diffs(self, db_session: AsyncSession):
+        """Diffs are appended in order and rejected by index in Postgres."""
+        first = {"operation": "replace", "path": "/summary", "value": "A"}
+        second = {"operation": "replace", "path": "/summary", "value": "B"}
+        build = ResumeBuild(
+            job_title="Diff Build",
+            user_id=1,
+            status="in_progress",
+            pending_diffs=[first],
+        )
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.add_pending_diffs(
+            db_session, resume_build_id=build.id, user_id=1, diffs=[second]
+        )
+        assert result["pending_diffs"] == [first, second]
+
+        result = await resume_build_repository.reject_diff(
+            db_session, resume_build_id=build.id, user_id=1, diff_index=0
+        )
+        assert result["pending_diffs"] == [second]
+        # The identity-map instance is refreshed from RETURNING
+        assert build.pending_diffs == [second]
+
+    async def test_add_pending_diffs_wrong_user(self, db_session: AsyncSession):
+        """Another user's build is neither updated nor returned."""
+        build = ResumeBuild(job_title="Diff Build", user_id=1, status="draft")
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.add_pending_diffs(
+            db_session, resume_build_id=build.id, user_id=2, diffs=[]
+        )
+
+        assert result is None
+
+
+class TestResumeBuildUpdateSections:
+    """Test the database-side sections merge."""
+
+    async def test_update_sections_merges_and_removes_null_keys(
+        self, db_session: AsyncSession
+    ):
+        """New keys are merged, null keys removed, nested nulls kept."""
+        build = ResumeBuild(
+            job_title="Sections Build",
+            user_id=1,
+            status="draft",
+            sections={"summary": "Old", "skills": ["Python"], "projects": []},
+        )
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.update_sections(
+            db_session,
+            resume_build_id=build.id,
+            user_id=1,
+            sections={
+                "summary": "New",
+                "projects": None,
+                "experience": [{"title": "Engineer", "end_date": None}],
+            },
+        )
+
+        assert result["sections"] == {
+            "summary": "New",
+            "skills": ["Python"],
+            "experience": [{"title": "Engineer", "end_date": None}],
+        }
+        assert result["status"] == "in_progress"
+        # The identity-map instance is refreshed from RETURNING
+        assert build.sections == result["sections"]
+
+    async def test_update_sections_wrong_user(self, db_session: AsyncSession):
+        """Another user's build is neither updated nor returned."""
+        build = ResumeBuild(
+            job_title="Sections Build",
+            user_id=1,
+            status="draft",
+            sections={"summary": "Old"},
+        )
+        db_session.add(build)
+        await db_session.commit()
+
+        result = await resume_build_repository.update_sections(
+            db_session, resume_build_id=build.id, user_id=2, sections={"summary": "New"}
+        )
+
+        assert result is None
+
+
 class TestResumeBuildDataConversion:
     """Test that ResumeBuildData includes public_id."""
 
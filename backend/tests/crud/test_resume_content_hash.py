@@ -0,0 +1,56 @@
+"""
+Mongo Resume CRUD Tests: stored raw_content hash.
+
+The ATS cache is keyed by a hash of the resume's raw_content; the hash is
+stored on write so lookups don't have to load the content.
+"""
+
+from bson import ObjectId
+
+from app.crud.mongo.resume import resume_crud
+from app.models.mongo.resume import ResumeCreate, ResumeUpdate
+from app.services.core.cache import CacheService
+
+
+class TestResumeContentHash:
+    """Test raw_content_hash storage and lookup."""
+
+    async def test_create_stores_hash(self, mongo_db):
+        resume = await resume_crud.create(
+            mongo_db,
+            ResumeCreate(user_id=1, title="Resume", raw_content="Original text"),
+        )
+
+        assert resume.raw_content_hash == CacheService.hash_content("Original text")
+        assert await resume_crud.get_content_hash(mongo_db, str(resume.id)) == (
+            CacheService.hash_content("Original text")
+        )
+
+    async def test_update_refreshes_hash(self, mongo_db):
+        resume = await resume_crud.create(
+            mongo_db,
+            ResumeCreate(user_id=1, title="Resume", raw_content="Original text"),
+        )
+
+        await resume_crud.update(
+            mongo_db, str(resume.id), ResumeUpdate(raw_content="Edited text")
+        )
+
+        assert await resume_crud.get_content_hash(mongo_db, str(resume.id)) == (
+            CacheService.hash_content("Edited text")
+        )
+
+    async def test_legacy_resume_falls_back_to_raw_content(self, mongo_db):
+        result = await mongo_db["resumes"].insert_one(
+            {"user_id": 1, "title": "Legacy", "raw_content": "Legacy text"}
+        )
+
+        content_hash = await resume_crud.get_content_hash(
+            mongo_db, str(result.inserted_id)
+        )
+
+        assert content_hash == CacheService.hash_content("Legacy text")
+
+    async def test_missing_resume_returns_none(self, mongo_db):
+        assert await resume_crud.get_content_hash(mongo_db, str(ObjectId())) is None
+        assert await resume_crud.get_content_hash(mongo_db, "not-an-id") is None
@@ -8,6 +8,7 @@ from app.services.job.ats import KeywordMatch
 from app.services.job.ats.analyzers import (
     basic_keyword_extraction,
     count_keyword_frequency,
+    find_keywords_in_text,
     get_keyword_context,
 )
 
@@ -257,6 +258,33 @@ class TestCountKeywordFrequency:
         assert count == 1  # Only "Python", not "Pythonic"
 
 
+class TestFindKeywordsInText:
+    """Test whole-word keyword presence scanning."""
+
+    def test_matches_whole_words_case_insensitively(self):
+        """Should match single-word keywords on word boundaries only."""
+        text = "Pythonic code, AWS Lambda and go-to-market"
+
+        found = find_keywords_in_text(["Python", "aws", "Go", "Lambda"], text)
+
+        assert found == {"aws", "Go", "Lambda"}
+
+    def test_multi_word_and_punctuated_keywords(self):
+        """Should match multi-word and punctuated keywords like the regex rule."""
+        text = "Applied machine learning in C++ and C#"
+        keywords = ["Machine Learning", "C++", "C#", "deep learning"]
+
+        found = find_keywords_in_text(keywords, text)
+
+        assert found == {
+            keyword
+            for keyword in keywords
+            if count_keyword_frequency(keyword, text) > 0
+        }
+        assert "Machine Learning" in found
+        assert "deep learning" not in found
+
+
 class TestAnalyzeKeywordsDetailed:
     """Test detailed keyword analysis."""
 
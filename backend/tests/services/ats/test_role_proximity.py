@@ -430,3 +430,54 @@ class TestBasicTitleSimilarity:
         """Should handle empty titles."""
         assert role_analyzer._basic_title_similarity("", "") == 0.0
         assert role_analyzer._basic_title_similarity("engineer", "") == 0.0
+
+
+class TestTitleEmbeddingCache:
+    """Test Redis caching of title embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_embedding_call(self, role_analyzer):
+        """Should return the cached vector without calling the provider."""
+        embedding_service = AsyncMock()
+        embedding_service.model_name = "test-model"
+        cache = AsyncMock()
+        cache.get_embedding.return_value = [0.1, 0.2]
+
+        with patch("app.services.core.cache.get_cache_service", return_value=cache):
+            result = await role_analyzer._embed_title(embedding_service, "engineer")
+
+        assert result == [0.1, 0.2]
+        embedding_service.embed_for_similarity.assert_not_called()
+        cache.set_embedding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_embeds_and_stores(self, role_analyzer):
+        """Should embed on a miss and write the vector back to the cache."""
+        embedding_service = AsyncMock()
+        embedding_service.model_name = "test-model"
+        embedding_service.embed_for_similarity.return_value = [0.5, 0.5]
+        cache = AsyncMock()
+        cache.get_embedding.return_value = None
+
+        with patch("app.services.core.cache.get_cache_service", return_value=cache):
+            result = await role_analyzer._embed_title(embedding_service, "engineer")
+
+        assert result == [0.5, 0.5]
+        cache.set_embedding.assert_awaited_once_with(
+            "test-model", "SEMANTIC_SIMILARITY", "engineer", [0.5, 0.5]
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_error_falls_back_to_embedding(self, role_analyzer):
+        """Should still embed when Redis is unavailable."""
+        embedding_service = AsyncMock()
+        embedding_service.model_name = "test-model"
+        embedding_service.embed_for_similarity.return_value = [1.0]
+
+        with patch(
+            "app.services.core.cache.get_cache_service",
+            side_effect=ConnectionError("redis down"),
+        ):
+            result = await role_analyzer._embed_title(embedding_service, "engineer")
+
+        assert result == [1.0]
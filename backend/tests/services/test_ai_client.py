@@ -0,0 +1,35 @@
+"""Tests for provider JSON mode in the AI clients."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.ai.client import GeminiAIClient
+
+
+def _gemini_client() -> GeminiAIClient:
+    client = GeminiAIClient.__new__(GeminiAIClient)
+    client.model = "gemini-test"
+    client.client = MagicMock()
+    client.client.aio.models.generate_content = AsyncMock(
+        return_value=SimpleNamespace(text='["python"]', usage_metadata=None)
+    )
+    return client
+
+
+async def test_gemini_generate_json_constrains_decoding_to_json():
+    client = _gemini_client()
+
+    response = await client.generate_json_with_metrics("Extract keywords", "job")
+
+    config = client.client.aio.models.generate_content.call_args.kwargs["config"]
+    assert config.response_mime_type == "application/json"
+    assert response.content == '["python"]'
+
+
+async def test_gemini_generate_leaves_plain_text_unconstrained():
+    client = _gemini_client()
+
+    await client.generate("Write a summary", "resume")
+
+    config = client.client.aio.models.generate_content.call_args.kwargs["config"]
+    assert config.response_mime_type is None
@@ -0,0 +1,48 @@
+"""Tests for JSON Patch-style diff application."""
+
+from app.services.job.diff.operations import DiffOperations
+
+
+def test_apply_diffs_applies_in_order_without_mutating_input():
+    document = {
+        "summary": "Old",
+        "skills": ["Python"],
+        "experience": [{"title": "Dev"}],
+    }
+    diffs = [
+        {"operation": "replace", "path": "/summary", "value": "New"},
+        {"operation": "add", "path": "/skills/-", "value": "Go"},
+        {"operation": "add", "path": "/skills/0", "value": "Rust"},
+        {"operation": "replace", "path": "/experience/0/title", "value": "Lead"},
+        {"operation": "remove", "path": "/skills/1"},
+    ]
+
+    result = DiffOperations().apply_diffs(document, diffs)
+
+    assert result == {
+        "summary": "New",
+        "skills": ["Rust", "Go"],
+        "experience": [{"title": "Lead"}],
+    }
+    assert document == {
+        "summary": "Old",
+        "skills": ["Python"],
+        "experience": [{"title": "Dev"}],
+    }
+
+
+def test_apply_diffs_matches_sequential_apply_diff():
+    operations = DiffOperations()
+    document = {"skills": ["a", "b", "c"], "meta": {"k": 1}}
+    diffs = [
+        {"operation": "remove", "path": "/skills/0"},
+        {"operation": "add", "path": "/meta/v", "value": 2},
+        {"operation": "replace", "path": "/skills/9", "value": "ignored"},
+        {"operation": "replace", "path": "/missing/key", "value": "ignored"},
+    ]
+
+    sequential = document
+    for diff in diffs:
+        sequential = operations.apply_diff(sequential, diff)
+
+    assert operations.apply_diffs(document, diffs) == sequential
@@ -0,0 +1,128 @@
+"""Tests for batched document embedding and content-hash change detection."""
+
+import asyncio
+import hashlib
+
+import pytest
+
+from app.services.ai.embedding import BaseEmbeddingService, EmbeddingTaskType
+
+
+class _FakeEmbeddingService(BaseEmbeddingService):
+    """Embeds each text as [len(text)] and records batch calls."""
+
+    MAX_BATCH_SIZE = 2
+    MAX_BATCH_CONCURRENCY = 2
+
+    def __init__(self):
+        super().__init__(strip_pii=False)
+        self.batches: list[list[str]] = []
+        self.task_types: set[EmbeddingTaskType] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    dimensions = 1
+    provider_name = "fake"
+    model_name = "fake-embed"
+
+    async def _embed_impl(self, text, task_type, title=None):
+        raise AssertionError("batch embedding must not embed one text at a time")
+
+    async def _embed_impl_with_metrics(self, text, task_type, title=None):
+        raise AssertionError("batch embedding must not embed one text at a time")
+
+    async def _embed_batch_impl(self, texts, task_type):
+        self.task_types.add(task_type)
+        self.batches.append(texts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return [[float(len(text))] for text in texts], len(texts)
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_in_chunks_and_keeps_input_order():
+    service = _FakeEmbeddingService()
+    contents = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    embeddings = await service.embed_batch_documents(contents)
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert service.batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert service.max_in_flight <= service.MAX_BATCH_CONCURRENCY
+    assert service.task_types == {EmbeddingTaskType.RETRIEVAL_DOCUMENT}
+
+
+@pytest.mark.asyncio
+async def test_embed_many_packs_queries_into_batches():
+    service = _FakeEmbeddingService()
+
+    embeddings = await service.embed_many(["q1", "q22", "q333"], "RETRIEVAL_QUERY")
+
+    assert embeddings == [[2.0], [3.0], [4.0]]
+    assert service.batches == [["q1", "q22"], ["q333"]]
+    assert service.task_types == {EmbeddingTaskType.RETRIEVAL_QUERY}
+
+
+@pytest.mark.asyncio
+async def test_batch_with_metrics_prepends_titles_and_sums_tokens():
+    service = _FakeEmbeddingService()
+
+    response = await service.embed_batch_documents_with_metrics(
+        ["body", "text"], titles=["T", "U"]
+    )
+
+    assert service.batches == [["T\n\nbody", "U\n\ntext"]]
+    assert response.metrics.input_tokens == 2
+    assert response.provider == "fake"
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_mismatched_titles():
+    with pytest.raises(ValueError):
+        await _FakeEmbeddingService().embed_batch_documents(["a", "b"], titles=["T"])
+
+
+def test_content_hash_detects_changes_and_accepts_legacy_sha256():
+    service = _FakeEmbeddingService()
+    content_hash = service.compute_content_hash("resume text")
+    legacy_hash = hashlib.sha256(b"resume text").hexdigest()
+
+    assert len(content_hash) == 64
+    assert not service.check_needs_embedding("resume text", content_hash, [0.1])
+    assert not service.check_needs_embedding("resume text", legacy_hash, [0.1])
+    assert service.check_needs_embedding("edited text", content_hash, [0.1])
+
+
+_RESUME_TEXT = " ".join(
+    f"Built service {i} in Python with FastAPI and PostgreSQL for team {i % 7}."
+    for i in range(40)
+)
+
+
+def test_sim_signature_tolerates_minor_edits_only():
+    service = _FakeEmbeddingService()
+    signature = service.compute_sim_signature(_RESUME_TEXT)
+    typo_fixed = _RESUME_TEXT.replace("service 12 in", "service 12 inn", 1)
+    rewritten = "Led a data science team building Spark pipelines. " * 40
+
+    assert -(1 << 63) <= signature < 1 << 63
+    assert service.is_near_duplicate(
+        service.compute_sim_signature(typo_fixed), signature
+    )
+    assert not service.is_near_duplicate(
+        service.compute_sim_signature(rewritten), signature
+    )
+
+
+def test_check_needs_embedding_reuses_near_duplicate():
+    service = _FakeEmbeddingService()
+    content_hash = service.compute_content_hash(_RESUME_TEXT)
+    signature = service.compute_sim_signature(_RESUME_TEXT)
+    typo_fixed = _RESUME_TEXT.replace("service 12 in", "service 12 inn", 1)
+
+    assert service.check_needs_embedding(typo_fixed, content_hash, [0.1])
+    assert not service.check_needs_embedding(
+        typo_fixed, content_hash, [0.1], current_sim_signature=signature
+    )
@@ -1,6 +1,21 @@
 """Tests for the capped-denominator fit-score math (v3 + v4 hybrid)."""
 
-from app.services.fit_scoring.scorer import TOP_N, compute_raw_score
+import math
+from array import array
+
+import pytest
+
+from app.models.mongo.resume import ParsedContent
+from app.services.fit_scoring.resume_keywords import (
+    build_resume_embedding_text,
+    compute_resume_embedding_hash,
+)
+from app.services.fit_scoring.scorer import (
+    TOP_N,
+    _cosine,
+    compute_raw_score,
+    quantize_embedding,
+)
 
 
 def _score(*args, **kwargs) -> int:
@@ -62,6 +77,29 @@ def _unit(n: int, one_at: int = 0) -> list[float]:
     return v
 
 
+def test_cosine_matches_reference_and_guards_degenerate_vectors():
+    a = [0.3, -1.2, 2.5, 0.0]
+    b = [1.1, 0.4, -0.7, 2.0]
+    dot = sum(x * y for x, y in zip(a, b))
+    expected = dot / math.sqrt(sum(x * x for x in a) * sum(y * y for y in b))
+    assert _cosine(a, b) == pytest.approx(expected)
+    assert _cosine([0.0, 0.0], [1.0, 0.0]) == 0.0
+    assert _cosine([1.0], [1.0, 0.0]) == 0.0
+    assert _cosine([], []) == 0.0
+
+
+def test_quantized_embedding_round_trips_and_preserves_cosine():
+    v = [0.3, -1.2, 2.5, 0.0, 0.01]
+    q8, scale = quantize_embedding(v)
+    q = array("b", q8)
+
+    assert len(q8) == len(v)
+    assert max(map(abs, q)) == 127
+    assert [x * scale for x in q] == pytest.approx(v, abs=scale / 2)
+    assert _cosine(v, q) == pytest.approx(1.0, abs=1e-4)
+    assert quantize_embedding([0.0, 0.0]) == (bytes(2), 0.0)
+
+
 def test_hybrid_missing_embedding_falls_back_to_v3():
     # Resume embedding is None → v3 keyword-only score (same as without hybrid).
     job = {f"kw{i}" for i in range(20)}
@@ -268,3 +306,12 @@ def test_breakdown_keyword_lists_are_sorted():
 
     assert breakdown["keyword_matched"] == sorted(breakdown["keyword_matched"])
     assert breakdown["keyword_missing"] == sorted(breakdown["keyword_missing"])
+
+
+def test_embedding_hash_accepts_prebuilt_text():
+    parsed = ParsedContent(summary="Backend engineer", skills=["Python", "SQL"])
+    text = build_resume_embedding_text(parsed)
+
+    assert compute_resume_embedding_hash(parsed, text) == (
+        compute_resume_embedding_hash(parsed)
+    )
@@ -0,0 +1,85 @@
+"""Tests for job description embedding reuse in fit-scoring ingestion."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.ai.response import AIUsageMetrics, EmbeddingResponse
+from app.services.fit_scoring.ingest import (
+    _embed_description,
+    _prefetch_cached_embeddings,
+)
+
+
+def _embedding_service() -> MagicMock:
+    service = MagicMock()
+    service.model_name = "embed-model"
+    service._embed_with_metrics = AsyncMock(
+        return_value=EmbeddingResponse(
+            embedding=[0.1, 0.2],
+            metrics=AIUsageMetrics(
+                input_tokens=3, output_tokens=0, total_tokens=3, latency_ms=5
+            ),
+            provider="gemini",
+            model="embed-model",
+        )
+    )
+    return service
+
+
+async def test_prefetch_uses_one_batched_lookup():
+    service = _embedding_service()
+    cache = AsyncMock()
+    cache.get_embeddings.return_value = [[0.5, 0.5], None]
+
+    cached = await _prefetch_cached_embeddings(service, cache, ["a", "b"])
+
+    assert cached == [[0.5, 0.5], None]
+    cache.get_embeddings.assert_awaited_once_with(
+        "embed-model", "SEMANTIC_SIMILARITY", ["a", "b"]
+    )
+
+
+async def test_prefetch_treats_cache_errors_as_misses():
+    service = _embedding_service()
+    cache = AsyncMock()
+    cache.get_embeddings.side_effect = ConnectionError("redis down")
+
+    assert await _prefetch_cached_embeddings(service, cache, ["a", "b"]) == [
+        None,
+        None,
+    ]
+
+
+async def test_cache_hit_skips_provider_call():
+    service = _embedding_service()
+    cache = AsyncMock()
+
+    embedding, response = await _embed_description(
+        service, cache, "job text", [0.5, 0.5]
+    )
+
+    assert embedding == [0.5, 0.5]
+    assert response is None
+    service._embed_with_metrics.assert_not_called()
+
+
+async def test_cache_miss_embeds_and_backfills_cache():
+    service = _embedding_service()
+    cache = AsyncMock()
+
+    embedding, response = await _embed_description(service, cache, "job text")
+
+    assert embedding == [0.1, 0.2]
+    assert response is not None
+    cache.set_embedding.assert_awaited_once_with(
+        "embed-model", "SEMANTIC_SIMILARITY", "job text", [0.1, 0.2]
+    )
+
+
+async def test_cache_errors_fall_through_to_provider():
+    service = _embedding_service()
+    cache = AsyncMock()
+    cache.set_embedding.side_effect = ConnectionError("redis down")
+
+    embedding, _ = await _embed_description(service, cache, "job text")
+
+    assert embedding == [0.1, 0.2]
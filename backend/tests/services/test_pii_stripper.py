@@ -185,3 +185,15 @@ Senior Software Engineer at TechCorp
         result = stripper.strip(text)
         assert "[REDACTED]" in result
         assert "4111" not in result
+
+    def test_every_pattern_has_a_guard(self, stripper: PIIStripper):
+        """Guards should cover every pattern so none is scanned needlessly."""
+        assert set(stripper.PATTERN_GUARDS) == {
+            *stripper.PATTERNS,
+            *stripper.LABELED_PATTERNS,
+        }
+
+    def test_guards_skip_patterns_that_cannot_match(self, stripper: PIIStripper):
+        """Text without digits, '@', URLs or labels runs no PII pattern."""
+        assert stripper._candidate_patterns("Led a team of engineers") == set()
+        assert stripper._candidate_patterns("Call 555-123-4567") >= {"phone", "ssn"}
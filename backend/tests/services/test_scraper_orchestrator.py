@@ -14,7 +14,6 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.job_listing import job_listing_repository
-from app.models.job_listing import JobListing
 from app.schemas.job_listing import ApifyJobListing
 from app.schemas.scraper import ScraperConfig, ScraperRegion, ScraperRunResult
 from app.services.scraping.apify_client import ApifyClient
@@ -54,8 +53,8 @@ def sample_jobs():
             id="job-th-001",
             title="Software Engineer",
             companyName="Thai Tech",
-            jobUrl="https://linkedin.com/jobs/view/job-th-001",
-            description="Build amazing software in Thailand",
+            link="https://linkedin.com/jobs/view/job-th-001",
+            descriptionText="Build amazing software in Thailand",
             location="Bangkok, Thailand",
             country="Thailand",
             isRemote=False,
@@ -66,8 +65,8 @@ def sample_jobs():
             id="job-th-002",
             title="Data Analyst",
             companyName="Bangkok Data Co",
-            jobUrl="https://linkedin.com/jobs/view/job-th-002",
-            description="Analyze data for insights",
+            link="https://linkedin.com/jobs/view/job-th-002",
+            descriptionText="Analyze data for insights",
             location="Bangkok, Thailand",
             country="Thailand",
             isRemote=True,
@@ -123,8 +122,8 @@ class TestRunAllScrapers:
                     id=f"job-{config.region.value}-001",
                     title="Test Job",
                     companyName="Test Corp",
-                    jobUrl=f"https://linkedin.com/jobs/view/job-{config.region.value}-001",
-                    description="Test description",
+                    link=f"https://linkedin.com/jobs/view/job-{config.region.value}-001",
+                    descriptionText="Test description",
                     region=config.region.value,
                 )
             ]
@@ -134,7 +133,9 @@ class TestRunAllScrapers:
         mock_apify_client.run_actor = AsyncMock(side_effect=mock_run_actor)
 
         # Mock the database session and repository
-        with patch("app.services.scraper_orchestrator.AsyncSessionLocal") as mock_session_local:
+        with patch(
+            "app.services.scraping.orchestrator.AsyncSessionLocal"
+        ) as mock_session_local:
             mock_db = AsyncMock(spec=AsyncSession)
             mock_db.commit = AsyncMock()
             mock_db.rollback = AsyncMock()
@@ -145,11 +146,11 @@ class TestRunAllScrapers:
 
             with patch.object(
                 job_listing_repository,
-                "upsert_from_apify",
+                "batch_upsert_from_apify",
                 new_callable=AsyncMock,
             ) as mock_upsert:
-                # Return (listing, is_created=True) for each job
-                mock_upsert.return_value = (MagicMock(spec=JobListing), True)
+                # Each region's batch creates its single job
+                mock_upsert.return_value = (1, 0, [])
 
                 orchestrator = ScraperOrchestrator()
                 orchestrator.apify_client = mock_apify_client
@@ -182,8 +183,8 @@ class TestRunAllScrapers:
                         id="job-th-001",
                         title="Test Job",
                         companyName="Test Corp",
-                        jobUrl="https://linkedin.com/jobs/view/job-th-001",
-                        description="Test description",
+                        link="https://linkedin.com/jobs/view/job-th-001",
+                        descriptionText="Test description",
                         region="thailand",
                     )
                 ]
@@ -194,7 +195,9 @@ class TestRunAllScrapers:
 
         mock_apify_client.run_actor = AsyncMock(side_effect=mock_run_actor)
 
-        with patch("app.services.scraper_orchestrator.AsyncSessionLocal") as mock_session_local:
+        with patch(
+            "app.services.scraping.orchestrator.AsyncSessionLocal"
+        ) as mock_session_local:
             mock_db = AsyncMock(spec=AsyncSession)
             mock_db.commit = AsyncMock()
             mock_session_local.return_value.__aenter__ = AsyncMock(return_value=mock_db)
@@ -202,10 +205,10 @@ class TestRunAllScrapers:
 
             with patch.object(
                 job_listing_repository,
-                "upsert_from_apify",
+                "batch_upsert_from_apify",
                 new_callable=AsyncMock,
             ) as mock_upsert:
-                mock_upsert.return_value = (MagicMock(spec=JobListing), True)
+                mock_upsert.return_value = (1, 0, [])
 
                 orchestrator = ScraperOrchestrator()
                 orchestrator.apify_client = mock_apify_client
@@ -263,7 +266,7 @@ class TestRunAllScrapers:
         mock_apify_client.run_actor = AsyncMock(side_effect=mock_run_actor)
 
         with patch(
-            "app.services.scraper_orchestrator.SCRAPER_CONFIGS",
+            "app.services.scraping.orchestrator.SCRAPER_CONFIGS",
             [
                 ScraperConfig(
                     region=ScraperRegion.EUROPE,
@@ -294,8 +297,8 @@ class TestDatabasePersistence:
             id="persist-test-001",
             title="Database Test Job",
             companyName="Persist Corp",
-            jobUrl="https://linkedin.com/jobs/view/persist-test-001",
-            description="Testing database persistence",
+            link="https://linkedin.com/jobs/view/persist-test-001",
+            descriptionText="Testing database persistence",
             location="Singapore",
             country="Singapore",
             isRemote=False,
@@ -317,25 +320,21 @@ class TestDatabasePersistence:
             search_url="https://linkedin.com/jobs?geo=singapore",
         )
 
-        with patch("app.services.scraper_orchestrator.AsyncSessionLocal") as mock_session_local:
+        with patch(
+            "app.services.scraping.orchestrator.AsyncSessionLocal"
+        ) as mock_session_local:
             mock_db = AsyncMock(spec=AsyncSession)
             mock_db.commit = AsyncMock()
             mock_db.rollback = AsyncMock()
             mock_session_local.return_value.__aenter__ = AsyncMock(return_value=mock_db)
             mock_session_local.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            # Mock the repository to return (listing, is_created=True)
-            mock_listing = MagicMock(spec=JobListing)
-            mock_listing.job_title = "Database Test Job"
-            mock_listing.company_name = "Persist Corp"
-            mock_listing.region = "singapore"
-
             with patch.object(
                 job_listing_repository,
-                "upsert_from_apify",
+                "batch_upsert_from_apify",
                 new_callable=AsyncMock,
             ) as mock_upsert:
-                mock_upsert.return_value = (mock_listing, True)  # is_created=True
+                mock_upsert.return_value = (1, 0, [])  # created=1, updated=0
 
                 result = await orchestrator.run_single_scraper(config)
 
@@ -347,7 +346,9 @@ class TestDatabasePersistence:
                 # Verify repository was called with correct data
                 mock_upsert.assert_called_once()
                 call_args = mock_upsert.call_args
-                assert call_args[1]["job_data"].id == "persist-test-001"
+                assert [job.id for job in call_args[1]["jobs_data"]] == [
+                    "persist-test-001"
+                ]
                 assert call_args[1]["source_platform"] == "linkedin"
 
     @pytest.mark.asyncio
@@ -357,8 +358,8 @@ class TestDatabasePersistence:
             id="update-test-001",
             title="Original Title",
             companyName="Update Corp",
-            jobUrl="https://linkedin.com/jobs/view/update-test-001",
-            description="Original description",
+            link="https://linkedin.com/jobs/view/update-test-001",
+            descriptionText="Original description",
             region="thailand",
         )
 
@@ -377,25 +378,24 @@ class TestDatabasePersistence:
             search_url="https://linkedin.com/jobs?geo=thailand",
         )
 
-        with patch("app.services.scraper_orchestrator.AsyncSessionLocal") as mock_session_local:
+        with patch(
+            "app.services.scraping.orchestrator.AsyncSessionLocal"
+        ) as mock_session_local:
             mock_db = AsyncMock(spec=AsyncSession)
             mock_db.commit = AsyncMock()
             mock_db.rollback = AsyncMock()
             mock_session_local.return_value.__aenter__ = AsyncMock(return_value=mock_db)
             mock_session_local.return_value.__aexit__ = AsyncMock(return_value=None)
 
-            mock_listing = MagicMock(spec=JobListing)
-
             with patch.object(
                 job_listing_repository,
-                "upsert_from_apify",
+                "batch_upsert_from_apify",
                 new_callable=AsyncMock,
             ) as mock_upsert:
-                # First call returns is_created=True
-                # Second call returns is_created=False (update)
+                # First batch creates the job, second batch updates it
                 mock_upsert.side_effect = [
-                    (mock_listing, True),   # First run - created
-                    (mock_listing, False),  # Second run - updated
+                    (1, 0, []),  # First run - created
+                    (0, 1, []),  # Second run - updated
                 ]
 
                 # First run - should create
@@ -418,8 +418,8 @@ class TestDatabasePersistence:
             id="db-error-test-001",
             title="DB Error Test",
             companyName="Error Corp",
-            jobUrl="https://linkedin.com/jobs/view/db-error-test-001",
-            description="Testing database error handling",
+            link="https://linkedin.com/jobs/view/db-error-test-001",
+            descriptionText="Testing database error handling",
             region="thailand",
         )
 
@@ -428,7 +428,9 @@ class TestDatabasePersistence:
 
         mock_apify_client.run_actor = AsyncMock(side_effect=mock_run_actor)
 
-        with patch("app.services.scraper_orchestrator.AsyncSessionLocal") as mock_session_local:
+        with patch(
+            "app.services.scraping.orchestrator.AsyncSessionLocal"
+        ) as mock_session_local:
             mock_db = AsyncMock(spec=AsyncSession)
             mock_db.commit = AsyncMock(side_effect=Exception("Database connection lost"))
             mock_db.rollback = AsyncMock()
@@ -438,10 +440,10 @@ class TestDatabasePersistence:
 
             with patch.object(
                 job_listing_repository,
-                "upsert_from_apify",
+                "batch_upsert_from_apify",
                 new_callable=AsyncMock,
             ) as mock_upsert:
-                mock_upsert.return_value = (MagicMock(spec=JobListing), True)
+                mock_upsert.return_value = (1, 0, [])
 
                 orchestrator = ScraperOrchestrator()
                 orchestrator.apify_client = mock_apify_client
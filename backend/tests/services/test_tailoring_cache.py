@@ -0,0 +1,176 @@
+"""Unit tests for content-addressed tailoring / quick match caching."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.core.cache import CacheService
+from app.services.resume.tailor import TailoringService
+
+
+def _service(cache: AsyncMock) -> TailoringService:
+    ai_client = MagicMock()
+    ai_client.model_name = "test-model"
+    resume_parser = MagicMock()
+    resume_parser.get_content_hash.side_effect = lambda text: f"r-{text}"
+    resume_parser.parse = AsyncMock(return_value=({"skills": ["Python"]}, None))
+    job_analyzer = MagicMock()
+    job_analyzer.get_content_hash.side_effect = lambda text: f"j-{text}"
+    job_analyzer.analyze = AsyncMock(
+        return_value=({"keywords": ["python"], "skills": []}, None)
+    )
+    return TailoringService(ai_client, cache, resume_parser, job_analyzer)
+
+
+class TestTailoredCacheKey:
+    """Test the tailoring cache key."""
+
+    def test_key_ignores_focus_keyword_order_and_case(self):
+        cache = CacheService(AsyncMock())
+
+        assert cache._make_tailored_key("m", "r", "j", ["AWS", "python"]) == (
+            cache._make_tailored_key("m", "r", "j", ["Python", "aws"])
+        )
+
+    def test_key_distinguishes_model_and_default_focus(self):
+        cache = CacheService(AsyncMock())
+        base = cache._make_tailored_key("m", "r", "j", None)
+
+        assert base != cache._make_tailored_key("other", "r", "j", None)
+        assert base != cache._make_tailored_key("m", "r", "j", [])
+
+
+class TestTailorCache:
+    """Test TailoringService.tailor cache usage."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_generation(self):
+        cache = AsyncMock()
+        cache.get_tailored_result.return_value = {
+            "tailored_content": {},
+            "match_score": 80,
+        }
+        service = _service(cache)
+        service._generate_tailoring = AsyncMock()
+
+        result = await service.tailor(
+            resume_id="r1", job_id=1, raw_resume="resume", raw_job="job"
+        )
+
+        assert result["match_score"] == 80
+        assert "ai_metrics" not in result
+        service._generate_tailoring.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_result_without_metrics(self):
+        cache = AsyncMock()
+        cache.get_tailored_result.return_value = None
+        service = _service(cache)
+        service._generate_tailoring = AsyncMock(
+            return_value={"tailored_content": {}, "ai_metrics": object()}
+        )
+
+        result = await service.tailor(
+            resume_id="r1",
+            job_id=1,
+            raw_resume="resume",
+            raw_job="job",
+            focus_keywords=["Python"],
+        )
+
+        assert "ai_metrics" in result
+        cache.set_tailored_result.assert_awaited_once_with(
+            "test-model", "r-resume", "j-job", ["Python"], {"tailored_content": {}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_reuses_original_parsed(self):
+        cache = AsyncMock()
+        cache.get_tailored_result.return_value = None
+        cache.hash_content = MagicMock(return_value="r-parsed")
+        service = _service(cache)
+        service._generate_tailoring = AsyncMock(return_value={"tailored_content": {}})
+        original = {"skills": ["Go"]}
+
+        await service.tailor(
+            resume_id="r1",
+            job_id=1,
+            raw_resume="resume",
+            raw_job="job",
+            original_parsed=original,
+        )
+
+        service.resume_parser.parse.assert_not_called()
+        service.job_analyzer.analyze.assert_awaited_once_with("job")
+        assert service._generate_tailoring.call_args.args[0] is original
+
+
+class TestQuickMatchCache:
+    """Test TailoringService.get_quick_match_score cache usage."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_parsing(self):
+        cache = AsyncMock()
+        cache.get_quick_match.return_value = {"match_score": 70}
+        service = _service(cache)
+
+        result = await service.get_quick_match_score(raw_resume="resume", raw_job="job")
+
+        assert result == {"match_score": 70}
+        service.resume_parser.parse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_computes_and_stores(self):
+        cache = AsyncMock()
+        cache.get_quick_match.return_value = None
+        service = _service(cache)
+
+        result = await service.get_quick_match_score(raw_resume="resume", raw_job="job")
+
+        assert result["keyword_coverage"] == 1.0
+        cache.set_quick_match.assert_awaited_once_with(
+            "test-model", "r-resume", "j-job", result
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_parses_resume_and_job_concurrently(self):
+        cache = AsyncMock()
+        cache.get_quick_match.return_value = None
+        service = _service(cache)
+        job_started = asyncio.Event()
+
+        async def parse_resume(*args, **kwargs):
+            # Only completes if job analysis is already in flight
+            await asyncio.wait_for(job_started.wait(), timeout=1)
+            return {"skills": ["Python"]}, None
+
+        async def analyze_job(*args, **kwargs):
+            job_started.set()
+            return {"keywords": ["python"], "skills": []}, None
+
+        service.resume_parser.parse = parse_resume
+        service.job_analyzer.analyze = analyze_job
+
+        result = await service.get_quick_match_score(raw_resume="resume", raw_job="job")
+
+        assert result["keyword_coverage"] == 1.0
+
+
+class TestCacheSerialization:
+    """Test cached payloads round-trip through the JSON encoding."""
+
+    @pytest.mark.asyncio
+    async def test_tailored_result_round_trips(self):
+        store: dict[str, str] = {}
+        redis = AsyncMock()
+        redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(
+            key, value.decode()
+        )
+        redis.get.side_effect = lambda key: store.get(key)
+        cache = CacheService(redis)
+        result = {"tailored_content": {"skills": ["Python"]}, "match_score": 81.5}
+
+        await cache.set_tailored_result("m", "r", "j", None, result)
+
+        assert await cache.get_tailored_result("m", "r", "j") == result
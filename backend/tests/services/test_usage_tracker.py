@@ -0,0 +1,53 @@
+"""Tests for AI usage logging with in-INSERT pricing."""
+
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ai_pricing_config import AIPricingConfig
+from app.services.ai.usage_tracker import AIUsageTracker
+
+
+async def test_log_generation_prices_usage_in_insert(db_session: AsyncSession):
+    db_session.add(
+        AIPricingConfig(
+            provider="openai",
+            model="gpt-test",
+            input_cost_per_1k=Decimal("0.5"),
+            output_cost_per_1k=Decimal("1.5"),
+        )
+    )
+    await db_session.flush()
+
+    log = await AIUsageTracker().log_generation(
+        db_session,
+        user_id=1,
+        endpoint="/api/tailor",
+        response={
+            "provider": "openai",
+            "model": "gpt-test",
+            "metrics": {
+                "input_tokens": 2000,
+                "output_tokens": 1000,
+                "total_tokens": 3000,
+                "latency_ms": 120,
+            },
+        },
+    )
+
+    assert log.id is not None
+    assert log.cost_usd == Decimal("2.5")
+
+
+async def test_log_embedding_without_pricing_costs_zero(db_session: AsyncSession):
+    log = await AIUsageTracker().log_embedding_raw(
+        db_session,
+        user_id=None,
+        endpoint="/api/embed",
+        provider="openai",
+        model="unpriced-model",
+        total_tokens=500,
+        latency_ms=30,
+    )
+
+    assert log.cost_usd == 0
@@ -0,0 +1,47 @@
+"""Unit tests for the request body size limit middleware."""
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.body_size_limit import BodySizeLimitMiddleware
+
+
+def _client(max_body_bytes: int) -> AsyncClient:
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request) -> dict:
+        return {"size": len(await request.body())}
+
+    app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=max_body_bytes)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_body_within_limit_passes_through():
+    async with _client(16) as client:
+        response = await client.post("/echo", content=b"x" * 16)
+
+    assert response.status_code == 200
+    assert response.json() == {"size": 16}
+
+
+@pytest.mark.asyncio
+async def test_declared_length_over_limit_is_rejected():
+    async with _client(16) as client:
+        response = await client.post("/echo", content=b"x" * 17)
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_over_limit_is_rejected():
+    async def chunks():
+        for _ in range(4):
+            yield b"x" * 8
+
+    async with _client(16) as client:
+        response = await client.post("/echo", content=chunks())
+
+    assert response.status_code == 413
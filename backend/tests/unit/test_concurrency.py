@@ -0,0 +1,36 @@
+"""Unit tests for concurrency helpers."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.concurrency import gather_or_cancel
+
+
+async def test_returns_results_in_argument_order():
+    async def value(v, delay):
+        await asyncio.sleep(delay)
+        return v
+
+    assert await gather_or_cancel(value("a", 0.02), value("b", 0)) == ["a", "b"]
+
+
+async def test_failure_cancels_siblings_and_propagates_unwrapped():
+    sibling_cancelled = asyncio.Event()
+
+    async def slow_lookup():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            sibling_cancelled.set()
+            raise
+
+    async def failing_lookup():
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await gather_or_cancel(slow_lookup(), failing_lookup())
+
+    assert exc_info.value.status_code == 404
+    assert sibling_cancelled.is_set()
@@ -0,0 +1,39 @@
+"""Unit tests for building job listing responses from ORM rows."""
+
+from datetime import datetime, timezone
+
+from app.api.routes.job_listings import _build_listing_response
+from app.models.job_listing import JobListing
+
+
+def _listing(**overrides) -> JobListing:
+    fields = {
+        "id": 1,
+        "external_job_id": "ext-1",
+        "job_title": "Engineer",
+        "company_name": "Acme",
+        "job_description": "Build things.",
+        "job_url": "https://jobs.example.com/1",
+        "is_remote": False,
+        "easy_apply": False,
+        "is_active": True,
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+    fields.update(overrides)
+    return JobListing(**fields)
+
+
+def test_empty_url_fields_become_none():
+    response = _build_listing_response(
+        _listing(company_logo="", company_website="", apply_url="")
+    )
+
+    assert response.company_logo is None
+    assert response.company_website is None
+    assert response.apply_url is None
+
+
+def test_url_fields_are_normalized_like_validation():
+    response = _build_listing_response(_listing(company_website="https://acme.com"))
+
+    assert response.company_website == "https://acme.com/"
@@ -0,0 +1,48 @@
+"""Unit tests for pre-rendered JSON responses."""
+
+import json
+from datetime import datetime, timezone
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.api.utils.responses import json_response
+
+
+class _Item(BaseModel):
+    name: str
+    created_at: datetime
+
+
+def _item(name: str) -> _Item:
+    return _Item(name=name, created_at=datetime(2026, 10, 16, tzinfo=timezone.utc))
+
+
+def test_single_model_matches_model_dump():
+    item = _item("a")
+
+    rendered = json_response(item, status_code=201)
+
+    assert rendered.status_code == 201
+    assert rendered.media_type == "application/json"
+    assert json.loads(rendered.body) == item.model_dump(mode="json")
+
+
+def test_list_of_models_renders_json_array():
+    items = [_item("a"), _item("b")]
+
+    rendered = json_response(items)
+
+    assert json.loads(rendered.body) == [i.model_dump(mode="json") for i in items]
+    assert json.loads(json_response([]).body) == []
+
+
+def test_injected_response_headers_are_carried_over():
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.headers["Deprecation"] = "true"
+
+    rendered = json_response(_item("a"), injected)
+
+    assert rendered.headers["deprecation"] == "true"
+    assert rendered.headers["content-length"] == str(len(rendered.body))
@@ -0,0 +1,66 @@
+"""Unit tests for the job listing not-found cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes import job_listings
+from app.api.routes.job_listings import _get_listing_or_404
+
+
+@pytest.fixture(autouse=True)
+def _clear_missing_listings():
+    job_listings._missing_listings.clear()
+    yield
+    job_listings._missing_listings.clear()
+
+
+def _repository_get(return_value):
+    return patch.object(
+        job_listings.job_listing_repository,
+        "get",
+        AsyncMock(return_value=return_value),
+    )
+
+
+async def test_found_listing_is_returned_and_not_cached():
+    listing = MagicMock()
+
+    with _repository_get(listing) as get:
+        assert await _get_listing_or_404(MagicMock(), 7) is listing
+
+    get.assert_awaited_once()
+    assert 7 not in job_listings._missing_listings
+
+
+async def test_miss_queries_database_and_is_remembered():
+    with _repository_get(None) as get:
+        with pytest.raises(HTTPException) as exc_info:
+            await _get_listing_or_404(MagicMock(), 7)
+
+    assert exc_info.value.status_code == 404
+    get.assert_awaited_once()
+    assert 7 in job_listings._missing_listings
+
+
+async def test_cached_miss_skips_database():
+    with _repository_get(None) as get:
+        with pytest.raises(HTTPException):
+            await _get_listing_or_404(MagicMock(), 7)
+        with pytest.raises(HTTPException) as exc_info:
+            await _get_listing_or_404(MagicMock(), 7)
+
+    assert exc_info.value.status_code == 404
+    get.assert_awaited_once()
+
+
+async def test_expired_miss_is_invalidated_and_rechecked():
+    job_listings._missing_listings[7] = 0.0
+    listing = MagicMock()
+
+    with _repository_get(listing) as get:
+        assert await _get_listing_or_404(MagicMock(), 7) is listing
+
+    get.assert_awaited_once()
+    assert 7 not in job_listings._missing_listings
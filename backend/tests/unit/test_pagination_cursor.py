@@ -0,0 +1,43 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.api.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_preserves_microseconds():
+    updated_at = datetime(2026, 10, 16, 11, 0, 0, 654321, tzinfo=timezone.utc)
+    created_at = datetime(2026, 10, 16, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    public_id = uuid4()
+
+    cursor = encode_cursor(updated_at, created_at, public_id)
+
+    assert decode_cursor(cursor) == (updated_at, created_at, public_id)
+
+
+def test_cursor_round_trip_keeps_null_updated_at():
+    created_at = datetime(2026, 10, 16, 9, 30, 15, tzinfo=timezone.utc)
+    public_id = uuid4()
+
+    cursor = encode_cursor(None, created_at, public_id)
+
+    assert decode_cursor(cursor) == (None, created_at, public_id)
+
+
+def test_cursor_does_not_contain_plain_values():
+    public_id = uuid4()
+    cursor = encode_cursor(None, datetime.now(timezone.utc), public_id)
+
+    assert str(public_id) not in cursor
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["", "not-base64!", "Zm9v", "MjAyNi0xMC0xNnxub3QtYS11dWlk", "fDIwMjYtMTAtMTZ8eA=="],
+)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,39 @@
+"""Unit tests for bcrypt password hashing."""
+
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+
+# Hash of "correct horse" created by the previous passlib CryptContext
+PASSLIB_HASH = "$2b$04$4YZASyAzYH4qubMa8d7BY.u8K1G0IJ8jn2niP/VdMexQitMchzeYm"
+
+
+def test_hash_round_trips():
+    hashed = get_password_hash("s3cret")
+
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("s3cret!", hashed)
+
+
+def test_verifies_existing_passlib_hashes():
+    assert verify_password("correct horse", PASSLIB_HASH)
+    assert not verify_password("wrong horse", PASSLIB_HASH)
+
+
+def test_passwords_longer_than_72_bytes_are_truncated():
+    hashed = get_password_hash("x" * 100)
+
+    assert verify_password("x" * 72, hashed)
+
+
+def test_malformed_hash_does_not_verify():
+    assert not verify_password("s3cret", "not-a-bcrypt-hash")
+
+
+async def test_async_variants_round_trip():
+    hashed = await get_password_hash_async("s3cret")
+
+    assert await verify_password_async("s3cret", hashed)
@@ -0,0 +1,42 @@
+"""Unit tests for the tailoring service factory."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api.routes import tailor
+from app.api.routes.tailor import get_tailoring_service
+
+
+@pytest.fixture(autouse=True)
+def _clear_wiring_cache():
+    tailor._wire_tailoring_service.cache_clear()
+    yield
+    tailor._wire_tailoring_service.cache_clear()
+
+
+def test_reuses_wiring_for_same_client_and_cache(monkeypatch):
+    cache = MagicMock()
+    monkeypatch.setattr(tailor, "get_cache_service", lambda: cache)
+    client = MagicMock()
+
+    first = get_tailoring_service(ai_client=client)
+
+    assert get_tailoring_service(ai_client=client) is first
+    assert first.cache is cache
+    assert first.resume_parser.cache is cache
+    assert first.job_analyzer.cache is cache
+
+
+def test_resolves_cache_service_on_every_call(monkeypatch):
+    client = MagicMock()
+    old_cache, new_cache = MagicMock(), MagicMock()
+
+    monkeypatch.setattr(tailor, "get_cache_service", lambda: old_cache)
+    old_service = get_tailoring_service(ai_client=client)
+    monkeypatch.setattr(tailor, "get_cache_service", lambda: new_cache)
+    new_service = get_tailoring_service(ai_client=client)
+
+    assert new_service is not old_service
+    assert new_service.cache is new_cache
+    assert new_service.resume_parser.cache is new_cache
@@ -0,0 +1,53 @@
+"""Unit tests for the decoded JWT cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+
+def test_repeated_decode_verifies_once():
+    token = create_access_token(42)
+
+    with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as decode:
+        first = decode_token(token)
+        second = decode_token(token)
+
+    assert first == second
+    assert first["sub"] == "42"
+    decode.assert_called_once()
+
+
+def test_cached_payload_is_a_copy():
+    token = create_access_token(42)
+
+    decode_token(token)["sub"] = "tampered"
+
+    assert decode_token(token)["sub"] == "42"
+
+
+def test_expired_entry_is_verified_again():
+    token = create_access_token(42)
+    decode_token(token)
+    key = next(iter(security._token_cache))
+    _, payload = security._token_cache[key]
+    security._token_cache[key] = (0.0, payload)
+
+    with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as decode:
+        assert decode_token(token)["sub"] == "42"
+
+    decode.assert_called_once()
+
+
+def test_invalid_token_is_not_cached():
+    assert decode_token("not.a.jwt") is None
+    assert not security._token_cache